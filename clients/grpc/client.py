@@ -1,3 +1,6 @@
+import copy
+from typing import Self
+
 import grpc.experimental.gevent as grpc_gevent
 
 from grpc import Channel
@@ -5,6 +8,24 @@ from grpc import Channel
 grpc_gevent.init_gevent()
 
 
+class GRPCFutureStub:
+    """
+    Обёртка над gRPC-стабом, которая вызывает методы в неблокирующем стиле .future().
+
+    stub.CreateUser(request) ждёт ответа, а обёртка для того же вызова сразу возвращает grpc.Future,
+    поэтому один поток может держать в полёте много запросов на одном канале.
+    """
+
+    def __init__(self, stub):
+        """
+        :param stub: Сгенерированный gRPC-стаб.
+        """
+        self.stub = stub
+
+    def __getattr__(self, name: str):
+        return getattr(self.stub, name).future
+
+
 class GRPCClient:
     """
     Базовый класс gRPC-клиента.
@@ -21,3 +42,16 @@ class GRPCClient:
                         Обычно создаётся один раз и переиспользуется.
         """
         self.channel = channel
+
+    def as_futures(self) -> Self:
+        """
+        Возвращает копию клиента на том же канале, все методы которой вместо ответа возвращают grpc.Future.
+
+        Запросы по-прежнему собираются высокоуровневыми методами клиента (с фейковыми данными и т.д.),
+        меняется только способ вызова стаба (см. GRPCFutureStub).
+
+        :return: Клиент того же типа, методы которого возвращают grpc.Future.
+        """
+        client = copy.copy(self)
+        client.stub = GRPCFutureStub(self.stub)
+        return client
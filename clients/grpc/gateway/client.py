@@ -2,6 +2,12 @@ from grpc import Channel, insecure_channel, intercept_channel
 from locust.env import Environment
 
 from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.pool import GRPCChannelPool, GRPCChannelPoolConfig, GRPC_LOCAL_SUBCHANNEL_POOL_OPTION
+from clients.grpc.processing import ProcessingChannel
+from tools.locust.processing import client_processing
+from tools.locust.saturation import get_locust_saturation_monitor
+
+GATEWAY_GRPC_ADDRESS = "localhost:9003"
 
 
 def build_gateway_grpc_client() -> Channel:
@@ -10,20 +16,65 @@ def build_gateway_grpc_client() -> Channel:
 
     :return: gRPC-канал (Channel), настроенный на адрес localhost:9003.
     """
-    return insecure_channel("localhost:9003")
+    return insecure_channel(GATEWAY_GRPC_ADDRESS)
+
+
+def setup_gateway_locust_grpc_pool(
+        environment: Environment,
+        config: GRPCChannelPoolConfig | None = None
+) -> GRPCChannelPool:
+    """
+    Создаёт общий пул gRPC-каналов grpc-gateway для процесса Locust (environment.gateway_grpc_pool).
+
+    Вызывается из хука events.init сценария, если нужны нестандартные размер или стратегия пула;
+    иначе пул с настройками по умолчанию создаётся при первом обращении (см. build_gateway_locust_grpc_client).
+    Если пул уже был создан, его каналы закрываются.
+    Загрузка пула (вызовы в полёте, оценка локальной очереди, активные и простаивающие каналы)
+    снимается монитором насыщения (см. get_locust_saturation_monitor), как и время обработки вызовов
+    на стороне клиента: сериализации запросов и разбора ответов (см. ProcessingChannel).
+
+    :param environment: Среда выполнения Locust.
+    :param config: Настройки пула (по умолчанию — один канал на процесс).
+    :return: Пул gRPC-каналов.
+    """
+    locust_interceptor = LocustInterceptor(environment=environment)
+
+    def build_channel() -> Channel:
+        channel = insecure_channel(GATEWAY_GRPC_ADDRESS, options=[GRPC_LOCAL_SUBCHANNEL_POOL_OPTION])
+        return ProcessingChannel(intercept_channel(channel, locust_interceptor))
+
+    previous: GRPCChannelPool | None = getattr(environment, "gateway_grpc_pool", None)
+    if previous is not None:
+        previous.close()
+
+    environment.gateway_grpc_pool = GRPCChannelPool(config or GRPCChannelPoolConfig(), build_channel=build_channel)
+    # Пул может пересоздаваться между запусками теста: новый пул заменяет прежний в мониторе насыщения
+    get_locust_saturation_monitor(environment).register("gRPC channel pool", environment.gateway_grpc_pool)
+    client_processing.attach(environment)
+    return environment.gateway_grpc_pool
+
+
+def get_gateway_locust_grpc_pool(environment: Environment) -> GRPCChannelPool:
+    """
+    Возвращает общий пул gRPC-каналов grpc-gateway, создавая его с настройками по умолчанию при необходимости.
+
+    :param environment: Среда выполнения Locust.
+    :return: Пул gRPC-каналов.
+    """
+    pool: GRPCChannelPool | None = getattr(environment, "gateway_grpc_pool", None)
+    return pool if pool is not None else setup_gateway_locust_grpc_pool(environment)
 
 
 def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     """
-    Фабричная функция для создания gRPC-канала, адаптированного для Locust.
+    Фабричная функция для получения gRPC-канала, адаптированного для Locust.
     В канал автоматически встраивается интерцептор LocustInterceptor,
     который регистрирует вызовы в системе метрик Locust.
 
+    Канал назначается из общего пула (см. setup_gateway_locust_grpc_pool), поэтому стабы разных клиентов
+    и разных виртуальных пользователей мультиплексируются через ограниченное количество соединений.
+
     :param environment: Среда выполнения Locust (необходима для отправки событий).
     :return: gRPC-канал с интерцептором, пригодный для нагрузочного тестирования.
     """
-    locust_interceptor = LocustInterceptor(environment=environment)
-
-    channel = insecure_channel("localhost:9003")
-
-    return intercept_channel(channel, locust_interceptor)
+    return get_gateway_locust_grpc_pool(environment).get_channel()
@@ -1,62 +1,65 @@
+from functools import cached_property
+
+from grpc import Channel
 from locust import TaskSet, SequentialTaskSet
 
-from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient, build_accounts_gateway_locust_grpc_client
-from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient, build_cards_gateway_locust_grpc_client
-from clients.grpc.gateway.documents.client import (
-    DocumentsGatewayGRPCClient,
-    build_documents_gateway_locust_grpc_client
-)
-from clients.grpc.gateway.operations.client import (
-    OperationsGatewayGRPCClient,
-    build_operations_gateway_locust_grpc_client
-)
-from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient
+from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient
+from clients.grpc.gateway.client import build_gateway_locust_grpc_client
+from clients.grpc.gateway.documents.client import DocumentsGatewayGRPCClient
+from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient
 
 
-class GatewayGRPCTaskSet(TaskSet):
+class GatewayGRPCClientsMixin:
     """
-    Базовый TaskSet для gRPC-сценариев, работающих с grpc-gateway.
+    API клиенты grpc-gateway для TaskSet.
 
-    Здесь создаются все необходимые API клиенты, которые будут доступны в последующих задачах (task).
-    Используется, если порядок выполнения задач внутри таск-сета не имеет значения.
+    Стабы всех клиентов виртуального пользователя мультиплексируются через один канал из общего пула
+    (см. setup_gateway_locust_grpc_pool), а сами клиенты создаются лениво — при первом обращении.
     """
-    users_gateway_client: UsersGatewayGRPCClient
-    cards_gateway_client: CardsGatewayGRPCClient
-    accounts_gateway_client: AccountsGatewayGRPCClient
-    documents_gateway_client: DocumentsGatewayGRPCClient
-    operations_gateway_client: OperationsGatewayGRPCClient
 
-    def on_start(self) -> None:
+    @cached_property
+    def grpc_channel(self) -> Channel:
         """
-        Метод вызывается перед запуском задач TaskSet.
-        Здесь создаются API клиенты с использованием контекста окружения Locust.
+        gRPC-канал, назначенный виртуальному пользователю пулом.
         """
-        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+        return build_gateway_locust_grpc_client(self.user.environment)
+
+    @cached_property
+    def users_gateway_client(self) -> UsersGatewayGRPCClient:
+        return UsersGatewayGRPCClient(channel=self.grpc_channel)
+
+    @cached_property
+    def cards_gateway_client(self) -> CardsGatewayGRPCClient:
+        return CardsGatewayGRPCClient(channel=self.grpc_channel)
+
+    @cached_property
+    def accounts_gateway_client(self) -> AccountsGatewayGRPCClient:
+        return AccountsGatewayGRPCClient(channel=self.grpc_channel)
+
+    @cached_property
+    def documents_gateway_client(self) -> DocumentsGatewayGRPCClient:
+        return DocumentsGatewayGRPCClient(channel=self.grpc_channel)
+
+    @cached_property
+    def operations_gateway_client(self) -> OperationsGatewayGRPCClient:
+        return OperationsGatewayGRPCClient(channel=self.grpc_channel)
+
 
+class GatewayGRPCTaskSet(GatewayGRPCClientsMixin, TaskSet):
+    """
+    Базовый TaskSet для gRPC-сценариев, работающих с grpc-gateway.
 
-class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
+    Здесь доступны все необходимые API клиенты, которые используются в задачах (task).
+    Используется, если порядок выполнения задач внутри таск-сета не имеет значения.
+    """
+
+
+class GatewayGRPCSequentialTaskSet(GatewayGRPCClientsMixin, SequentialTaskSet):
     """
     Базовый SequentialTaskSet для gRPC-сценариев, где важен порядок выполнения задач.
 
     Задачи внутри такого таск-сета будут выполняться строго по очереди — сверху вниз.
-    Также здесь инициализируются те же API клиенты, что и в обычном TaskSet.
+    Также здесь доступны те же API клиенты, что и в обычном TaskSet.
     """
-    users_gateway_client: UsersGatewayGRPCClient
-    cards_gateway_client: CardsGatewayGRPCClient
-    accounts_gateway_client: AccountsGatewayGRPCClient
-    documents_gateway_client: DocumentsGatewayGRPCClient
-    operations_gateway_client: OperationsGatewayGRPCClient
-
-    def on_start(self) -> None:
-        """
-        Создание API клиентов для последовательного сценария.
-        """
-        self.users_gateway_client = build_users_gateway_locust_grpc_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_grpc_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
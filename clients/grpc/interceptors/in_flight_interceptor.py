@@ -0,0 +1,49 @@
+import threading
+
+from grpc import UnaryUnaryClientInterceptor
+
+
+class InFlightInterceptor(UnaryUnaryClientInterceptor):
+    """
+    gRPC-интерцептор, который считает незавершённые вызовы канала.
+
+    Каждый вызов занимает HTTP/2-поток соединения; вызовы сверх SETTINGS_MAX_CONCURRENT_STREAMS сервиса
+    grpc-core держит в локальной очереди, пока не освободится поток. Сама очередь из Python не видна,
+    поэтому по количеству вызовов в полёте оценивается её глубина (см. GRPCChannelPool.get_usage).
+
+    Вызов завершается в колбэке, который grpc выполняет в своих потоках, поэтому счётчик меняется под блокировкой.
+    """
+
+    def __init__(self):
+        self.in_flight = 0
+
+        self._lock = threading.Lock()
+
+    def add(self, delta: int) -> None:
+        """
+        :param delta: На сколько изменить количество вызовов в полёте.
+        """
+        with self._lock:
+            self.in_flight += delta
+
+    def on_done(self, future) -> None:
+        self.add(-1)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-unary gRPC вызовов.
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: gRPC response (future объект).
+        """
+        self.add(1)
+        try:
+            response = continuation(client_call_details, request)
+        except BaseException:
+            self.add(-1)
+            raise
+
+        response.add_done_callback(self.on_done)
+        return response
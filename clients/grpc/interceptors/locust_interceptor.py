@@ -3,11 +3,16 @@ import time
 from grpc import RpcError, UnaryUnaryClientInterceptor
 from locust.env import Environment
 
+from tools.locust.cohort import locust_cohort, get_locust_request_name
+
 
 class LocustInterceptor(UnaryUnaryClientInterceptor):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
+    Вызовы внутри use_locust_cohort попадают в статистику с меткой когорты в имени.
+    Интерцептор не ждёт ответа: метрики отправляются колбэком по завершении вызова.
+    Длина ответа берётся из ByteSize() уже разобранного ответа.
     """
 
     def __init__(self, environment: Environment):
@@ -25,26 +30,29 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         :param request: Объект запроса, отправляемый на сервер.
         :return: gRPC response (future объект).
         """
-        response = None
-        exception: RpcError | None = None
+        name = get_locust_request_name(client_call_details.method)
+        context = {"cohort": locust_cohort.get()}
         start_time = time.perf_counter()
-        response_length = 0
-
-        try:
-            response = continuation(client_call_details, request)
-
-            response_length = response.result().ByteSize()
-        except RpcError as error:
-            exception = error
-
-        self.environment.events.request.fire(
-            name=client_call_details.method,
-            context=None,
-            response=response,
-            exception=exception,
-            request_type="gRPC",
-            response_time=(time.perf_counter() - start_time) * 1000,
-            response_length=response_length,
-        )
+
+        def on_done(future) -> None:
+            response_time = (time.perf_counter() - start_time) * 1000
+            exception: RpcError | None = future.exception()
+
+            response_length = future.result().ByteSize() if exception is None else 0
+
+            self.environment.events.request.fire(
+                name=name,
+                context=context,
+                response=future,
+                exception=exception,
+                request_type="gRPC",
+                response_time=response_time,
+                response_length=response_length,
+            )
+
+        # Метрики отправляются по завершении вызова, а не ожиданием результата здесь:
+        # так вызовы через .future() (см. GRPCClient.as_futures) не блокируются интерцептором
+        response = continuation(client_call_details, request)
+        response.add_done_callback(on_done)
 
         return response
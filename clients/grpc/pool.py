@@ -0,0 +1,174 @@
+import threading
+from collections import Counter
+from enum import StrEnum
+from typing import Callable
+
+from grpc import Channel, intercept_channel
+from pydantic import BaseModel
+
+from clients.grpc.interceptors.in_flight_interceptor import InFlightInterceptor
+from tools.logger import get_logger
+
+logger = get_logger("GRPC_CHANNEL_POOL")
+
+# Без этой опции grpc-core переиспользует одно подключение (subchannel) для всех каналов с одинаковым адресом,
+# и несколько каналов пула фактически мультиплексируются через одно HTTP/2-соединение
+GRPC_LOCAL_SUBCHANNEL_POOL_OPTION = ("grpc.use_local_subchannel_pool", 1)
+
+
+class GRPCChannelPoolStrategy(StrEnum):
+    """
+    Стратегия назначения каналов пула виртуальным пользователям.
+
+    PROCESS — один канал на процесс Locust: все стабы всех пользователей мультиплексируются через него.
+    PER_VUS — каждые vus_per_channel пользователей (в порядке запуска) получают свой канал.
+    ROUND_ROBIN — пользователи назначаются по кругу на size каналов.
+    """
+    PROCESS = "PROCESS"
+    PER_VUS = "PER_VUS"
+    ROUND_ROBIN = "ROUND_ROBIN"
+
+
+class GRPCChannelPoolConfig(BaseModel):
+    """
+    Настройки пула gRPC-каналов.
+
+    Attributes:
+        strategy (GRPCChannelPoolStrategy): Стратегия назначения каналов.
+        size (int): Количество каналов для ROUND_ROBIN и верхняя граница количества каналов для PER_VUS.
+        vus_per_channel (int): Сколько виртуальных пользователей делят один канал при PER_VUS.
+        max_concurrent_streams (int): SETTINGS_MAX_CONCURRENT_STREAMS сервиса — сколько вызовов одно соединение
+            выполняет одновременно; по нему оценивается локальная очередь вызовов.
+    """
+    strategy: GRPCChannelPoolStrategy = GRPCChannelPoolStrategy.PROCESS
+    size: int = 4
+    vus_per_channel: int = 50
+    max_concurrent_streams: int = 100
+
+
+class GRPCChannelPoolUsage(BaseModel):
+    """
+    Снимок загрузки пула каналов.
+
+    Время ожидания потока не снимается: grpc-core не сообщает, сколько вызов простоял в очереди.
+
+    Attributes:
+        channels (int): Количество каналов (HTTP/2-соединений).
+        active_channels (int): Каналы, по которым сейчас идут вызовы.
+        idle_channels (int): Каналы без вызовов.
+        in_flight_calls (int): Незавершённые вызовы по всем каналам.
+        max_channel_in_flight (int): Больше всего незавершённых вызовов на одном канале.
+        queued_calls (int): Оценка вызовов, ждущих свободного потока: сверх max_concurrent_streams на канал.
+    """
+    channels: int = 0
+    active_channels: int = 0
+    idle_channels: int = 0
+    in_flight_calls: int = 0
+    max_channel_in_flight: int = 0
+    queued_calls: int = 0
+
+
+class GRPCChannelPool:
+    """
+    Пул gRPC-каналов, через которые мультиплексируются стабы виртуальных пользователей.
+
+    Вместо отдельного канала (и отдельного HTTP/2-соединения) на каждый API клиент каждого пользователя
+    все клиенты пользователя работают через один канал пула, а сам канал делится между пользователями
+    по стратегии из config. Каждый канал пула — отдельное HTTP/2-соединение (см. GRPC_LOCAL_SUBCHANNEL_POOL_OPTION).
+    Вызовы каждого канала считаются InFlightInterceptor, по ним снимается загрузка пула (см. get_usage).
+    """
+
+    def __init__(self, config: GRPCChannelPoolConfig, build_channel: Callable[[], Channel]):
+        """
+        :param config: Настройки пула.
+        :param build_channel: Фабрика канала (адрес, интерцепторы и т.д.).
+        """
+        self.config = config
+        self.build_channel = build_channel
+        self.channels: list[Channel] = []
+        self.interceptors: list[InFlightInterceptor] = []
+        self.assignments: Counter[int] = Counter()
+        self.assigned = 0
+
+        self._lock = threading.Lock()
+
+    def _get_index(self) -> int:
+        match self.config.strategy:
+            case GRPCChannelPoolStrategy.PER_VUS:
+                return (self.assigned // self.config.vus_per_channel) % self.config.size
+            case GRPCChannelPoolStrategy.ROUND_ROBIN:
+                return self.assigned % self.config.size
+            case _:
+                return 0
+
+    def get_channel(self) -> Channel:
+        """
+        Назначает канал очередному виртуальному пользователю. Каналы создаются при первом назначении.
+
+        :return: Канал пула.
+        """
+        with self._lock:
+            index = self._get_index()
+            self.assigned += 1
+
+            while len(self.channels) <= index:
+                interceptor = InFlightInterceptor()
+                self.interceptors.append(interceptor)
+                self.channels.append(intercept_channel(self.build_channel(), interceptor))
+
+            self.assignments[index] += 1
+            return self.channels[index]
+
+    def get_usage(self) -> GRPCChannelPoolUsage:
+        """
+        Снимает текущую загрузку пула.
+
+        :return: Загрузка всех каналов пула.
+        """
+        usage = GRPCChannelPoolUsage(channels=len(self.interceptors))
+        for interceptor in list(self.interceptors):
+            in_flight = interceptor.in_flight
+            if in_flight > 0:
+                usage.active_channels += 1
+            else:
+                usage.idle_channels += 1
+
+            usage.in_flight_calls += in_flight
+            usage.max_channel_in_flight = max(usage.max_channel_in_flight, in_flight)
+            usage.queued_calls += max(in_flight - self.config.max_concurrent_streams, 0)
+
+        return usage
+
+    def log_summary(self, peak: GRPCChannelPoolUsage, samples: int) -> None:
+        """
+        Пишет в лог, сколько виртуальных пользователей было назначено на каждый канал, и пиковую загрузку пула за тест.
+
+        :param peak: Пиковые значения загрузки.
+        :param samples: Сколько раз снималась загрузка.
+        """
+        logger.info(
+            f"gRPC channel pool ({self.config.strategy}): {len(self.channels)} channels, "
+            f"VUs per channel: {[self.assignments[index] for index in range(len(self.channels))]}"
+        )
+        logger.info(
+            f"gRPC channel pool peak usage over {samples} samples: {peak.active_channels} active and "
+            f"{peak.idle_channels} idle channels, {peak.in_flight_calls} calls in flight "
+            f"(up to {peak.max_channel_in_flight} per channel), {peak.queued_calls} queued calls"
+        )
+        if peak.queued_calls > 0:
+            logger.warning(
+                f"Calls exceeded {self.config.max_concurrent_streams} concurrent streams per channel "
+                f"and queued locally: consider more channels"
+            )
+
+    def close(self) -> None:
+        """
+        Закрывает все каналы пула.
+        """
+        with self._lock:
+            for channel in self.channels:
+                channel.close()
+            self.channels.clear()
+            self.interceptors.clear()
+            self.assignments.clear()
+            self.assigned = 0
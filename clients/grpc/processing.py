@@ -0,0 +1,82 @@
+import time
+from typing import Any, Callable
+
+from grpc import Channel
+
+from tools.locust.processing import ClientProcessingStage, client_processing
+
+
+def build_processing_function(
+        function: Callable[[Any], Any] | None,
+        stage: ClientProcessingStage,
+        method: str
+) -> Callable[[Any], Any] | None:
+    """
+    Оборачивает сериализатор запроса или десериализатор ответа gRPC-метода записью времени этапа.
+
+    :param function: SerializeToString запроса или FromString ответа (None — без преобразования).
+    :param stage: Этап обработки (SERIALIZE или DESERIALIZE).
+    :param method: Полное имя gRPC-метода.
+    :return: Функция с тем же поведением, записывающая своё время в client_processing.
+    """
+    if function is None:
+        return None
+
+    def inner(value: Any) -> Any:
+        started_ns = time.perf_counter_ns()
+        result = function(value)
+        client_processing.record(stage, method, started_ns)
+        return result
+
+    return inner
+
+
+class ProcessingChannel(Channel):
+    """
+    Обёртка над gRPC-каналом, которая замеряет сериализацию запросов и разбор ответов.
+
+    Стабы передают каналу SerializeToString запроса и FromString ответа, а канал вызывает их сам,
+    так что это время не отделить в интерцепторе. Обёртка подменяет их при создании вызова стаба
+    на функции с записью времени (см. ClientProcessing); остальное делегируется исходному каналу.
+    Ответ не всегда разбирается в контексте вызова, поэтому этапы записываются под полным именем метода
+    без метки когорты (см. use_locust_cohort).
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        :param channel: Исходный канал (обычно уже с интерцепторами).
+        """
+        self.channel = channel
+
+    def subscribe(self, callback, try_to_connect=False):
+        self.channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self.channel.unsubscribe(callback)
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.unary_unary(
+            method,
+            build_processing_function(request_serializer, ClientProcessingStage.SERIALIZE, method),
+            build_processing_function(response_deserializer, ClientProcessingStage.DESERIALIZE, method),
+            _registered_method
+        )
+
+    def unary_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.unary_stream(method, request_serializer, response_deserializer, _registered_method)
+
+    def stream_unary(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.stream_unary(method, request_serializer, response_deserializer, _registered_method)
+
+    def stream_stream(self, method, request_serializer=None, response_deserializer=None, _registered_method=False):
+        return self.channel.stream_stream(method, request_serializer, response_deserializer, _registered_method)
+
+    def close(self):
+        self.channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
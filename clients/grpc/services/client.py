@@ -0,0 +1,42 @@
+from grpc import Channel, insecure_channel
+
+USERS_SERVICE_GRPC_ADDRESS = "localhost:9000"
+CARDS_SERVICE_GRPC_ADDRESS = "localhost:9001"
+ACCOUNTS_SERVICE_GRPC_ADDRESS = "localhost:9002"
+OPERATIONS_SERVICE_GRPC_ADDRESS = "localhost:9004"
+
+
+def build_users_service_grpc_channel() -> Channel:
+    """
+    Фабричная функция для создания gRPC-канала к внутреннему сервису users-service.
+
+    :return: gRPC-канал (Channel), настроенный на адрес USERS_SERVICE_GRPC_ADDRESS.
+    """
+    return insecure_channel(USERS_SERVICE_GRPC_ADDRESS)
+
+
+def build_cards_service_grpc_channel() -> Channel:
+    """
+    Фабричная функция для создания gRPC-канала к внутреннему сервису cards-service.
+
+    :return: gRPC-канал (Channel), настроенный на адрес CARDS_SERVICE_GRPC_ADDRESS.
+    """
+    return insecure_channel(CARDS_SERVICE_GRPC_ADDRESS)
+
+
+def build_accounts_service_grpc_channel() -> Channel:
+    """
+    Фабричная функция для создания gRPC-канала к внутреннему сервису accounts-service.
+
+    :return: gRPC-канал (Channel), настроенный на адрес ACCOUNTS_SERVICE_GRPC_ADDRESS.
+    """
+    return insecure_channel(ACCOUNTS_SERVICE_GRPC_ADDRESS)
+
+
+def build_operations_service_grpc_channel() -> Channel:
+    """
+    Фабричная функция для создания gRPC-канала к внутреннему сервису operations-service.
+
+    :return: gRPC-канал (Channel), настроенный на адрес OPERATIONS_SERVICE_GRPC_ADDRESS.
+    """
+    return insecure_channel(OPERATIONS_SERVICE_GRPC_ADDRESS)
@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_operations_service_grpc_channel
+from contracts.services.operations.operation_pb2 import OperationType, OperationStatus
+from contracts.services.operations.operations_service_pb2_grpc import OperationsServiceStub
+from contracts.services.operations.rpc_create_operation_pb2 import CreateOperationRequest, CreateOperationResponse
+from tools.fakers import fake
+
+
+class OperationsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для взаимодействия с внутренним OperationsService напрямую, минуя gateway.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к OperationsService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsServiceStub(channel)
+
+    def create_operation_api(self, request: CreateOperationRequest) -> CreateOperationResponse:
+        """
+        Низкоуровневый вызов метода CreateOperation через gRPC.
+
+        :param request: gRPC-запрос с данными новой операции.
+        :return: Ответ от сервиса с данными созданной операции.
+        """
+        return self.stub.CreateOperation(request)
+
+    def create_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            operation_type: OperationType.ValueType
+    ) -> CreateOperationResponse:
+        """
+        Создание операции с фейковыми данными.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :param operation_type: Тип операции (OPERATION_TYPE_TOP_UP, OPERATION_TYPE_PURCHASE и т.д.).
+        :return: Ответ с информацией о созданной операции.
+        """
+        request = CreateOperationRequest(
+            type=operation_type,
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            category=fake.category() if operation_type == OperationType.OPERATION_TYPE_PURCHASE else "",
+            created_at=datetime.now().isoformat(),
+            account_id=account_id
+        )
+        return self.create_operation_api(request)
+
+
+def build_operations_service_grpc_client() -> OperationsServiceGRPCClient:
+    """
+    Фабрика для создания экземпляра OperationsServiceGRPCClient.
+
+    :return: Инициализированный клиент для OperationsService.
+    """
+    return OperationsServiceGRPCClient(channel=build_operations_service_grpc_channel())
@@ -1,12 +1,42 @@
-from typing import Any, TypedDict
+import time
+from typing import Any, TypedDict, TypeVar
 
 from httpx import Client, Response, QueryParams, URL
+from pydantic import BaseModel
+
+from tools.locust.cohort import get_locust_request_name
+from tools.locust.processing import ClientProcessingStage, client_processing
+
+T = TypeVar("T", bound=BaseModel)
 
 
 class HTTPClientExtensions(TypedDict, total=False):
     route: str
 
 
+def serialize_json_body(url: str | URL, json: Any | None, extensions: HTTPClientExtensions | None) -> dict[str, Any]:
+    """
+    Готовит тело POST-запроса. Pydantic-модель сериализуется в JSON (по алиасам полей) здесь, а не внутри httpx,
+    чтобы время сериализации записывалось отдельно от времени запроса (см. ClientProcessingStage.SERIALIZE).
+
+    :param url: URL-адрес эндпоинта.
+    :param json: Pydantic-модель или данные, которые httpx сериализует сам.
+    :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
+    :return: Аргументы тела для httpx.Client.post (json либо content с заголовком Content-Type).
+    """
+    if not isinstance(json, BaseModel):
+        return {"json": json}
+
+    started_ns = time.perf_counter_ns()
+    content = json.model_dump_json(by_alias=True)
+    client_processing.record(
+        ClientProcessingStage.SERIALIZE,
+        get_locust_request_name(f"POST {(extensions or {}).get('route', url)}"),
+        started_ns
+    )
+    return {"content": content, "headers": {"Content-Type": "application/json"}}
+
+
 class HTTPClient:
     """
     Базовый HTTP API клиент, принимающий объект httpx.Client.
@@ -17,6 +47,31 @@ class HTTPClient:
     def __init__(self, client: Client) -> None:
         self.client = client
 
+    @staticmethod
+    def parse_response(response: Response, schema: type[T]) -> T:
+        """
+        Валидирует тело ответа схемой.
+
+        Декодирование тела и валидация выполняются после того, как время отклика уже записано,
+        поэтому их время записывается отдельно (см. ClientProcessingStage).
+
+        :param response: Ответ API.
+        :param schema: Pydantic-модель ответа.
+        :return: Ответ API, валидированный в Pydantic-модель.
+        """
+        request = response.request
+        name = get_locust_request_name(f"{request.method} {request.extensions.get('route', request.url.path)}")
+
+        started_ns = time.perf_counter_ns()
+        text = response.text
+        client_processing.record(ClientProcessingStage.DESERIALIZE, name, started_ns)
+
+        started_ns = time.perf_counter_ns()
+        result = schema.model_validate_json(text)
+        client_processing.record(ClientProcessingStage.VALIDATE, name, started_ns)
+
+        return result
+
     def get(
             self,
             url: str | URL,
@@ -43,8 +98,8 @@ class HTTPClient:
         Выполняет POST-запрос.
 
         :param url: URL-адрес эндпоинта.
-        :param json: Данные в формате JSON.
+        :param json: Pydantic-модель тела запроса или данные в формате JSON (см. serialize_json_body).
         :param extensions: Дополнительные данные, передаваемые через HTTPX extensions.
         :return: Объект Response с данными ответа.
         """
-        return self.client.post(url=url, json=json, extensions=extensions)
+        return self.client.post(url=url, extensions=extensions, **serialize_json_body(url, json, extensions))
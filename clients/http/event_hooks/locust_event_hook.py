@@ -1,54 +1,188 @@
 import time
+from typing import Callable, Iterator
 
-from httpx import Request, Response, HTTPStatusError, HTTPError
+from httpx import Request, Response, HTTPStatusError, SyncByteStream
+from locust import events
 from locust.env import Environment
 
+from tools.locust.cohort import locust_cohort, get_locust_request_name
+from tools.logger import get_logger
+
+logger = get_logger("LOCUST_EVENT_HOOK")
+
+# Для оценки стоимости хуков при целевой нагрузке
+LOCUST_EVENT_HOOK_REFERENCE_RPS = 10_000
+
+
+class LocustEventHookOverhead:
+    """
+    Собственная стоимость хуков метрик: сколько процессорного времени хуки тратят на один запрос.
+
+    Учитывается всё время внутри хуков, включая отправку события в Locust, поэтому по среднему значению
+    видно, какую долю ядра генератора нагрузки занимают сами метрики (см. log_summary).
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.total_ns = 0
+
+    def record(self, started_ns: int, requests: int = 0) -> None:
+        """
+        Добавляет время работы хука.
+
+        :param started_ns: Момент начала работы хука (time.perf_counter_ns()).
+        :param requests: Сколько запросов завершил этот вызов хука (0 — хук отправки запроса).
+        """
+        self.total_ns += time.perf_counter_ns() - started_ns
+        self.requests += requests
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.total_ns = 0
+
+    def get_per_request_ns(self) -> float:
+        """
+        :return: Среднее время хуков на один запрос в наносекундах.
+        """
+        return self.total_ns / self.requests if self.requests else 0.0
+
+    def log_summary(self) -> None:
+        """
+        Пишет в лог среднюю стоимость хуков на запрос и долю ядра при LOCUST_EVENT_HOOK_REFERENCE_RPS.
+        """
+        if not self.requests:
+            return
+
+        per_request_ns = self.get_per_request_ns()
+        core_share = per_request_ns * LOCUST_EVENT_HOOK_REFERENCE_RPS / 1e9
+        logger.info(
+            f"HTTP metrics hooks: {per_request_ns / 1000:.1f} µs per request over {self.requests} requests, "
+            f"{core_share:.1%} of one core at {LOCUST_EVENT_HOOK_REFERENCE_RPS} RPS"
+        )
+
+
+locust_event_hook_overhead = LocustEventHookOverhead()
+
+
+@events.test_start.add_listener
+def reset_locust_event_hook_overhead(**kwargs):
+    locust_event_hook_overhead.reset()
+
+
+@events.test_stop.add_listener
+def log_locust_event_hook_overhead(**kwargs):
+    locust_event_hook_overhead.log_summary()
+
+
+class LocustCountingStream(SyncByteStream):
+    """
+    Обёртка над потоком тела ответа, которая считает прочитанные байты и по закрытию потока
+    передаёт их количество в on_close.
+
+    Позволяет замерить время отклика до конца загрузки тела и его длину без отдельного чтения
+    тела хуком: байты считаются по ходу обычного чтения ответа клиентом.
+    """
+
+    def __init__(self, stream: SyncByteStream, on_close: Callable[[int], None]):
+        """
+        :param stream: Исходный поток тела ответа.
+        :param on_close: Функция, получающая количество прочитанных байт.
+        """
+        self.stream = stream
+        self.on_close = on_close
+        self.length = 0
+        self.closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.stream:
+            self.length += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self.stream.close()
+        finally:
+            if not self.closed:
+                self.closed = True
+                self.on_close(self.length)
+
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    Сохраняет показания монотонных часов в наносекундах в `request.extensions["start_time_ns"]`,
+    чтобы потом использовать их для расчёта времени ответа.
     """
-    request.extensions["start_time"] = time.time()
+    started_ns = time.perf_counter_ns()
+    request.extensions["start_time_ns"] = started_ns
+    locust_event_hook_overhead.record(started_ns)
 
 
-def locust_response_event_hook(environment: Environment):
+def handle_locust_response(environment: Environment, response: Response) -> None:
     """
-    Возвращает HTTPX event hook, вызываемый после получения ответа.
+    Замеряет время отклика и отправляет метрики запроса в `environment.events.request`.
+
+    Время отклика — от locust_request_event_hook до окончания чтения тела ответа, по time.perf_counter_ns(),
+    то есть, как и раньше, включает загрузку тела. Тело не читается хуком отдельно: поток ответа
+    оборачивается в LocustCountingStream, и событие отправляется, когда клиент дочитал и закрыл поток.
+    Если тело уже прочитано (например, ответ создан с content=...), событие отправляется сразу.
+    Длина ответа — Content-Length, а без него — количество прочитанных байт.
+    Ответ проверяется на ошибку только по статусу: исключение создаётся лишь для ошибочных ответов.
 
-    Использует `request.extensions["start_time"]` для вычисления времени отклика.
     Извлекает route из `request.extensions["route"]`, если задан.
-    Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
+    Если запрос выполняется внутри use_locust_cohort, к имени запроса добавляется метка когорты,
+    а сама метка передаётся в context события.
 
     :param environment: Объект окружения Locust, через который отправляются метрики.
-    :return: Функция-хук для HTTPX response event hook.
+    :param response: Ответ, тело которого ещё может быть не прочитано.
     """
+    started_ns = time.perf_counter_ns()
+    request = response.request
 
-    def inner(response: Response) -> None:
-        exception: HTTPError | HTTPStatusError | None = None
+    name = get_locust_request_name(f"{request.method} {request.extensions.get('route', request.url.path)}")
+    context = {"cohort": locust_cohort.get()}
 
+    exception: HTTPStatusError | None = None
+    if response.is_error:
         try:
-            response = response.raise_for_status()
-        except (HTTPError, HTTPStatusError) as error:
+            response.raise_for_status()
+        except HTTPStatusError as error:
             exception = error
 
-        request = response.request
-
-        route = request.extensions.get("route", request.url.path)
-        start_time = request.extensions.get("start_time", time.time())
-        response_time = (time.time() - start_time) * 1000
-        response_length = len(response.read())
+    content_length = response.headers.get("content-length")
 
+    def fire(read_length: int) -> None:
+        fired_ns = time.perf_counter_ns()
         environment.events.request.fire(
-            name=f"{request.method} {route}",
-            context=None,
+            name=name,
+            context=context,
             response=response,
             exception=exception,
             request_type="HTTP",
-            response_time=response_time,
-            response_length=response_length,
+            response_time=(fired_ns - request.extensions.get("start_time_ns", fired_ns)) / 1_000_000,
+            response_length=int(content_length) if content_length and content_length.isdigit() else read_length,
         )
+        locust_event_hook_overhead.record(fired_ns, requests=1)
+
+    if response.is_stream_consumed:
+        locust_event_hook_overhead.record(started_ns)
+        fire(len(response.content))
+        return
+
+    response.stream = LocustCountingStream(response.stream, on_close=fire)
+    locust_event_hook_overhead.record(started_ns)
+
+
+def locust_response_event_hook(environment: Environment):
+    """
+    Возвращает HTTPX event hook, вызываемый после получения ответа (см. handle_locust_response).
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :return: Функция-хук для HTTPX response event hook.
+    """
+
+    def inner(response: Response) -> None:
+        handle_locust_response(environment, response)
 
     return inner
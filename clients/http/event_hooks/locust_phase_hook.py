@@ -0,0 +1,170 @@
+import time
+from enum import StrEnum
+
+from httpx import Request
+from locust.env import Environment
+
+from tools.locust.cohort import get_locust_request_name
+
+# Тип запроса, под которым фазы попадают в статистику Locust
+LOCUST_PHASE_REQUEST_TYPE = "HTTP_PHASE"
+
+
+class HTTPPhase(StrEnum):
+    """
+    Фаза HTTP-запроса.
+
+    POOL — ожидание соединения: от отправки запроса клиентом до начала работы с соединением
+        (открытия нового или записи в уже открытое), включая очередь пула httpx.
+    CONNECT — установка TCP-соединения (и TLS, если есть); только для запросов, открывших новое соединение.
+    SEND — отправка заголовков и тела запроса.
+    TTFB — от окончания отправки запроса до получения заголовков ответа (обработка запроса сервисом и сеть).
+    DOWNLOAD — чтение тела ответа.
+    """
+    POOL = "pool"
+    CONNECT = "connect"
+    SEND = "send"
+    TTFB = "ttfb"
+    DOWNLOAD = "download"
+
+
+def get_locust_phase_name(name: str, phase: HTTPPhase) -> str:
+    """
+    :param name: Имя запроса в статистике Locust (метод, route и когорта).
+    :param phase: Фаза запроса.
+    :return: Имя строки фазы в статистике Locust, например «GET /api/v1/users [ttfb]».
+    """
+    return f"{name} [{phase}]"
+
+
+class HTTPPhaseTrace:
+    """
+    Колбэк trace-расширения httpcore для одного запроса: запоминает моменты событий соединения
+    и по закрытию ответа отправляет длительности фаз (см. HTTPPhase) в `environment.events.request`.
+
+    Фаза — отдельная строка статистики Locust с типом HTTP_PHASE и именем «<запрос> [<фаза>]»
+    (см. get_locust_phase_name), поэтому фазы видны в веб-интерфейсе, CSV и HTML-отчёте
+    и агрегируются мастером так же, как запросы. Строки фаз входят в итоговую строку Aggregated.
+
+    События httpcore есть только у стандартного транспорта httpx: с транспортом GEVENT фазы не записываются.
+    """
+
+    def __init__(self, environment: Environment, name: str):
+        """
+        :param environment: Объект окружения Locust, через который отправляются фазы.
+        :param name: Имя запроса в статистике (метод, route и когорта).
+        """
+        self.environment = environment
+        self.name = name
+        self.started_ns = time.perf_counter_ns()
+        self.marks: dict[str, int] = {}
+
+    def __call__(self, event_name: str, info: dict) -> None:
+        # http11.send_request_headers.started -> send_request_headers.started (так же для http2)
+        prefix, _, event = event_name.partition(".")
+        self.marks[event if prefix != "connection" else event_name] = time.perf_counter_ns()
+
+        if event == "response_closed.started":
+            self.record()
+
+    def get_phases(self) -> dict[HTTPPhase, int]:
+        """
+        :return: Длительности фаз в наносекундах (только фазы, события которых были получены).
+        """
+        marks = self.marks
+        phases: dict[HTTPPhase, int] = {}
+
+        connect_started = marks.get("connection.connect_tcp.started")
+        connect_complete = marks.get("connection.start_tls.complete", marks.get("connection.connect_tcp.complete"))
+        send_started = marks.get("send_request_headers.started")
+        send_complete = marks.get("send_request_body.complete")
+        headers_complete = marks.get("receive_response_headers.complete")
+        body_started = marks.get("receive_response_body.started")
+        body_complete = marks.get("receive_response_body.complete")
+
+        first_io = connect_started or send_started
+        if first_io is not None:
+            phases[HTTPPhase.POOL] = first_io - self.started_ns
+        if connect_started is not None and connect_complete is not None:
+            phases[HTTPPhase.CONNECT] = connect_complete - connect_started
+        if send_started is not None and send_complete is not None:
+            phases[HTTPPhase.SEND] = send_complete - send_started
+        if send_complete is not None and headers_complete is not None:
+            phases[HTTPPhase.TTFB] = headers_complete - send_complete
+        if body_started is not None and body_complete is not None:
+            phases[HTTPPhase.DOWNLOAD] = body_complete - body_started
+
+        return phases
+
+    def fire(self, phase: HTTPPhase, duration_ns: int) -> None:
+        """
+        Отправляет длительность фазы в `environment.events.request`.
+
+        :param phase: Фаза запроса.
+        :param duration_ns: Длительность фазы в наносекундах.
+        """
+        self.environment.events.request.fire(
+            name=get_locust_phase_name(self.name, phase),
+            context={},
+            response=None,
+            exception=None,
+            request_type=LOCUST_PHASE_REQUEST_TYPE,
+            response_time=duration_ns / 1_000_000,
+            response_length=0,
+        )
+
+    def record(self) -> None:
+        """
+        Отправляет длительности фаз запроса.
+        """
+        for phase, duration_ns in self.get_phases().items():
+            self.fire(phase, duration_ns)
+
+
+class HTTPPoolWaitTrace(HTTPPhaseTrace):
+    """
+    Облегчённый вариант HTTPPhaseTrace: записывает только фазу POOL (ожидание соединения)
+    по первому событию работы с соединением, остальные события пропускаются.
+    """
+
+    def __call__(self, event_name: str, info: dict) -> None:
+        if self.started_ns and (
+                event_name == "connection.connect_tcp.started" or event_name.endswith(".send_request_headers.started")
+        ):
+            self.fire(HTTPPhase.POOL, time.perf_counter_ns() - self.started_ns)
+            self.started_ns = 0
+
+
+def get_locust_phase_request_name(request: Request) -> str:
+    """
+    :param request: Запрос httpx.
+    :return: Имя запроса так же, как в основной статистике Locust (метод, route и когорта).
+    """
+    return get_locust_request_name(f"{request.method} {request.extensions.get('route', request.url.path)}")
+
+
+def locust_phase_request_event_hook(environment: Environment):
+    """
+    Возвращает HTTPX event hook, который подключает к запросу trace-колбэк httpcore для записи фаз (см. HTTPPhase).
+
+    :param environment: Объект окружения Locust.
+    :return: Функция-хук для HTTPX request event hook.
+    """
+    def inner(request: Request) -> None:
+        request.extensions["trace"] = HTTPPhaseTrace(environment, get_locust_phase_request_name(request))
+
+    return inner
+
+
+def locust_pool_wait_request_event_hook(environment: Environment):
+    """
+    Возвращает HTTPX event hook, который записывает только время ожидания соединения
+    (см. HTTPPoolWaitTrace). Дешевле locust_phase_request_event_hook (см. HTTPClientPoolConfig.trace_pool_wait).
+
+    :param environment: Объект окружения Locust.
+    :return: Функция-хук для HTTPX request event hook.
+    """
+    def inner(request: Request) -> None:
+        request.extensions["trace"] = HTTPPoolWaitTrace(environment, get_locust_phase_request_name(request))
+
+    return inner
@@ -44,7 +44,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-deposit-account",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
@@ -56,7 +56,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-savings-account",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
@@ -68,7 +68,7 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-debit-card-account",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
@@ -80,33 +80,33 @@ class AccountsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/accounts/open-credit-card-account",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = self.get_accounts_api(query)
-        return GetAccountsResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetAccountsResponseSchema)
 
     def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
         request = OpenDepositAccountRequestSchema(user_id=user_id)
         response = self.open_deposit_account_api(request)
-        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenDepositAccountResponseSchema)
 
     def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
         request = OpenSavingsAccountRequestSchema(user_id=user_id)
         response = self.open_savings_account_api(request)
-        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenSavingsAccountResponseSchema)
 
     def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
         request = OpenDebitCardAccountRequestSchema(user_id=user_id)
         response = self.open_debit_card_account_api(request)
-        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenDebitCardAccountResponseSchema)
 
     def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
         request = OpenCreditCardAccountRequestSchema(user_id=user_id)
         response = self.open_credit_card_account_api(request)
-        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, OpenCreditCardAccountResponseSchema)
 
 
 def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
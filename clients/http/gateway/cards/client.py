@@ -25,7 +25,7 @@ class CardsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/cards/issue-virtual-card",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
@@ -37,18 +37,18 @@ class CardsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/cards/issue-physical-card",
-            json=request.model_dump(by_alias=True)
+            json=request
         )
 
     def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
         request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_virtual_card_api(request)
-        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, IssueVirtualCardResponseSchema)
 
     def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
         request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
         response = self.issue_physical_card_api(request)
-        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, IssuePhysicalCardResponseSchema)
 
 
 def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
@@ -1,21 +1,89 @@
 import logging
 
-from httpx import Client
+from httpx import Client, Limits
 from locust.env import Environment
 
 from clients.http.event_hooks.locust_event_hook import (
     locust_request_event_hook,
     locust_response_event_hook
 )
+from clients.http.event_hooks.locust_phase_hook import (
+    locust_phase_request_event_hook,
+    locust_pool_wait_request_event_hook
+)
+from clients.http.pool import HTTPClientPool, HTTPClientPoolConfig
+from clients.http.transports import HTTPClientBackend, build_http_transport
+from tools.locust.processing import client_processing
+
+GATEWAY_HTTP_URL = "http://localhost:8003"
 
 
-def build_gateway_http_client() -> Client:
+def build_gateway_http_client(backend: HTTPClientBackend = HTTPClientBackend.HTTPX) -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
 
+    :param backend: Транспорт клиента (по умолчанию — стандартный транспорт httpx).
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=100, base_url="http://localhost:8003")
+    return Client(timeout=100, base_url=GATEWAY_HTTP_URL, transport=build_http_transport(backend))
+
+
+def setup_gateway_locust_http_pool(
+        environment: Environment,
+        config: HTTPClientPoolConfig | None = None
+) -> HTTPClientPool:
+    """
+    Создаёт общий пул HTTP-клиентов http-gateway для процесса Locust (environment.gateway_http_pool).
+
+    Вызывается из хука events.init сценария, если нужны нестандартные область или лимиты пула;
+    иначе пул с настройками по умолчанию создаётся при первом обращении (см. build_gateway_locust_http_client).
+    Если пул уже был создан, его клиенты закрываются.
+    Загрузка пула (очередь запросов, время ожидания соединения, активные и простаивающие соединения)
+    снимается монитором насыщения (см. get_locust_saturation_monitor), как и время обработки запросов
+    на стороне клиента (см. ClientProcessing).
+
+    :param environment: Объект окружения Locust.
+    :param config: Настройки пула (по умолчанию — один клиент на процесс, до 100 соединений, транспорт httpx).
+    :return: Пул HTTP-клиентов.
+    """
+    config = config or HTTPClientPoolConfig()
+
+    request_hooks = [locust_request_event_hook]
+    if config.trace_phases:
+        request_hooks.append(locust_phase_request_event_hook(environment))
+    elif config.trace_pool_wait:
+        request_hooks.append(locust_pool_wait_request_event_hook(environment))
+
+    def build_client(limits: Limits) -> Client:
+        return Client(
+            timeout=100,
+            base_url=GATEWAY_HTTP_URL,
+            transport=build_http_transport(config.backend, limits),
+            event_hooks={
+                "request": request_hooks,
+                "response": [locust_response_event_hook(environment)]
+            }
+        )
+
+    previous: HTTPClientPool | None = getattr(environment, "gateway_http_pool", None)
+    if previous is not None:
+        previous.close()
+
+    environment.gateway_http_pool = HTTPClientPool(config, build_client=build_client)
+    environment.gateway_http_pool.attach(environment)
+    client_processing.attach(environment)
+    return environment.gateway_http_pool
+
+
+def get_gateway_locust_http_pool(environment: Environment) -> HTTPClientPool:
+    """
+    Возвращает общий пул HTTP-клиентов http-gateway, создавая его с настройками по умолчанию при необходимости.
+
+    :param environment: Объект окружения Locust.
+    :return: Пул HTTP-клиентов.
+    """
+    pool: HTTPClientPool | None = getattr(environment, "gateway_http_pool", None)
+    return pool if pool is not None else setup_gateway_locust_http_pool(environment)
 
 
 def build_gateway_locust_http_client(environment: Environment) -> Client:
@@ -30,6 +98,9 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    Клиент берётся из общего пула (см. setup_gateway_locust_http_pool): в области PROCESS все вызовы
+    возвращают один и тот же клиент, в области VU — новый клиент на каждый вызов.
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
@@ -37,11 +108,4 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     # Это избавляет консоль от лишнего вывода при высоконагруженных тестах
     logging.getLogger("httpx").setLevel(logging.WARNING)
 
-    return Client(
-        timeout=100,
-        base_url="http://localhost:8003",
-        event_hooks={
-            "request": [locust_request_event_hook],
-            "response": [locust_response_event_hook(environment)]
-        }
-    )
+    return get_gateway_locust_http_pool(environment).get_client()
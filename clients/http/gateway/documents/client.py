@@ -48,7 +48,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Ответ с данными тарифа (GetTariffDocumentResponseSchema).
         """
         response = self.get_tariff_document_api(account_id)
-        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetTariffDocumentResponseSchema)
 
     def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
         """
@@ -60,7 +60,7 @@ class DocumentsGatewayHTTPClient(HTTPClient):
         :return: Ответ с данными контракта (GetContractDocumentResponseSchema).
         """
         response = self.get_contract_document_api(account_id)
-        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetContractDocumentResponseSchema)
 
 
 def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
@@ -1,64 +1,86 @@
+from functools import cached_property
+
+from httpx import Client
 from locust import TaskSet, SequentialTaskSet
 
-from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
-from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
-from clients.http.gateway.documents.client import (
-    DocumentsGatewayHTTPClient,
-    build_documents_gateway_locust_http_client
-)
-from clients.http.gateway.operations.client import (
-    OperationsGatewayHTTPClient,
-    build_operations_gateway_locust_http_client
-)
-from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.client import build_gateway_locust_http_client, get_gateway_locust_http_pool
+from clients.http.gateway.documents.client import DocumentsGatewayHTTPClient
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
 
 
-class GatewayHTTPTaskSet(TaskSet):
+class GatewayHTTPClientsMixin:
     """
-    Базовый TaskSet для HTTP-сценариев, работающих с http-gateway.
+    API клиенты http-gateway для TaskSet.
 
-    Здесь создаются все необходимые API клиенты, которые будут доступны в последующих задачах (task).
-    Используется, если порядок выполнения задач внутри таск-сета не имеет значения.
+    Все клиенты виртуального пользователя работают через один httpx.Client из общего пула
+    (см. setup_gateway_locust_http_pool), а сами клиенты создаются лениво — при первом обращении,
+    поэтому TaskSet, которому нужен только один домен, не создаёт остальные.
     """
 
-    users_gateway_client: UsersGatewayHTTPClient
-    cards_gateway_client: CardsGatewayHTTPClient
-    accounts_gateway_client: AccountsGatewayHTTPClient
-    documents_gateway_client: DocumentsGatewayHTTPClient
-    operations_gateway_client: OperationsGatewayHTTPClient
+    @cached_property
+    def http_client(self) -> Client:
+        """
+        httpx.Client виртуального пользователя из общего пула.
+        """
+        return build_gateway_locust_http_client(self.user.environment)
+
+    @cached_property
+    def users_gateway_client(self) -> UsersGatewayHTTPClient:
+        return UsersGatewayHTTPClient(client=self.http_client)
 
-    def on_start(self) -> None:
+    @cached_property
+    def cards_gateway_client(self) -> CardsGatewayHTTPClient:
+        return CardsGatewayHTTPClient(client=self.http_client)
+
+    @cached_property
+    def accounts_gateway_client(self) -> AccountsGatewayHTTPClient:
+        return AccountsGatewayHTTPClient(client=self.http_client)
+
+    @cached_property
+    def documents_gateway_client(self) -> DocumentsGatewayHTTPClient:
+        return DocumentsGatewayHTTPClient(client=self.http_client)
+
+    @cached_property
+    def operations_gateway_client(self) -> OperationsGatewayHTTPClient:
+        return OperationsGatewayHTTPClient(client=self.http_client)
+
+    def on_stop(self) -> None:
         """
-        Метод вызывается перед запуском задач TaskSet.
-        Здесь создаются API клиенты с использованием контекста окружения Locust.
+        Возвращает httpx.Client виртуального пользователя в пул при остановке TaskSet
+        и сбрасывает созданные на нём API клиенты.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        client = self.__dict__.pop("http_client", None)
+        if client is None:
+            return
+
+        for name in (
+                "users_gateway_client",
+                "cards_gateway_client",
+                "accounts_gateway_client",
+                "documents_gateway_client",
+                "operations_gateway_client"
+        ):
+            self.__dict__.pop(name, None)
+
+        get_gateway_locust_http_pool(self.user.environment).release(client)
 
 
-class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
+class GatewayHTTPTaskSet(GatewayHTTPClientsMixin, TaskSet):
     """
-    Базовый SequentialTaskSet для HTTP-сценариев, где важен порядок выполнения задач.
+    Базовый TaskSet для HTTP-сценариев, работающих с http-gateway.
 
-    Задачи внутри такого таск-сета будут выполняться строго по очереди — сверху вниз.
-    Также здесь инициализируются те же API клиенты, что и в обычном TaskSet.
+    Здесь доступны все необходимые API клиенты, которые используются в задачах (task).
+    Используется, если порядок выполнения задач внутри таск-сета не имеет значения.
     """
 
-    users_gateway_client: UsersGatewayHTTPClient
-    cards_gateway_client: CardsGatewayHTTPClient
-    accounts_gateway_client: AccountsGatewayHTTPClient
-    documents_gateway_client: DocumentsGatewayHTTPClient
-    operations_gateway_client: OperationsGatewayHTTPClient
 
-    def on_start(self) -> None:
-        """
-        Создание API клиентов для последовательного сценария.
-        """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+class GatewayHTTPSequentialTaskSet(GatewayHTTPClientsMixin, SequentialTaskSet):
+    """
+    Базовый SequentialTaskSet для HTTP-сценариев, где важен порядок выполнения задач.
+
+    Задачи внутри такого таск-сета будут выполняться строго по очереди — сверху вниз.
+    Также здесь доступны те же API клиенты, что и в обычном TaskSet.
+    """
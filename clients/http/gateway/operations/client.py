@@ -101,7 +101,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-fee-operation",
-            json=request.model_dump(by_alias=True),
+            json=request,
         )
 
     def make_top_up_operation_api(self, request: MakeTopUpOperationRequestSchema) -> Response:
@@ -115,7 +115,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-top-up-operation",
-            json=request.model_dump(by_alias=True),
+            json=request,
         )
 
     def make_cashback_operation_api(self, request: MakeCashbackOperationRequestSchema) -> Response:
@@ -129,7 +129,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-cashback-operation",
-            json=request.model_dump(by_alias=True),
+            json=request,
         )
 
     def make_transfer_operation_api(self, request: MakeTransferOperationRequestSchema) -> Response:
@@ -143,7 +143,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-transfer-operation",
-            json=request.model_dump(by_alias=True),
+            json=request,
         )
 
     def make_purchase_operation_api(self, request: MakePurchaseOperationRequestSchema) -> Response:
@@ -157,7 +157,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-purchase-operation",
-            json=request.model_dump(by_alias=True),
+            json=request,
         )
 
     def make_bill_payment_operation_api(self, request: MakeBillPaymentOperationRequestSchema) -> Response:
@@ -171,7 +171,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-bill-payment-operation",
-            json=request.model_dump(by_alias=True),
+            json=request,
         )
 
     def make_cash_withdrawal_operation_api(
@@ -188,7 +188,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         return self.post(
             "/api/v1/operations/make-cash-withdrawal-operation",
-            json=request.model_dump(by_alias=True),
+            json=request,
         )
 
     def get_operation(self, operation_id: str) -> GetOperationResponseSchema:
@@ -199,7 +199,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ API, валидированный в Pydantic-модель.
         """
         response = self.get_operation_api(operation_id)
-        return GetOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationResponseSchema)
 
     def get_operation_receipt(self, operation_id: str) -> GetOperationReceiptResponseSchema:
         """
@@ -209,7 +209,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         :return: Ответ API, валидированный в Pydantic-модель.
         """
         response = self.get_operation_receipt_api(operation_id)
-        return GetOperationReceiptResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationReceiptResponseSchema)
 
     def get_operations(self, account_id: str) -> GetOperationsResponseSchema:
         """
@@ -220,7 +220,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         query = GetOperationsQuerySchema(account_id=account_id)
         response = self.get_operations_api(query)
-        return GetOperationsResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationsResponseSchema)
 
     def get_operations_summary(self, account_id: str) -> GetOperationsSummaryResponseSchema:
         """
@@ -231,7 +231,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         query = GetOperationsSummaryQuerySchema(account_id=account_id)
         response = self.get_operations_summary_api(query)
-        return GetOperationsSummaryResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, GetOperationsSummaryResponseSchema)
 
     def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
         """
@@ -243,7 +243,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         request = MakeFeeOperationRequestSchema(card_id=card_id, account_id=account_id)
         response = self.make_fee_operation_api(request)
-        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeFeeOperationResponseSchema)
 
     def make_top_up_operation(
             self,
@@ -259,7 +259,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         request = MakeTopUpOperationRequestSchema(card_id=card_id, account_id=account_id)
         response = self.make_top_up_operation_api(request)
-        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeTopUpOperationResponseSchema)
 
     def make_cashback_operation(
             self,
@@ -275,7 +275,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         request = MakeCashbackOperationRequestSchema(card_id=card_id, account_id=account_id)
         response = self.make_cashback_operation_api(request)
-        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeCashbackOperationResponseSchema)
 
     def make_transfer_operation(
             self,
@@ -291,7 +291,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         request = MakeTransferOperationRequestSchema(card_id=card_id, account_id=account_id)
         response = self.make_transfer_operation_api(request)
-        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeTransferOperationResponseSchema)
 
     def make_purchase_operation(
             self,
@@ -307,7 +307,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         request = MakePurchaseOperationRequestSchema(card_id=card_id, account_id=account_id)
         response = self.make_purchase_operation_api(request)
-        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakePurchaseOperationResponseSchema)
 
     def make_bill_payment_operation(
             self,
@@ -323,7 +323,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         request = MakeBillPaymentOperationRequestSchema(card_id=card_id, account_id=account_id)
         response = self.make_bill_payment_operation_api(request)
-        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeBillPaymentOperationResponseSchema)
 
     def make_cash_withdrawal_operation(
             self,
@@ -339,7 +339,7 @@ class OperationsGatewayHTTPClient(HTTPClient):
         """
         request = MakeCashWithdrawalOperationRequestSchema(card_id=card_id, account_id=account_id)
         response = self.make_cash_withdrawal_operation_api(request)
-        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+        return self.parse_response(response, MakeCashWithdrawalOperationResponseSchema)
 
 
 def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
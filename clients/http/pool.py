@@ -0,0 +1,242 @@
+import threading
+from enum import StrEnum
+from typing import Callable
+
+from httpx import Client, Limits
+from locust.env import Environment
+from pydantic import BaseModel
+
+from clients.http.event_hooks.locust_phase_hook import HTTPPhase, LOCUST_PHASE_REQUEST_TYPE
+from clients.http.transports import HTTPClientBackend
+from tools.locust.saturation import get_locust_saturation_monitor
+from tools.logger import get_logger
+
+logger = get_logger("HTTP_CLIENT_POOL")
+
+
+class HTTPClientPoolScope(StrEnum):
+    """
+    Область, в которой API клиенты разделяют один httpx.Client (и его пул соединений).
+
+    PROCESS — один клиент на процесс Locust: все виртуальные пользователи переиспользуют общие соединения.
+    VU — свой клиент на каждого виртуального пользователя: соединения не разделяются между пользователями,
+        как у реальных клиентов, но все API клиенты одного пользователя всё равно работают через один пул.
+    """
+    PROCESS = "PROCESS"
+    VU = "VU"
+
+
+class HTTPClientPoolConfig(BaseModel):
+    """
+    Настройки общего пула HTTP-соединений.
+
+    Attributes:
+        scope (HTTPClientPoolScope): Область разделения клиента.
+        backend (HTTPClientBackend): Транспорт клиентов пула.
+        max_connections (int): Максимальное количество соединений одного клиента.
+        max_keepalive_connections (int): Сколько простаивающих соединений держать открытыми.
+        keepalive_expiry (float): Через сколько секунд простоя закрывать соединение.
+        trace_phases (bool): Записывать длительности фаз запросов (см. locust_phase_request_event_hook).
+        trace_pool_wait (bool): Записывать время ожидания соединения, если фазы не записываются
+            (см. locust_pool_wait_request_event_hook). Выключено по умолчанию: каждое ожидание — отдельная
+            строка HTTP_PHASE в статистике Locust.
+        sample_interval (float): Период в секундах, с которым снимается загрузка пула во время теста.
+    """
+    scope: HTTPClientPoolScope = HTTPClientPoolScope.PROCESS
+    backend: HTTPClientBackend = HTTPClientBackend.HTTPX
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0
+    trace_phases: bool = False
+    trace_pool_wait: bool = False
+    sample_interval: float = 1.0
+
+    def get_limits(self) -> Limits:
+        """
+        :return: Лимиты httpx для каждого клиента пула.
+        """
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+
+class HTTPClientPoolUsage(BaseModel):
+    """
+    Снимок загрузки пула соединений (суммарно по всем клиентам пула).
+
+    Attributes:
+        clients (int): Количество httpx.Client.
+        active_connections (int): Соединения, по которым сейчас идёт запрос.
+        idle_connections (int): Открытые простаивающие соединения.
+        active_requests (int): Запросы, получившие соединение.
+        queued_requests (int): Запросы, ждущие свободного соединения (больше 0 — пул мал).
+        wait_ms (float): Среднее время ожидания соединения (фаза pool) с предыдущего снятия, мс
+            (0, если не включены trace_phases или trace_pool_wait).
+    """
+    clients: int = 0
+    active_connections: int = 0
+    idle_connections: int = 0
+    active_requests: int = 0
+    queued_requests: int = 0
+    wait_ms: float = 0.0
+
+
+class HTTPClientPool:
+    """
+    Пул httpx.Client, через который API клиенты получают общее подключение к сервису.
+
+    Вместо отдельного httpx.Client (и отдельного набора TCP-соединений) на каждый API клиент
+    все API клиенты в пределах scope работают через один клиент с лимитами из config.
+    Во время теста загрузку пула снимает монитор насыщения (см. LocustSaturationMonitor), а по окончании
+    пул пишет в лог пиковые значения, по которым подбираются max_connections и max_keepalive_connections.
+    """
+
+    def __init__(self, config: HTTPClientPoolConfig, build_client: Callable[[Limits], Client]):
+        """
+        :param config: Настройки пула.
+        :param build_client: Фабрика httpx.Client с переданными лимитами (base_url, хуки и т.д.).
+        """
+        self.config = config
+        self.build_client = build_client
+        self.clients: list[Client] = []
+        self.environment: Environment | None = None
+
+        self.wait_total = 0.0
+        self.wait_count = 0
+        self._wait_sampled = (0.0, 0)
+        self._lock = threading.Lock()
+
+    def get_client(self) -> Client:
+        """
+        Возвращает клиент для нового пользователя пула: общий для PROCESS, новый для VU.
+
+        :return: Объект httpx.Client.
+        """
+        with self._lock:
+            if self.config.scope == HTTPClientPoolScope.PROCESS and self.clients:
+                return self.clients[0]
+
+            client = self.build_client(self.config.get_limits())
+            self.clients.append(client)
+            return client
+
+    def release(self, client: Client) -> None:
+        """
+        Возвращает клиент пулу, когда виртуальный пользователь останавливается.
+        Клиент области VU закрывается, общий клиент области PROCESS остаётся открытым.
+
+        :param client: Клиент, полученный через get_client.
+        """
+        if self.config.scope != HTTPClientPoolScope.VU:
+            return
+
+        with self._lock:
+            if client in self.clients:
+                self.clients.remove(client)
+
+        client.close()
+
+    def close(self) -> None:
+        """
+        Закрывает все клиенты пула и отключает учёт времени ожидания соединения (см. attach).
+        """
+        if self.environment is not None:
+            self.environment.events.request.remove_listener(self.on_request)
+            self.environment = None
+
+        with self._lock:
+            for client in self.clients:
+                client.close()
+            self.clients.clear()
+
+    def on_request(self, request_type: str, name: str, response_time: float, **kwargs) -> None:
+        """
+        Слушатель `environment.events.request`: накапливает время ожидания соединения из фаз pool
+        (см. locust_phase_request_event_hook и locust_pool_wait_request_event_hook).
+        """
+        if request_type == LOCUST_PHASE_REQUEST_TYPE and name.endswith(f"[{HTTPPhase.POOL}]"):
+            self.wait_total += response_time
+            self.wait_count += 1
+
+    def get_wait_ms(self) -> float:
+        """
+        :return: Среднее время ожидания соединения по запросам, завершённым с предыдущего вызова, мс.
+        """
+        previous_total, previous_count = self._wait_sampled
+        self._wait_sampled = (self.wait_total, self.wait_count)
+        if self.wait_count <= previous_count:
+            return 0.0
+
+        return round((self.wait_total - previous_total) / (self.wait_count - previous_count), 3)
+
+    def get_usage(self) -> HTTPClientPoolUsage:
+        """
+        Снимает текущую загрузку пула.
+
+        httpcore не даёт публичного счётчика ожидающих запросов, поэтому он считается
+        так же, как в ConnectionPool.__repr__ — по очереди запросов пула.
+
+        :return: Суммарная загрузка всех клиентов пула.
+        """
+        usage = HTTPClientPoolUsage(wait_ms=self.get_wait_ms())
+        for client in list(self.clients):
+            pool = getattr(client._transport, "_pool", None)
+            if pool is None:
+                continue
+
+            usage.clients += 1
+            for connection in pool.connections:
+                if connection.is_idle():
+                    usage.idle_connections += 1
+                else:
+                    usage.active_connections += 1
+            for request in list(pool._requests):
+                if request.is_queued():
+                    usage.queued_requests += 1
+                else:
+                    usage.active_requests += 1
+
+        return usage
+
+    def log_summary(self, peak: HTTPClientPoolUsage, samples: int) -> None:
+        """
+        Пишет в лог пиковую загрузку пула за тест.
+
+        :param peak: Пиковые значения загрузки.
+        :param samples: Сколько раз снималась загрузка.
+        """
+        logger.info(
+            f"HTTP client pool ({self.config.scope}, {self.config.backend}, "
+            f"max {self.config.max_connections} connections, "
+            f"{self.config.max_keepalive_connections} keep-alive) peak usage over {samples} samples: "
+            f"{peak.clients} clients, {peak.active_connections} active and "
+            f"{peak.idle_connections} idle connections, {peak.queued_requests} queued requests, "
+            f"{peak.wait_ms} ms average connection wait"
+        )
+        # Запрос ненадолго попадает в очередь и при свободном пуле, поэтому пул считается малым,
+        # только если очередь была при исчерпанном лимите соединений
+        saturated = peak.active_connections >= self.config.max_connections * max(peak.clients, 1)
+        if peak.queued_requests > 0 and saturated:
+            logger.warning("Requests waited for a free connection: consider raising max_connections")
+
+    def attach(self, environment: Environment) -> None:
+        """
+        Подключает пул к монитору насыщения процесса Locust: загрузка пула снимается, пока идёт тест,
+        пишется в лог и отдаётся в /saturation, а итоги пишутся в лог по окончании теста.
+
+        Время ожидания соединения берётся из фаз pool, если они записываются (trace_phases или trace_pool_wait);
+        слушатель событий запросов добавляется один раз и снимается в close.
+
+        :param environment: Окружение Locust.
+        """
+        if self.environment is None and (self.config.trace_phases or self.config.trace_pool_wait):
+            self.environment = environment
+            environment.events.request.add_listener(self.on_request)
+
+        get_locust_saturation_monitor(environment).register(
+            "HTTP client pool",
+            self,
+            interval=self.config.sample_interval
+        )
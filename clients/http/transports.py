@@ -0,0 +1,129 @@
+import threading
+from enum import StrEnum
+
+from geventhttpclient import HTTPClient as GeventClient, HTTPParseError
+from geventhttpclient.connectionpool import ConnectionPool
+from httpx import (
+    BaseTransport,
+    ConnectError,
+    HTTPTransport,
+    Limits,
+    NetworkError,
+    ReadTimeout,
+    RemoteProtocolError,
+    Request,
+    Response
+)
+
+# Сколько соединений держит geventhttpclient на один адрес, если в Limits не задан max_connections
+GEVENT_DEFAULT_CONCURRENCY = 100
+
+
+class HTTPClientBackend(StrEnum):
+    """
+    Транспорт, через который httpx.Client отправляет запросы.
+
+    HTTPX — стандартный транспорт httpx (httpcore).
+    GEVENT — транспорт на geventhttpclient: нативные для gevent сокеты и разбор ответа на C (llhttp).
+    """
+    HTTPX = "HTTPX"
+    GEVENT = "GEVENT"
+
+
+class GeventHTTPTransport(BaseTransport):
+    """
+    Транспорт httpx поверх geventhttpclient.
+
+    Заменяется только отправка запроса и чтение ответа: построение запроса, event hooks (а значит, и отправка
+    метрик в Locust) и объект httpx.Response остаются прежними, поэтому API клиенты не замечают смены транспорта.
+
+    На каждый адрес (scheme, host, port) создаётся свой geventhttpclient.HTTPClient с пулом
+    из limits.max_connections соединений. Таймауты берутся из первого запроса к адресу (timeout httpx.Client).
+    Поддерживается только HTTP/1.1; тело ответа читается целиком внутри транспорта.
+    """
+
+    def __init__(self, limits: Limits | None = None):
+        """
+        :param limits: Лимиты httpx; используется только max_connections.
+        """
+        self.concurrency = (limits and limits.max_connections) or GEVENT_DEFAULT_CONCURRENCY
+        self.clients: dict[tuple[str, str, int | None], GeventClient] = {}
+
+        self._lock = threading.Lock()
+
+    def get_client(self, request: Request) -> GeventClient:
+        """
+        Возвращает клиент geventhttpclient для адреса запроса, создавая его при первом обращении.
+
+        :param request: Запрос httpx.
+        :return: Клиент geventhttpclient.
+        """
+        key = (request.url.scheme, request.url.host, request.url.port)
+        client = self.clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            if key not in self.clients:
+                timeout = request.extensions.get("timeout", {})
+                self.clients[key] = GeventClient(
+                    request.url.host,
+                    port=request.url.port,
+                    ssl=request.url.scheme == "https",
+                    concurrency=self.concurrency,
+                    connection_timeout=timeout.get("connect") or ConnectionPool.DEFAULT_CONNECTION_TIMEOUT,
+                    network_timeout=timeout.get("read") or ConnectionPool.DEFAULT_NETWORK_TIMEOUT
+                )
+            return self.clients[key]
+
+    def handle_request(self, request: Request) -> Response:
+        client = self.get_client(request)
+
+        try:
+            response = client.request(
+                request.method,
+                request.url.raw_path.decode("ascii"),
+                body=request.read(),
+                headers=request.headers.multi_items()
+            )
+            with response:
+                content = response.read()
+        except TimeoutError as error:
+            raise ReadTimeout(str(error), request=request) from error
+        except ConnectionRefusedError as error:
+            raise ConnectError(str(error), request=request) from error
+        except HTTPParseError as error:
+            raise RemoteProtocolError(str(error), request=request) from error
+        except OSError as error:
+            raise NetworkError(str(error), request=request) from error
+
+        return Response(
+            status_code=response.status_code,
+            headers=list(response.items()),
+            content=content,
+            extensions={"http_version": b"HTTP/1.1"}
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            for client in self.clients.values():
+                client.close()
+            self.clients.clear()
+
+
+def build_http_transport(backend: HTTPClientBackend, limits: Limits | None = None) -> BaseTransport:
+    """
+    Фабричная функция для создания транспорта httpx.Client.
+
+    Лимиты передаются в транспорт, а не в httpx.Client: при явно заданном транспорте
+    httpx.Client свои limits игнорирует.
+
+    :param backend: Транспорт.
+    :param limits: Лимиты соединений (по умолчанию — лимиты httpx по умолчанию).
+    :return: Транспорт для параметра transport у httpx.Client.
+    """
+    match backend:
+        case HTTPClientBackend.GEVENT:
+            return GeventHTTPTransport(limits=limits)
+        case _:
+            return HTTPTransport() if limits is None else HTTPTransport(limits=limits)
@@ -1,19 +1,31 @@
 from locust import task, events
 from locust.env import Environment
+from locust.runners import MasterRunner
 
+from clients.http.gateway.client import setup_gateway_locust_http_pool
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from clients.http.pool import HTTPClientPoolConfig
+from seeds.dispenser import SeedUsersDispenser, SeedUsersExhaustionPolicy
+from seeds.distributed import setup_seeds
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
 from seeds.schema.result import SeedUserResult
+from seeds.store import SeedsStore
 from tools.locust.user import LocustBaseUser
 
 
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
+    def on_load(seeds: SeedsStore):
+        # Каждый воркер держит только свою часть пользователей, поэтому раздаёт её целиком
+        environment.seeds_dispenser = SeedUsersDispenser(seeds, policy=SeedUsersExhaustionPolicy.RECYCLE)
 
-    seeds_scenario.build()
+    setup_seeds(environment, ExistingUserGetDocumentsSeedsScenario(), on_load=on_load)
+    # Мастер не запускает пользователей: пул ему не нужен и показывал бы в /saturation пустую загрузку
+    if isinstance(environment.runner, MasterRunner):
+        return
 
-    environment.seeds = seeds_scenario.load()
+    # Документы — самые большие ответы gateway: время скачивания тела смотрим отдельно от обработки запроса
+    setup_gateway_locust_http_pool(environment, HTTPClientPoolConfig(trace_phases=True))
 
 
 class GetDocumentsTaskSet(GatewayHTTPTaskSet):
@@ -22,7 +34,12 @@ class GetDocumentsTaskSet(GatewayHTTPTaskSet):
     def on_start(self) -> None:
         super().on_start()
 
-        self.seed_user = self.user.environment.seeds.get_next_user()
+        self.seed_user = self.user.environment.seeds_dispenser.checkout()
+
+    def on_stop(self) -> None:
+        super().on_stop()
+
+        self.user.environment.seeds_dispenser.release(self.seed_user)
 
     @task(1)
     def get_accounts(self):
@@ -2,8 +2,10 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.distributed import setup_seeds
 from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.locust.cohort import use_locust_cohort, get_size_cohort
 from tools.locust.user import LocustBaseUser
 
 
@@ -11,26 +13,29 @@ from tools.locust.user import LocustBaseUser
 def init(environment: Environment, **kwargs):
     """
     Хук инициализации теста: выполнение сидинга данных.
-    Создаёт 300 пользователей с кредитным счётом и историей операций.
+    Создаёт 300 пользователей с кредитным счётом и историей операций разной длины.
     """
-    seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()
-    environment.seeds = seeds_scenario.load()
+    setup_seeds(environment, ExistingUserGetOperationsSeedsScenario())
 
 
 class GetOperationsTaskSet(GatewayHTTPTaskSet):
     """
     TaskSet для сценария получения информации об операциях существующим пользователем.
     Включает просмотр списка счетов, списка операций и статистики.
+
+    Запросы операций помечаются когортой по длине истории счёта, поэтому в статистике Locust
+    у каждой корзины размера своя строка и видна зависимость задержки от объёма данных.
     """
     seed_user: SeedUserResult
+    cohort: str
 
     def on_start(self) -> None:
         """
-        Выбор случайного пользователя из сгенерированных данных.
+        Выбор случайного пользователя из сгенерированных данных и когорты по длине истории его счёта.
         """
         super().on_start()
         self.seed_user = self.user.environment.seeds.get_random_user()
+        self.cohort = get_size_cohort("ops", self.seed_user.credit_card_accounts[0].operations_count)
 
     @task(1)
     def get_accounts(self) -> None:
@@ -44,18 +49,20 @@ class GetOperationsTaskSet(GatewayHTTPTaskSet):
         """
         Задача: получение списка операций по счёту.
         """
-        self.operations_gateway_client.get_operations(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
-        )
+        with use_locust_cohort(self.cohort):
+            self.operations_gateway_client.get_operations(
+                account_id=self.seed_user.credit_card_accounts[0].account_id
+            )
 
     @task(2)
     def get_operations_summary(self) -> None:
         """
         Задача: получение статистики по операциям для счёта.
         """
-        self.operations_gateway_client.get_operations_summary(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
-        )
+        with use_locust_cohort(self.cohort):
+            self.operations_gateway_client.get_operations_summary(
+                account_id=self.seed_user.credit_card_accounts[0].account_id
+            )
 
 
 class GetOperationsScenarioUser(LocustBaseUser):
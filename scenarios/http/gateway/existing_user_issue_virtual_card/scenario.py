@@ -2,6 +2,7 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.distributed import setup_seeds
 from seeds.scenarios.existing_user_issue_virtual_card import ExistingUserIssueVirtualCardSeedsScenario
 from seeds.schema.result import SeedUserResult
 from tools.locust.user import LocustBaseUser
@@ -13,9 +14,7 @@ def init(environment: Environment, **kwargs):
     Хук инициализации теста: выполнение сидинга данных.
     Создаёт 300 пользователей с дебетовым счётом.
     """
-    seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
-    seeds_scenario.build()
-    environment.seeds = seeds_scenario.load()
+    setup_seeds(environment, ExistingUserIssueVirtualCardSeedsScenario())
 
 
 class IssueVirtualCardTaskSet(GatewayHTTPTaskSet):
@@ -2,46 +2,51 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.distributed import setup_seeds
+from seeds.query import SeedsQuery, SeedCardMatch, SeedCardType, SeedAccountType
 from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
-from seeds.schema.result import SeedUserResult
+from seeds.store import SeedsStore
 from tools.locust.user import LocustBaseUser
 
 
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    seeds_scenario = ExistingUserMakePurchaseOperationSeedsScenario()
-    seeds_scenario.build()
-    environment.seeds = seeds_scenario.load()
+    def on_load(seeds: SeedsStore):
+        environment.seeds_query = SeedsQuery(seeds)
+
+    setup_seeds(environment, ExistingUserMakePurchaseOperationSeedsScenario(), on_load=on_load)
 
 
 class MakePurchaseOperationTaskSet(GatewayHTTPTaskSet):
-    seed_user: SeedUserResult
+    seed_card: SeedCardMatch
 
     def on_start(self) -> None:
         super().on_start()
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        self.seed_card = self.user.environment.seeds_query.get_random_card(
+            SeedCardType.PHYSICAL, account_type=SeedAccountType.CREDIT_CARD
+        )
 
     @task(1)
     def make_purchase_operation(self):
         self.operations_gateway_client.make_purchase_operation(
-            card_id=self.seed_user.credit_card_accounts[0].physical_cards[0].card_id,
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            card_id=self.seed_card.card.card_id,
+            account_id=self.seed_card.account.account_id
         )
 
     @task(2)
     def get_accounts(self):
-        self.accounts_gateway_client.get_accounts(user_id=self.seed_user.user_id)
+        self.accounts_gateway_client.get_accounts(user_id=self.seed_card.user.user_id)
 
     @task(2)
     def get_operations(self):
         self.operations_gateway_client.get_operations(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=self.seed_card.account.account_id
         )
 
     @task(2)
     def get_operations_summary(self):
         self.operations_gateway_client.get_operations_summary(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=self.seed_card.account.account_id
         )
 
 
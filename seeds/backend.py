@@ -0,0 +1,51 @@
+from enum import StrEnum
+
+from seeds.builder import SeedsBuilder, build_grpc_seeds_builder, build_http_seeds_builder, build_services_seeds_builder
+from seeds.pipeline import build_pipeline_grpc_seeds_builder
+from seeds.throttle import SeedsThrottleConfig
+
+
+class SeedsBackend(StrEnum):
+    """
+    Способ создания сидинговых данных.
+
+    GRPC — через gRPC gateway.
+    GRPC_PIPELINE — через gRPC gateway конвейером из .future()-вызовов на одном канале (см. SeedsPipelineBuilder).
+    HTTP — через HTTP gateway.
+    SERVICES — напрямую через внутренние gRPC-сервисы, минуя gateway (см. SeedsServicesBuilder).
+    """
+    GRPC = "GRPC"
+    GRPC_PIPELINE = "GRPC_PIPELINE"
+    HTTP = "HTTP"
+    SERVICES = "SERVICES"
+
+
+def build_seeds_builder(
+        backend: SeedsBackend,
+        workers: int = 1,
+        entity_workers: int = 1,
+        max_in_flight: int = 100,
+        throttle: SeedsThrottleConfig | None = None
+) -> SeedsBuilder:
+    """
+    Фабрика для создания сидера с заданным способом создания данных.
+
+    Args:
+        backend: Способ создания данных
+        workers: Количество пользователей, создаваемых параллельно
+        entity_workers: Количество дочерних сущностей (карт, операций), создаваемых параллельно
+        max_in_flight: Максимальное количество вызовов в полёте для GRPC_PIPELINE
+        throttle: Настройки адаптивного ограничения нагрузки (None — без ограничения)
+
+    Returns:
+        SeedsBuilder: Инициализированный сидер
+    """
+    match backend:
+        case SeedsBackend.GRPC_PIPELINE:
+            return build_pipeline_grpc_seeds_builder(max_in_flight=max_in_flight, throttle=throttle)
+        case SeedsBackend.HTTP:
+            return build_http_seeds_builder(workers=workers, entity_workers=entity_workers, throttle=throttle)
+        case SeedsBackend.SERVICES:
+            return build_services_seeds_builder(workers=workers, entity_workers=entity_workers, throttle=throttle)
+        case _:
+            return build_grpc_seeds_builder(workers=workers, entity_workers=entity_workers, throttle=throttle)
@@ -1,11 +1,26 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar
+
 from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
 from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
 from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
+from clients.grpc.gateway.client import GATEWAY_GRPC_ADDRESS
 from clients.grpc.gateway.users.client import build_users_gateway_grpc_client, UsersGatewayGRPCClient
+from clients.grpc.services.accounts.client import build_accounts_service_grpc_client, AccountsServiceGRPCClient
+from clients.grpc.services.cards.client import build_cards_service_grpc_client, CardsServiceGRPCClient
+from clients.grpc.services.operations.client import (
+    build_operations_service_grpc_client,
+    OperationsServiceGRPCClient
+)
+from clients.grpc.services.users.client import build_users_service_grpc_client, UsersServiceGRPCClient
 from clients.http.gateway.accounts.client import build_accounts_gateway_http_client, AccountsGatewayHTTPClient
 from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
+from clients.http.gateway.client import GATEWAY_HTTP_URL
 from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
 from clients.http.gateway.users.client import build_users_gateway_http_client, UsersGatewayHTTPClient
+from contracts.services.accounts.account_pb2 import AccountType
+from contracts.services.cards.card_pb2 import CardType
+from contracts.services.operations.operation_pb2 import OperationType
 from seeds.schema.plan import (
     SeedsPlan,
     SeedUsersPlan,
@@ -18,6 +33,11 @@ from seeds.schema.result import (
     SeedAccountResult,
     SeedOperationResult
 )
+from seeds.progress import SeedsProgress
+from seeds.tasks import SeedsTasks
+from seeds.throttle import SeedsThrottle, SeedsThrottleConfig
+
+T = TypeVar("T")
 
 
 class SeedsBuilder:
@@ -30,6 +50,11 @@ class SeedsBuilder:
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        workers: Количество пользователей, которые создаются параллельно.
+            При workers=1 пользователи создаются строго последовательно.
+        tasks: Исполнитель дочерних сущностей (карт, операций, простых счетов) внутри одного пользователя.
+        gateway: Адрес gateway, в который пишет сидер. Сохраняется в манифест дампа.
+        throttle: Адаптивный ограничитель вызовов (см. SeedsThrottle). None — без ограничения.
     """
 
     def __init__(
@@ -37,12 +62,42 @@ class SeedsBuilder:
             users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
             cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
             accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            workers: int = 1,
+            entity_workers: int = 1,
+            gateway: str = "",
+            throttle: SeedsThrottle | None = None
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.workers = max(workers, 1)
+        self.tasks = SeedsTasks(workers=entity_workers)
+        self.gateway = gateway
+        self.throttle = throttle
+
+    def call(self, func: Callable[..., T], *args, idempotent: bool = False, **kwargs) -> T:
+        """
+        Выполняет вызов клиента. Все «листовые» шаги сидинга проходят через этот метод,
+        поэтому при заданном throttle он ограничивает и подстраивает нагрузку на систему.
+
+        Упавшие Create- и Make-вызовы throttle повторяет, только если сервис гарантированно
+        не начал их обрабатывать, а чтение (idempotent) — при любой ошибке.
+
+        Args:
+            func: Метод клиента
+            *args: Позиционные аргументы метода
+            idempotent: True, если вызов только читает данные
+            **kwargs: Именованные аргументы метода
+
+        Returns:
+            Ответ клиента
+        """
+        if self.throttle is None:
+            return func(*args, **kwargs)
+
+        return self.throttle.call(func, *args, idempotent=idempotent, **kwargs)
 
     def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
@@ -55,7 +110,8 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Результат с ID выпущенной карты
         """
-        response = self.cards_gateway_client.issue_physical_card(
+        response = self.call(
+            self.cards_gateway_client.issue_physical_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -72,7 +128,8 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Результат с ID выпущенной карты
         """
-        response = self.cards_gateway_client.issue_virtual_card(
+        response = self.call(
+            self.cards_gateway_client.issue_virtual_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -89,7 +146,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_top_up_operation(
+        response = self.call(
+            self.operations_gateway_client.make_top_up_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -106,7 +164,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_purchase_operation(
+        response = self.call(
+            self.operations_gateway_client.make_purchase_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -123,7 +182,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_transfer_operation(
+        response = self.call(
+            self.operations_gateway_client.make_transfer_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -140,7 +200,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_cash_withdrawal_operation(
+        response = self.call(
+            self.operations_gateway_client.make_cash_withdrawal_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -156,7 +217,7 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID созданного счёта
         """
-        response = self.accounts_gateway_client.open_savings_account(user_id=user_id)
+        response = self.call(self.accounts_gateway_client.open_savings_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
     def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
@@ -169,9 +230,213 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID созданного счёта
         """
-        response = self.accounts_gateway_client.open_deposit_account(user_id=user_id)
+        response = self.call(self.accounts_gateway_client.open_deposit_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
+    def open_debit_card_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Открывает дебетовый счёт для пользователя вместе с первой картой.
+
+        Args:
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID созданного счёта и его первой карты
+        """
+        response = self.call(self.accounts_gateway_client.open_debit_card_account, user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id, card_id=response.account.cards[0].id)
+
+    def open_credit_card_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Открывает кредитный счёт для пользователя вместе с первой картой.
+
+        Args:
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID созданного счёта и его первой карты
+        """
+        response = self.call(self.accounts_gateway_client.open_credit_card_account, user_id=user_id)
+        return SeedAccountResult(account_id=response.account.id, card_id=response.account.cards[0].id)
+
+    def create_user_result(self) -> SeedUserResult:
+        """
+        Создаёт пользователя без счетов.
+
+        Returns:
+            SeedUserResult: Результат с ID созданного пользователя
+        """
+        response = self.call(self.users_gateway_client.create_user)
+        return SeedUserResult(user_id=response.user.id)
+
+    def get_account_card_id(self, user_id: str, account_id: str) -> str:
+        """
+        Находит первую карту уже существующего счёта.
+
+        Нужна для дампов, созданных до того, как SeedAccountResult начал хранить card_id.
+
+        Args:
+            user_id: Идентификатор пользователя
+            account_id: Идентификатор счёта
+
+        Returns:
+            str: Идентификатор первой карты счёта
+        """
+        response = self.call(self.accounts_gateway_client.get_accounts, user_id=user_id, idempotent=True)
+        account = next(account for account in response.accounts if account.id == account_id)
+        return account.cards[0].id
+
+    @staticmethod
+    def get_card_account_missing(plan: SeedAccountsPlan, account: SeedAccountResult) -> dict[str, int]:
+        """
+        Считает, сколько дочерних сущностей карточного счёта не хватает до плана.
+        Если количество в плане задано распределением, оно выбирается по ID счёта и полю
+        (см. SeedCountPlan.get_count), поэтому при повторном вызове для того же счёта не меняется.
+
+        Args:
+            plan: План создания карточного счёта
+            account: Уже открытый счёт (возможно, без карт и операций)
+
+        Returns:
+            dict[str, int]: Количество недостающих сущностей по названию поля SeedAccountResult
+        """
+        return {
+            field: getattr(plan, field).get_count(f"{account.account_id}:{field}") - len(getattr(account, field))
+            for field in (
+                "physical_cards",
+                "virtual_cards",
+                "top_up_operations",
+                "purchase_operations",
+                "transfer_operations",
+                "cash_withdrawal_operations"
+            )
+        }
+
+    @staticmethod
+    def get_user_missing(plan: SeedUsersPlan, user: SeedUserResult) -> dict[str, int]:
+        """
+        Считает, сколько счетов каждого типа не хватает пользователю до плана.
+        Количество, заданное распределением, выбирается по ID пользователя и полю (см. SeedCountPlan.get_count).
+
+        Args:
+            plan: План генерации пользователя
+            user: Уже созданный пользователь (возможно, без счетов)
+
+        Returns:
+            dict[str, int]: Количество недостающих счетов по названию поля SeedUserResult
+        """
+        return {
+            field: getattr(plan, field).get_count(f"{user.user_id}:{field}") - len(getattr(user, field))
+            for field in ("savings_accounts", "deposit_accounts", "debit_card_accounts", "credit_card_accounts")
+        }
+
+    def submit_card_account_extension(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            account: SeedAccountResult
+    ) -> tuple[SeedAccountResult, dict[str, list[Future]]]:
+        """
+        Запускает создание дочерних сущностей карточного счёта, которых не хватает до плана:
+        - выпуск физических и виртуальных карт
+        - операции пополнения, покупки, перевода и снятия наличных
+
+        Все дочерние сущности зависят только от самого счёта и его первой карты,
+        поэтому запускаются одновременно и выполняются параллельно (см. SeedsTasks).
+        Результаты собирает gather_card_account_extension.
+
+        Args:
+            plan: План создания карточного счёта
+            user_id: Идентификатор пользователя
+            account: Уже открытый счёт (возможно, без карт и операций)
+
+        Returns:
+            tuple[SeedAccountResult, dict[str, list[Future]]]: Счёт с ID первой карты
+                и Future по названию поля SeedAccountResult
+        """
+        missing = self.get_card_account_missing(plan=plan, account=account)
+        if all(count <= 0 for count in missing.values()):
+            return account, {}
+
+        account_id = account.account_id
+        card_id = account.card_id or self.get_account_card_id(user_id=user_id, account_id=account_id)
+
+        return account.model_copy(update={"card_id": card_id}), {
+            "physical_cards": self.tasks.submit_many(
+                self.build_physical_card_result, missing["physical_cards"], user_id=user_id, account_id=account_id
+            ),
+            "virtual_cards": self.tasks.submit_many(
+                self.build_virtual_card_result, missing["virtual_cards"], user_id=user_id, account_id=account_id
+            ),
+            "top_up_operations": self.tasks.submit_many(
+                self.build_top_up_operation_result,
+                missing["top_up_operations"],
+                card_id=card_id,
+                account_id=account_id
+            ),
+            "purchase_operations": self.tasks.submit_many(
+                self.build_purchase_operation_result,
+                missing["purchase_operations"],
+                card_id=card_id,
+                account_id=account_id
+            ),
+            "transfer_operations": self.tasks.submit_many(
+                self.build_transfer_operation_result,
+                missing["transfer_operations"],
+                card_id=card_id,
+                account_id=account_id
+            ),
+            "cash_withdrawal_operations": self.tasks.submit_many(
+                self.build_cash_withdrawal_operation_result,
+                missing["cash_withdrawal_operations"],
+                card_id=card_id,
+                account_id=account_id
+            ),
+        }
+
+    def gather_card_account_extension(
+            self,
+            account: SeedAccountResult,
+            futures: dict[str, list[Future]]
+    ) -> SeedAccountResult:
+        """
+        Дописывает в карточный счёт карты и операции, созданные submit_card_account_extension.
+        Уже созданные сущности сохраняются, новые добавляются в конец списков.
+
+        Args:
+            account: Карточный счёт
+            futures: Future, полученные из submit_card_account_extension
+
+        Returns:
+            SeedAccountResult: Счёт с картами и операциями в объёме плана
+        """
+        return account.model_copy(update={
+            field: getattr(account, field) + self.tasks.gather(field_futures)
+            for field, field_futures in futures.items()
+        })
+
+    def extend_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            account: SeedAccountResult
+    ) -> SeedAccountResult:
+        """
+        Досоздаёт дочерние сущности карточного счёта, которых не хватает до плана,
+        и дожидается их создания (см. submit_card_account_extension).
+
+        Args:
+            plan: План создания карточного счёта
+            user_id: Идентификатор пользователя
+            account: Уже открытый счёт (возможно, без карт и операций)
+
+        Returns:
+            SeedAccountResult: Счёт с картами и операциями в объёме плана
+        """
+        return self.gather_card_account_extension(
+            *self.submit_card_account_extension(plan=plan, user_id=user_id, account=account)
+        )
+
     def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
         """
         Открывает дебетовый счёт для пользователя и при необходимости:
@@ -188,36 +453,10 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
         """
-        response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ]
+        return self.extend_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            account=self.open_debit_card_account_result(user_id=user_id)
         )
 
     def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
@@ -236,35 +475,71 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID счёта и деталями операций
         """
-        response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
+        return self.extend_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            account=self.open_credit_card_account_result(user_id=user_id)
+        )
 
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
+    def extend_user(self, plan: SeedUsersPlan, user: SeedUserResult) -> SeedUserResult:
+        """
+        Досоздаёт счета пользователя, которых не хватает до плана, и дополняет уже существующие
+        карточные счета недостающими картами и операциями.
+
+        Все счета пользователя открываются параллельно. Как только открыты карточные счета,
+        разом запускаются дочерние сущности всех карточных счетов (см. submit_card_account_extension).
+        Счёт и его дочерние сущности — разные уровни графа: пул задач выполняет только листовые шаги,
+        а дожидается их вызывающий поток, поэтому пул не блокируется.
+
+        Args:
+            plan: План генерации пользователя
+            user: Уже созданный пользователь (возможно, без счетов)
+
+        Returns:
+            SeedUserResult: Пользователь со счетами, картами и операциями в объёме плана
+        """
+        user_id = user.user_id
+        missing = self.get_user_missing(plan=plan, user=user)
+
+        savings_accounts = self.tasks.submit_many(
+            self.build_savings_account_result,
+            missing["savings_accounts"],
+            user_id=user_id
+        )
+        deposit_accounts = self.tasks.submit_many(
+            self.build_deposit_account_result,
+            missing["deposit_accounts"],
+            user_id=user_id
+        )
+        opened_debit_card_accounts = self.tasks.submit_many(
+            self.open_debit_card_account_result,
+            missing["debit_card_accounts"],
+            user_id=user_id
+        )
+        opened_credit_card_accounts = self.tasks.submit_many(
+            self.open_credit_card_account_result,
+            missing["credit_card_accounts"],
+            user_id=user_id
+        )
+
+        debit_card_accounts = [
+            self.submit_card_account_extension(plan=plan.debit_card_accounts, user_id=user_id, account=account)
+            for account in user.debit_card_accounts + self.tasks.gather(opened_debit_card_accounts)
+        ]
+        credit_card_accounts = [
+            self.submit_card_account_extension(plan=plan.credit_card_accounts, user_id=user_id, account=account)
+            for account in user.credit_card_accounts + self.tasks.gather(opened_credit_card_accounts)
+        ]
+
+        return SeedUserResult(
+            user_id=user_id,
+            savings_accounts=user.savings_accounts + self.tasks.gather(savings_accounts),
+            deposit_accounts=user.deposit_accounts + self.tasks.gather(deposit_accounts),
+            debit_card_accounts=[
+                self.gather_card_account_extension(*extension) for extension in debit_card_accounts
             ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
+            credit_card_accounts=[
+                self.gather_card_account_extension(*extension) for extension in credit_card_accounts
             ]
         )
 
@@ -280,47 +555,364 @@ class SeedsBuilder:
         Returns:
             SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
         """
-        response = self.users_gateway_client.create_user()
-
-        return SeedUserResult(
-            user_id=response.user.id,
-            savings_accounts=[
-                self.build_savings_account_result(user_id=response.user.id)
-                for _ in range(plan.savings_accounts.count)
-            ],
-            deposit_accounts=[
-                self.build_deposit_account_result(user_id=response.user.id)
-                for _ in range(plan.deposit_accounts.count)
-            ],
-            debit_card_accounts=[
-                self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.debit_card_accounts.count)
-            ],
-            credit_card_accounts=[
-                self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.credit_card_accounts.count)
-            ]
-        )
+        return self.extend_user(plan=plan, user=self.create_user_result())
 
-    def build(self, plan: SeedsPlan) -> SeedsResult:
+    def build(self, plan: SeedsPlan, on_user: Callable[[SeedUserResult], None] | None = None) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
         - создаёт указанное количество пользователей
         - каждому пользователю присваиваются счета, карты и операции
+        - при workers > 1 пользователи создаются параллельно, прогресс и скорость пишутся в лог
 
         Args:
             plan: Полный план генерации данных
+            on_user: Колбэк, вызываемый для каждого созданного пользователя (например, SeedsDumpWriter.write)
 
         Returns:
             SeedsResult: Результат с данными всех созданных пользователей
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        return self.extend(plan=plan, result=SeedsResult(), on_user=on_user)
+
+    def extend(
+            self,
+            plan: SeedsPlan,
+            result: SeedsResult,
+            on_user: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
+        """
+        Инкрементально дополняет уже существующий результат сидинга до плана:
+        - существующие пользователи получают недостающие счета, карты и операции
+        - недостающие пользователи создаются с нуля
+        - ничего из уже созданного не удаляется, даже если план стал меньше
+
+        Создаётся только разница между планом и результатом, поэтому рост датасета
+        стоит ровно столько, сколько стоят новые сущности.
+
+        Args:
+            plan: Полный план генерации данных
+            result: Ранее полученный результат сидинга
+            on_user: Колбэк, вызываемый для каждого созданного или изменённого пользователя
+                сразу после его обработки. Используется для записи чекпоинтов сидинга.
+
+        Returns:
+            SeedsResult: Результат, покрывающий план
+        """
+        existing_users = result.users[:plan.users.count]
+        missing_users = max(plan.users.count - len(result.users), 0)
+        progress = SeedsProgress(total=len(existing_users) + missing_users)
+
+        def extend_user(user: SeedUserResult | None) -> SeedUserResult:
+            if user is None:
+                extended_user = self.build_user(plan=plan.users)
+            else:
+                extended_user = self.extend_user(plan=plan.users, user=user)
+
+            if on_user is not None and extended_user != user:
+                on_user(extended_user)
 
+            progress.advance()
+            return extended_user
 
-def build_grpc_seeds_builder() -> SeedsBuilder:
+        targets = existing_users + [None] * missing_users
+        with self.tasks:
+            if self.workers == 1:
+                users = [extend_user(user) for user in targets]
+            else:
+                # Пользователи независимы друг от друга, поэтому их можно создавать параллельно.
+                # HTTP- и gRPC-клиенты потокобезопасны и переиспользуются всеми воркерами.
+                # executor.map сохраняет порядок, поэтому результат совпадает с последовательным режимом.
+                with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="seeds") as executor:
+                    users = list(executor.map(extend_user, targets))
+
+        progress.finish()
+        if self.throttle is not None:
+            self.throttle.log_summary()
+
+        return SeedsResult(users=users + result.users[plan.users.count:])
+
+
+class SeedsServicesBuilder(SeedsBuilder):
+    """
+    Сидер, создающий тот же граф сущностей через внутренние сервисы напрямую, минуя gateway.
+
+    Каждый вызов gateway разворачивается в несколько внутренних вызовов (проверки, чтение связанных
+    сущностей, пересчёт баланса и т.д.), а здесь на одну сущность приходится ровно один
+    Create-вызов во внутренний сервис. Поэтому большие датасеты строятся заметно дешевле.
+
+    Переопределяются только «листовые» шаги SeedsBuilder, поэтому параллелизм, инкрементальный
+    режим и чекпоинты работают так же, как и при сидинге через gateway.
+
+    Внутренние сервисы не выполняют побочных действий gateway: баланс счёта не пересчитывается
+    по операциям, а карточный счёт получает одну виртуальную карту, которая и становится его card_id.
+
+    Клиенты gateway остаются доступны, как и в SeedsBuilder: сущности, созданные внутренними
+    сервисами, видны через gateway, и через них же сидинг можно проверить или дополнить.
+
+    Attributes:
+        users_service_client: Клиент внутреннего UsersService
+        cards_service_client: Клиент внутреннего CardsService
+        accounts_service_client: Клиент внутреннего AccountsService
+        operations_service_client: Клиент внутреннего OperationsService
+    """
+
+    def __init__(
+            self,
+            users_service_client: UsersServiceGRPCClient,
+            cards_service_client: CardsServiceGRPCClient,
+            accounts_service_client: AccountsServiceGRPCClient,
+            operations_service_client: OperationsServiceGRPCClient,
+            users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
+            cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
+            accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            workers: int = 1,
+            entity_workers: int = 1,
+            gateway: str = "",
+            throttle: SeedsThrottle | None = None
+    ):
+        super().__init__(
+            users_gateway_client=users_gateway_client,
+            cards_gateway_client=cards_gateway_client,
+            accounts_gateway_client=accounts_gateway_client,
+            operations_gateway_client=operations_gateway_client,
+            workers=workers,
+            entity_workers=entity_workers,
+            gateway=gateway,
+            throttle=throttle
+        )
+        self.users_service_client = users_service_client
+        self.cards_service_client = cards_service_client
+        self.accounts_service_client = accounts_service_client
+        self.operations_service_client = operations_service_client
+
+    def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        """
+        Создаёт физическую карту во внутреннем CardsService.
+
+        Args:
+            user_id: Идентификатор пользователя (внутреннему CardsService не нужен)
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedCardResult: Результат с ID созданной карты
+        """
+        response = self.call(
+            self.cards_service_client.create_card,
+            account_id=account_id,
+            card_type=CardType.CARD_TYPE_PHYSICAL
+        )
+        return SeedCardResult(card_id=response.card.id)
+
+    def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+        """
+        Создаёт виртуальную карту во внутреннем CardsService.
+
+        Args:
+            user_id: Идентификатор пользователя (внутреннему CardsService не нужен)
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedCardResult: Результат с ID созданной карты
+        """
+        response = self.call(
+            self.cards_service_client.create_card,
+            account_id=account_id,
+            card_type=CardType.CARD_TYPE_VIRTUAL
+        )
+        return SeedCardResult(card_id=response.card.id)
+
+    def build_operation_result(
+            self,
+            card_id: str,
+            account_id: str,
+            operation_type: OperationType.ValueType
+    ) -> SeedOperationResult:
+        """
+        Создаёт операцию заданного типа во внутреннем OperationsService.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+            operation_type: Тип операции
+
+        Returns:
+            SeedOperationResult: Результат с ID созданной операции
+        """
+        response = self.call(
+            self.operations_service_client.create_operation,
+            card_id=card_id,
+            account_id=account_id,
+            operation_type=operation_type
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    def build_top_up_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Создаёт операцию пополнения во внутреннем OperationsService.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID созданной операции
+        """
+        return self.build_operation_result(card_id, account_id, OperationType.OPERATION_TYPE_TOP_UP)
+
+    def build_purchase_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Создаёт операцию покупки во внутреннем OperationsService.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID созданной операции
+        """
+        return self.build_operation_result(card_id, account_id, OperationType.OPERATION_TYPE_PURCHASE)
+
+    def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Создаёт операцию перевода во внутреннем OperationsService.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID созданной операции
+        """
+        return self.build_operation_result(card_id, account_id, OperationType.OPERATION_TYPE_TRANSFER)
+
+    def build_cash_withdrawal_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Создаёт операцию снятия наличных во внутреннем OperationsService.
+
+        Args:
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID созданной операции
+        """
+        return self.build_operation_result(card_id, account_id, OperationType.OPERATION_TYPE_CASH_WITHDRAWAL)
+
+    def build_savings_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Создаёт сберегательный счёт во внутреннем AccountsService.
+
+        Args:
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID созданного счёта
+        """
+        response = self.call(
+            self.accounts_service_client.create_account,
+            user_id=user_id,
+            account_type=AccountType.ACCOUNT_TYPE_SAVINGS
+        )
+        return SeedAccountResult(account_id=response.account.id)
+
+    def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Создаёт депозитный счёт во внутреннем AccountsService.
+
+        Args:
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID созданного счёта
+        """
+        response = self.call(
+            self.accounts_service_client.create_account,
+            user_id=user_id,
+            account_type=AccountType.ACCOUNT_TYPE_DEPOSIT
+        )
+        return SeedAccountResult(account_id=response.account.id)
+
+    def open_card_account_result(self, user_id: str, account_type: AccountType.ValueType) -> SeedAccountResult:
+        """
+        Создаёт карточный счёт и его первую (виртуальную) карту во внутренних сервисах.
+
+        Args:
+            user_id: Идентификатор пользователя
+            account_type: Тип счёта (дебетовый или кредитный)
+
+        Returns:
+            SeedAccountResult: Результат с ID созданного счёта и его первой карты
+        """
+        response = self.call(
+            self.accounts_service_client.create_account,
+            user_id=user_id,
+            account_type=account_type
+        )
+        card = self.build_virtual_card_result(user_id=user_id, account_id=response.account.id)
+        return SeedAccountResult(account_id=response.account.id, card_id=card.card_id)
+
+    def open_debit_card_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Создаёт дебетовый счёт и его первую (виртуальную) карту во внутренних сервисах.
+
+        Args:
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID созданного счёта и его первой карты
+        """
+        return self.open_card_account_result(user_id, AccountType.ACCOUNT_TYPE_DEBIT_CARD)
+
+    def open_credit_card_account_result(self, user_id: str) -> SeedAccountResult:
+        """
+        Создаёт кредитный счёт и его первую (виртуальную) карту во внутренних сервисах.
+
+        Args:
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID созданного счёта и его первой карты
+        """
+        return self.open_card_account_result(user_id, AccountType.ACCOUNT_TYPE_CREDIT_CARD)
+
+    def create_user_result(self) -> SeedUserResult:
+        """
+        Создаёт пользователя во внутреннем UsersService.
+
+        Returns:
+            SeedUserResult: Результат с ID созданного пользователя
+        """
+        response = self.call(self.users_service_client.create_user)
+        return SeedUserResult(user_id=response.user.id)
+
+    def get_account_card_id(self, user_id: str, account_id: str) -> str:
+        """
+        Возвращает ID первой карты счёта из внутреннего CardsService.
+
+        Args:
+            user_id: Идентификатор пользователя (внутреннему CardsService не нужен)
+            account_id: Идентификатор счёта
+
+        Returns:
+            str: ID первой карты счёта
+        """
+        response = self.call(self.cards_service_client.get_cards, account_id=account_id, idempotent=True)
+        return response.cards[0].id
+
+
+def build_grpc_seeds_builder(
+        workers: int = 1,
+        entity_workers: int = 1,
+        throttle: SeedsThrottleConfig | None = None
+) -> SeedsBuilder:
     """
     Фабрика для создания сидера с использованием gRPC-клиентов.
 
+    Args:
+        workers: Количество пользователей, создаваемых параллельно
+        entity_workers: Количество дочерних сущностей (карт, операций), создаваемых параллельно
+        throttle: Настройки адаптивного ограничения нагрузки (None — без ограничения)
+
     Returns:
         SeedsBuilder: Инициализированный сидер с gRPC-клиентами
     """
@@ -328,14 +920,27 @@ def build_grpc_seeds_builder() -> SeedsBuilder:
         users_gateway_client=build_users_gateway_grpc_client(),
         cards_gateway_client=build_cards_gateway_grpc_client(),
         accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        workers=workers,
+        entity_workers=entity_workers,
+        gateway=f"grpc://{GATEWAY_GRPC_ADDRESS}",
+        throttle=SeedsThrottle(throttle) if throttle else None
     )
 
 
-def build_http_seeds_builder():
+def build_http_seeds_builder(
+        workers: int = 1,
+        entity_workers: int = 1,
+        throttle: SeedsThrottleConfig | None = None
+) -> SeedsBuilder:
     """
     Фабрика для создания сидера с использованием HTTP-клиентов.
 
+    Args:
+        workers: Количество пользователей, создаваемых параллельно
+        entity_workers: Количество дочерних сущностей (карт, операций), создаваемых параллельно
+        throttle: Настройки адаптивного ограничения нагрузки (None — без ограничения)
+
     Returns:
         SeedsBuilder: Инициализированный сидер с HTTP-клиентами
     """
@@ -343,5 +948,43 @@ def build_http_seeds_builder():
         users_gateway_client=build_users_gateway_http_client(),
         cards_gateway_client=build_cards_gateway_http_client(),
         accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        operations_gateway_client=build_operations_gateway_http_client(),
+        workers=workers,
+        entity_workers=entity_workers,
+        gateway=GATEWAY_HTTP_URL,
+        throttle=SeedsThrottle(throttle) if throttle else None
+    )
+
+
+def build_services_seeds_builder(
+        workers: int = 1,
+        entity_workers: int = 1,
+        throttle: SeedsThrottleConfig | None = None
+) -> SeedsServicesBuilder:
+    """
+    Фабрика для создания сидера, работающего напрямую с внутренними сервисами.
+
+    Args:
+        workers: Количество пользователей, создаваемых параллельно
+        entity_workers: Количество дочерних сущностей (карт, операций), создаваемых параллельно
+        throttle: Настройки адаптивного ограничения нагрузки (None — без ограничения)
+
+    Returns:
+        SeedsServicesBuilder: Инициализированный сидер с gRPC-клиентами внутренних сервисов
+    """
+    return SeedsServicesBuilder(
+        users_service_client=build_users_service_grpc_client(),
+        cards_service_client=build_cards_service_grpc_client(),
+        accounts_service_client=build_accounts_service_grpc_client(),
+        operations_service_client=build_operations_service_grpc_client(),
+        users_gateway_client=build_users_gateway_grpc_client(),
+        cards_gateway_client=build_cards_gateway_grpc_client(),
+        accounts_gateway_client=build_accounts_gateway_grpc_client(),
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        workers=workers,
+        entity_workers=entity_workers,
+        # Сущности, созданные внутренними сервисами, видны через gateway, поэтому дамп
+        # привязывается к тому же gateway, через который его потом читает нагрузка
+        gateway=f"grpc://{GATEWAY_GRPC_ADDRESS}",
+        throttle=SeedsThrottle(throttle) if throttle else None
     )
@@ -0,0 +1,173 @@
+import queue
+import threading
+from enum import StrEnum
+from typing import Sequence
+
+from locust.env import Environment
+from locust.runners import WorkerRunner
+from pydantic import BaseModel
+
+from seeds.schema.result import SeedUserResult
+
+
+class SeedUsersExhaustionPolicy(StrEnum):
+    """
+    Что делать, когда «свежие» пользователи в пуле закончились.
+
+    FAIL — выбросить SeedUsersExhaustedError.
+    WRAP — начать раздачу пула заново с первого пользователя.
+    RECYCLE — выдать пользователя, ранее возвращённого через release, а если таких нет — FAIL.
+    BLOCK — ждать, пока какой-нибудь виртуальный пользователь вернёт своего через release.
+    """
+    FAIL = "FAIL"
+    WRAP = "WRAP"
+    RECYCLE = "RECYCLE"
+    BLOCK = "BLOCK"
+
+
+class SeedUsersExhaustedError(IndexError):
+    """
+    Пул сидинговых пользователей исчерпан.
+    Наследуется от IndexError для совместимости с прежним поведением SeedsResult.get_next_user.
+    """
+
+
+class SeedUsersPartition(BaseModel):
+    """
+    Часть пула пользователей, закреплённая за одним процессом Locust.
+
+    Процесс с индексом index получает пользователей index, index + count, index + 2 * count и т.д.,
+    поэтому части разных воркеров не пересекаются.
+
+    Attributes:
+        index (int): Индекс воркера (0 для локального запуска).
+        count (int): Общее количество воркеров (1 для локального запуска).
+    """
+    index: int = 0
+    count: int = 1
+
+
+def get_seed_users_partition(environment: Environment) -> SeedUsersPartition:
+    """
+    Определяет часть пула для текущего процесса Locust.
+
+    Для воркера распределённого запуска используется индекс, выданный мастером,
+    и количество воркеров из опции --expect-workers. Во всех остальных случаях процесс получает весь пул.
+
+    :param environment: Окружение Locust.
+    :return: Часть пула текущего процесса.
+    """
+    runner = environment.runner
+    workers = getattr(environment.parsed_options, "expect_workers", None) or 1
+
+    if isinstance(runner, WorkerRunner) and runner.worker_index >= 0 and workers > 1:
+        return SeedUsersPartition(index=runner.worker_index, count=workers)
+
+    return SeedUsersPartition()
+
+
+class SeedUsersDispenser:
+    """
+    Раздатчик сидинговых пользователей виртуальным пользователям Locust.
+
+    Выдача работает за O(1): пользователи не удаляются из пула, а выбираются по курсору.
+    Курсор защищён блокировкой, поэтому раздатчик безопасен и для gevent-гринлетов Locust,
+    и для обычных потоков. В распределённом запуске каждый воркер раздаёт только свою
+    непересекающуюся часть пула (см. SeedUsersPartition), поэтому два VU никогда не получат
+    одного и того же «свежего» пользователя.
+    """
+
+    def __init__(
+            self,
+            users: Sequence[SeedUserResult],
+            policy: SeedUsersExhaustionPolicy = SeedUsersExhaustionPolicy.FAIL,
+            partition: SeedUsersPartition | None = None,
+            environment: Environment | None = None,
+            timeout: float | None = None
+    ):
+        """
+        :param users: Пул пользователей — SeedsResult.users или SeedsStore.
+        :param policy: Политика при исчерпании пула.
+        :param partition: Часть пула текущего процесса. Если не задана, определяется по environment
+                          при первой выдаче (индекс воркера и количество воркеров известны не сразу).
+        :param environment: Окружение Locust для определения части пула.
+        :param timeout: Максимальное время ожидания в секундах для политики BLOCK (None — ждать бесконечно).
+        """
+        self.users = users
+        self.policy = policy
+        self.partition = partition
+        self.environment = environment
+        self.timeout = timeout
+
+        self.cursor = 0
+        self.released: queue.Queue[SeedUserResult] = queue.Queue()
+        self._lock = threading.Lock()
+
+    def _resolve_partition(self) -> SeedUsersPartition:
+        if self.partition is None:
+            self.partition = (
+                get_seed_users_partition(self.environment) if self.environment else SeedUsersPartition()
+            )
+
+        return self.partition
+
+    @property
+    def size(self) -> int:
+        """
+        :return: Количество пользователей в части пула текущего процесса.
+        """
+        partition = self._resolve_partition()
+        return max(len(self.users) - partition.index + partition.count - 1, 0) // partition.count
+
+    def _take_fresh(self) -> SeedUserResult | None:
+        partition = self._resolve_partition()
+
+        with self._lock:
+            size = self.size
+            if size == 0:
+                return None
+
+            if self.cursor >= size:
+                if self.policy != SeedUsersExhaustionPolicy.WRAP:
+                    return None
+                self.cursor = 0
+
+            position = self.cursor
+            self.cursor += 1
+
+        return self.users[partition.index + position * partition.count]
+
+    def checkout(self) -> SeedUserResult:
+        """
+        Выдаёт пользователя виртуальному пользователю Locust.
+
+        Сначала выдаются «свежие» пользователи, а после исчерпания пула действует политика policy.
+        :return: Сидинговый пользователь.
+        """
+        user = self._take_fresh()
+        if user is not None:
+            return user
+
+        try:
+            match self.policy:
+                case SeedUsersExhaustionPolicy.RECYCLE:
+                    return self.released.get_nowait()
+                case SeedUsersExhaustionPolicy.BLOCK:
+                    return self.released.get(timeout=self.timeout)
+        except queue.Empty:
+            pass
+
+        raise SeedUsersExhaustedError(
+            f"Seed users pool is exhausted: {self.size} users, partition {self._resolve_partition()}, "
+            f"policy {self.policy}"
+        )
+
+    def release(self, user: SeedUserResult) -> None:
+        """
+        Возвращает пользователя в пул, например, когда виртуальный пользователь Locust останавливается.
+        Возвращённые пользователи выдаются повторно при политиках RECYCLE и BLOCK.
+
+        :param user: Ранее выданный пользователь.
+        """
+        if self.policy in (SeedUsersExhaustionPolicy.RECYCLE, SeedUsersExhaustionPolicy.BLOCK):
+            self.released.put(user)
@@ -0,0 +1,99 @@
+from typing import Callable
+
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from seeds.dispenser import get_seed_users_partition
+from seeds.dumps import load_seeds_manifest, save_seeds_distributed_manifest
+from seeds.scenario import SeedsScenario, SeedsShardScenario
+from seeds.schema.manifest import SeedsShardManifest, SeedsDistributedManifest
+from seeds.store import SeedsStore
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_DISTRIBUTED")
+
+SEEDS_SHARD_MESSAGE = "seeds_shard"
+
+
+def setup_seeds(
+        environment: Environment,
+        seeds_scenario: SeedsScenario,
+        on_load: Callable[[SeedsStore], None] | None = None
+) -> None:
+    """
+    Подготавливает сидинговые данные для запуска Locust любого вида. Вызывается из хука events.init.
+
+    - Локальный запуск: весь план строится сразу, данные загружаются в environment.seeds.
+    - Воркер распределённого запуска: на старте теста строит только свою часть плана
+      (см. SeedsShardScenario), держит в environment.seeds только её и отправляет мастеру манифест части.
+      Количество воркеров (--expect-workers) приходит воркеру только вместе с командой на старт,
+      поэтому сидинг выполняется в test_start, до запуска виртуальных пользователей.
+    - Мастер: сам ничего не сидит, собирает манифесты частей в объединённый манифест
+      (environment.seeds_manifest) и сохраняет его в dumps.
+
+    Части разных воркеров не пересекаются, поэтому каждый воркер раздаёт своих пользователей целиком,
+    без дополнительного деления пула (SeedUsersDispenser можно создавать без environment).
+
+    :param environment: Окружение Locust.
+    :param seeds_scenario: Сценарий сидинга.
+    :param on_load: Колбэк, вызываемый после загрузки данных в environment.seeds
+                    (например, для построения SeedsQuery или SeedUsersDispenser).
+    """
+    runner = environment.runner
+
+    def load(scenario: SeedsScenario) -> SeedsStore:
+        scenario.build()
+        environment.seeds = scenario.load_store()
+        if on_load is not None:
+            on_load(environment.seeds)
+
+        return environment.seeds
+
+    if isinstance(runner, MasterRunner):
+        shards: dict[int, SeedsShardManifest] = {}
+
+        def on_test_start(**kwargs):
+            shards.clear()
+
+        def on_shard(msg, **kwargs):
+            shard = SeedsShardManifest.model_validate(msg.data)
+            shards[shard.index] = shard
+            logger.info(f"Seeds shard {shard.index + 1}/{shard.count} is ready: {shard.users} users")
+
+            if len(shards) == shard.count:
+                environment.seeds_manifest = SeedsDistributedManifest(
+                    scenario=seeds_scenario.scenario,
+                    plan_hash=seeds_scenario.dump_plan.get_hash(),
+                    shards=[shards[index] for index in sorted(shards)]
+                )
+                save_seeds_distributed_manifest(environment.seeds_manifest)
+                logger.info(
+                    f"Distributed seeds for scenario '{seeds_scenario.scenario}' are ready: "
+                    f"{environment.seeds_manifest.users} users in {shard.count} shards"
+                )
+
+        environment.events.test_start.add_listener(on_test_start)
+        runner.register_message(SEEDS_SHARD_MESSAGE, on_shard)
+        return
+
+    if isinstance(runner, WorkerRunner):
+        def on_test_start(**kwargs):
+            partition = get_seed_users_partition(environment)
+            shard = SeedsShardScenario(seeds_scenario, index=partition.index, count=partition.count)
+            store = load(shard)
+
+            manifest = load_seeds_manifest(shard.dump)
+            runner.send_message(
+                SEEDS_SHARD_MESSAGE,
+                SeedsShardManifest(
+                    **manifest.model_dump(),
+                    index=partition.index,
+                    count=partition.count,
+                    users=len(store)
+                ).model_dump(mode="json")
+            )
+
+        environment.events.test_start.add_listener(on_test_start)
+        return
+
+    load(seeds_scenario)
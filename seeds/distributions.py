@@ -0,0 +1,189 @@
+import math
+import random
+from enum import StrEnum
+from typing import Generic, Self, Sequence, TypeVar
+
+from pydantic import BaseModel, model_validator
+
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_DISTRIBUTION")
+
+T = TypeVar("T")
+
+
+class SeedsDistributionKind(StrEnum):
+    """
+    Вид распределения, по которому выбираются сидинговые пользователи.
+
+    UNIFORM — все пользователи равновероятны.
+    ZIPF — вероятность пользователя ранга k пропорциональна 1 / k^exponent.
+    PARETO — распределение Парето с параметром формы alpha > 1: доля p самых популярных пользователей
+        получает долю p^(1 - 1/alpha) обращений при любом их количестве (alpha≈1.16 — правило 80/20).
+    HOT_COLD — доля hot_fraction «горячих» пользователей получает долю hot_weight всех обращений.
+    """
+    UNIFORM = "UNIFORM"
+    ZIPF = "ZIPF"
+    PARETO = "PARETO"
+    HOT_COLD = "HOT_COLD"
+
+
+class SeedsDistribution(BaseModel):
+    """
+    Распределение обращений к сидинговым пользователям.
+
+    Реальный трафик имеет «тяжёлый хвост»: малая часть пользователей генерирует большую часть запросов.
+    Равномерный выбор делает кэши сервера либо идеальными, либо бесполезными, поэтому для реалистичной
+    нагрузки стоит использовать ZIPF, PARETO или HOT_COLD.
+
+    Attributes:
+        kind (SeedsDistributionKind): Вид распределения.
+        exponent (float): Показатель степени для ZIPF.
+        alpha (float): Параметр формы для PARETO (больше 1).
+        hot_fraction (float): Доля «горячих» пользователей для HOT_COLD.
+        hot_weight (float): Доля обращений, приходящаяся на «горячих» пользователей, для HOT_COLD.
+        seed (int | None): Зерно, по которому ранги назначаются пользователям в случайном порядке,
+            чтобы «горячими» не оказывались просто первые созданные пользователи. С одинаковым зерном
+            все воркеры Locust получают один и тот же «горячий» набор; если зерно не задано, сценарий
+            сидинга выводит его из плана (см. SeedsScenario.get_distribution).
+    """
+    kind: SeedsDistributionKind = SeedsDistributionKind.UNIFORM
+    exponent: float = 1.0
+    alpha: float = 1.16
+    hot_fraction: float = 0.2
+    hot_weight: float = 0.8
+    seed: int | None = None
+
+    @model_validator(mode="after")
+    def validate_parameters(self) -> Self:
+        if self.kind == SeedsDistributionKind.PARETO and self.alpha <= 1:
+            raise ValueError("PARETO seeds distribution requires alpha > 1")
+
+        return self
+
+    def get_weights(self, size: int) -> list[float]:
+        """
+        Возвращает веса пользователей по рангам (ранг 0 — самый популярный).
+
+        :param size: Количество пользователей.
+        :return: Список весов длины size (не обязательно нормированных).
+        """
+        match self.kind:
+            case SeedsDistributionKind.ZIPF:
+                return [1 / (rank + 1) ** self.exponent for rank in range(size)]
+            case SeedsDistributionKind.PARETO:
+                # Вес ранга — доля обращений, которая по кривой Лоренца распределения Парето приходится
+                # на его квантиль [rank / size, (rank + 1) / size]; общий множитель size^-power опущен
+                power = 1 - 1 / self.alpha
+                return [(rank + 1) ** power - rank ** power for rank in range(size)]
+            case SeedsDistributionKind.HOT_COLD:
+                hot = min(max(math.ceil(size * self.hot_fraction), 1), size)
+                cold = size - hot
+                if cold == 0:
+                    return [1.0] * size
+                return [self.hot_weight / hot] * hot + [(1 - self.hot_weight) / cold] * cold
+            case _:
+                return [1.0] * size
+
+    def describe(self) -> str:
+        """
+        :return: Человекочитаемое описание распределения и его параметров для логов и отчётов.
+        """
+        match self.kind:
+            case SeedsDistributionKind.ZIPF:
+                params = [f"exponent={self.exponent}"]
+            case SeedsDistributionKind.PARETO:
+                params = [f"alpha={self.alpha}"]
+            case SeedsDistributionKind.HOT_COLD:
+                params = [f"hot_fraction={self.hot_fraction}", f"hot_weight={self.hot_weight}"]
+            case _:
+                params = []
+
+        return f"{self.kind}({', '.join([*params, f'seed={self.seed}'])})"
+
+
+class AliasTable:
+    """
+    Таблица псевдонимов (метод Уолкера–Воуза) для выборки из дискретного распределения за O(1).
+
+    Построение занимает O(n), после чего каждая выборка — это одно случайное число, одна проверка
+    и максимум одно обращение к таблице псевдонимов, независимо от размера распределения.
+    """
+
+    def __init__(self, weights: Sequence[float], rng: random.Random | None = None):
+        """
+        :param weights: Неотрицательные веса исходов (хотя бы один положительный).
+        :param rng: Генератор случайных чисел.
+        """
+        size = len(weights)
+        total = sum(weights)
+        if size == 0 or total <= 0:
+            raise ValueError("Alias table requires at least one positive weight")
+
+        self.rng = rng or random.Random()
+        self.size = size
+        self.probability = [0.0] * size
+        self.alias = list(range(size))
+
+        scaled = [weight * size / total for weight in weights]
+        small = [index for index, value in enumerate(scaled) if value < 1.0]
+        large = [index for index, value in enumerate(scaled) if value >= 1.0]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+        # Остатки из-за погрешности вычислений с плавающей точкой считаем «полными» ячейками
+        for index in large + small:
+            self.probability[index] = 1.0
+
+    def sample(self) -> int:
+        """
+        :return: Индекс исхода, выбранный пропорционально весам.
+        """
+        value = self.rng.random() * self.size
+        index = int(value)
+        return index if value - index < self.probability[index] else self.alias[index]
+
+
+class SeedUsersSampler(Generic[T]):
+    """
+    Выбор сидинговых пользователей по заданному распределению за O(1).
+
+    Таблица псевдонимов строится один раз для всего пула, поэтому выбор остаётся дешёвым
+    даже при тысячах выборок в секунду на воркер.
+    """
+
+    def __init__(self, users: Sequence[T], distribution: SeedsDistribution):
+        """
+        :param users: Пул пользователей — SeedsResult.users или SeedsStore.
+        :param distribution: Распределение обращений.
+        """
+        self.users = users
+        self.distribution = distribution
+        # Сама выборка у каждого воркера своя, иначе воркеры обращались бы к одним и тем же пользователям
+        # в одном и том же порядке; общим должен быть только порядок рангов
+        self.rng = random.Random()
+
+        self.ranks = list(range(len(users)))
+        random.Random(distribution.seed).shuffle(self.ranks)
+
+        self.table = (
+            AliasTable(distribution.get_weights(len(users)), rng=self.rng)
+            if distribution.kind != SeedsDistributionKind.UNIFORM and len(users) > 0 else None
+        )
+
+        logger.info(f"Seed users are sampled by {distribution.describe()} over {len(users)} users")
+
+    def sample(self) -> T:
+        """
+        :return: Пользователь, выбранный согласно распределению.
+        """
+        if self.table is None:
+            return self.users[self.rng.randrange(len(self.users))]
+
+        return self.users[self.ranks[self.table.sample()]]
@@ -1,11 +1,85 @@
 import os
+import threading
+from typing import Iterator
 
-from seeds.schema.result import SeedsResult
+from seeds.schema.manifest import SeedsManifest, SeedsDistributedManifest
+from seeds.schema.result import SeedsResult, SeedUserResult
+
+
+def get_seeds_dump_path(scenario: str) -> str:
+    """
+    Возвращает путь к построчному (JSON Lines) дампу сидинга: одна строка — один SeedUserResult.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь к файлу дампа.
+    """
+    return f"./dumps/{scenario}_seeds.jsonl"
+
+
+def get_legacy_seeds_dump_path(scenario: str) -> str:
+    """
+    Возвращает путь к дампу старого формата — один JSON-документ SeedsResult на весь файл.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь к файлу дампа.
+    """
+    return f"./dumps/{scenario}_seeds.json"
+
+
+class SeedsDumpWriter:
+    """
+    Журнал сидинга: дописывает каждого созданного пользователя в конец JSONL-дампа сразу после создания.
+
+    Благодаря этому упавший посреди сидинга процесс теряет только тех пользователей, которые
+    создавались в момент падения, а следующий запуск продолжает с последней записанной строки.
+    Запись потокобезопасна, поэтому writer можно передавать в SeedsBuilder с несколькими воркерами.
+
+    Если один и тот же пользователь записан несколько раз (например, его дополнили в инкрементальном режиме),
+    при загрузке через load_seeds_result побеждает последняя запись.
+    """
+
+    def __init__(self, scenario: str, truncate: bool = False):
+        """
+        :param scenario: Название сценария нагрузки.
+        :param truncate: Если True, существующий журнал очищается (сидинг с нуля).
+        """
+        if not os.path.exists("dumps"):
+            os.mkdir("dumps")
+
+        self.file = open(get_seeds_dump_path(scenario), 'w' if truncate else 'a', encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def write(self, user: SeedUserResult) -> None:
+        """
+        Дописывает пользователя в журнал и сразу сбрасывает буфер на диск.
+
+        :param user: Созданный (или дополненный) пользователь.
+        """
+        line = user.model_dump_json() + "\n"
+
+        with self._lock:
+            self.file.write(line)
+            self.file.flush()
+
+    def close(self) -> None:
+        """
+        Закрывает файл журнала.
+        """
+        self.file.close()
+
+    def __enter__(self) -> "SeedsDumpWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
 
 
 def save_seeds_result(result: SeedsResult, scenario: str):
     """
-    Сохраняет результат сидинга (SeedsResult) в JSON-файл.
+    Сохраняет результат сидинга (SeedsResult) в JSONL-файл.
+
+    Файл сначала пишется во временный, а затем атомарно подменяет журнал,
+    поэтому в любой момент на диске лежит либо старый, либо новый дамп целиком.
 
     :param result: Результат сидинга, сгенерированный билдером.
     :param scenario: Название сценария нагрузки, для которого создаются данные.
@@ -14,16 +88,95 @@ def save_seeds_result(result: SeedsResult, scenario: str):
     if not os.path.exists("dumps"):
         os.mkdir("dumps")
 
-    with open(f"./dumps/{scenario}_seeds.json", 'w+', encoding="utf-8") as file:
-        file.write(result.model_dump_json())
+    path = get_seeds_dump_path(scenario)
+    with open(f"{path}.tmp", 'w', encoding="utf-8") as file:
+        for user in result.users:
+            file.write(user.model_dump_json() + "\n")
+
+    os.replace(f"{path}.tmp", path)
+
+
+def iter_seeds_users(scenario: str) -> Iterator[SeedUserResult]:
+    """
+    Лениво читает пользователей из JSONL-дампа по одному, не загружая весь файл в память.
+
+    Недописанная последняя строка (процесс упал во время записи) пропускается.
+    Для дампов старого формата (.json) файл читается целиком.
+
+    :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
+    :return: Итератор по SeedUserResult в порядке записи.
+    """
+    path = get_seeds_dump_path(scenario)
+    if not os.path.exists(path):
+        with open(get_legacy_seeds_dump_path(scenario), 'r', encoding="utf-8") as file:
+            yield from SeedsResult.model_validate_json(file.read()).users
+        return
+
+    with open(path, 'r', encoding="utf-8") as file:
+        for line in file:
+            if not line.endswith("\n"):
+                break
+
+            yield SeedUserResult.model_validate_json(line)
 
 
 def load_seeds_result(scenario: str) -> SeedsResult:
     """
-    Загружает результат сидинга из JSON-файла.
+    Загружает результат сидинга из файла.
+
+    Если пользователь встречается в журнале несколько раз, берётся его последняя версия,
+    а порядок пользователей определяется первой записью.
 
     :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
     :return: Объект SeedsResult, восстановленный из файла.
     """
-    with open(f'./dumps/{scenario}_seeds.json', 'r', encoding="utf-8") as file:
-        return SeedsResult.model_validate_json(file.read())
+    users: dict[str, SeedUserResult] = {}
+    for user in iter_seeds_users(scenario):
+        users[user.user_id] = user
+
+    return SeedsResult(users=list(users.values()))
+
+
+def save_seeds_manifest(manifest: SeedsManifest, scenario: str):
+    """
+    Сохраняет манифест дампа сидинга рядом с самим дампом.
+
+    :param manifest: Манифест с отпечатком плана, адресом gateway и временем создания.
+    :param scenario: Название сценария нагрузки, для которого создаются данные.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    with open(f"./dumps/{scenario}_manifest.json", 'w+', encoding="utf-8") as file:
+        file.write(manifest.model_dump_json())
+
+
+def load_seeds_manifest(scenario: str) -> SeedsManifest | None:
+    """
+    Загружает манифест дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Объект SeedsManifest или None, если дамп ещё ни разу не создавался.
+    """
+    path = f"./dumps/{scenario}_manifest.json"
+    if not os.path.exists(path):
+        return None
+
+    if not os.path.exists(get_seeds_dump_path(scenario)) and not os.path.exists(get_legacy_seeds_dump_path(scenario)):
+        return None
+
+    with open(path, 'r', encoding="utf-8") as file:
+        return SeedsManifest.model_validate_json(file.read())
+
+
+def save_seeds_distributed_manifest(manifest: SeedsDistributedManifest):
+    """
+    Сохраняет объединённый манифест распределённого сидинга (дампы частей лежат на воркерах).
+
+    :param manifest: Объединённый манифест со всеми частями.
+    """
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    with open(f"./dumps/{manifest.scenario}_distributed_manifest.json", 'w+', encoding="utf-8") as file:
+        file.write(manifest.model_dump_json())
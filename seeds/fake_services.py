@@ -0,0 +1,278 @@
+import argparse
+import json
+import subprocess
+import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import gevent
+import grpc
+from google.protobuf.message import Message
+from grpc import insecure_channel
+
+from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client
+from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client
+from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client
+from clients.grpc.gateway.users.client import build_users_gateway_grpc_client
+from clients.grpc.services.accounts.client import AccountsServiceGRPCClient
+from clients.grpc.services.cards.client import CardsServiceGRPCClient
+from clients.grpc.services.operations.client import OperationsServiceGRPCClient
+from clients.grpc.services.users.client import UsersServiceGRPCClient
+from contracts.services.accounts.account_pb2 import Account
+from contracts.services.accounts.accounts_service_pb2_grpc import (
+    AccountsServiceServicer,
+    add_AccountsServiceServicer_to_server
+)
+from contracts.services.accounts.rpc_create_account_pb2 import CreateAccountResponse
+from contracts.services.cards.card_pb2 import Card
+from contracts.services.cards.cards_service_pb2_grpc import CardsServiceServicer, add_CardsServiceServicer_to_server
+from contracts.services.cards.rpc_create_card_pb2 import CreateCardResponse
+from contracts.services.cards.rpc_get_cards_pb2 import GetCardsResponse
+from contracts.services.operations.operation_pb2 import Operation
+from contracts.services.operations.operations_service_pb2_grpc import (
+    OperationsServiceServicer,
+    add_OperationsServiceServicer_to_server
+)
+from contracts.services.operations.rpc_create_operation_pb2 import CreateOperationResponse
+from contracts.services.users.rpc_create_user_pb2 import CreateUserResponse
+from contracts.services.users.user_pb2 import User
+from contracts.services.users.users_service_pb2_grpc import UsersServiceServicer, add_UsersServiceServicer_to_server
+from seeds.builder import SeedsServicesBuilder
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedCardsPlan, SeedOperationsPlan
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_FAKE_SERVICES")
+
+
+class FakeServicesStorage:
+    """
+    Хранилище сущностей фейковых внутренних сервисов.
+
+    Как и настоящие сервисы, отклоняет повторяющиеся уникальные поля (email и телефон пользователя,
+    номер карты), поэтому на фейке видно, если генераторы данных начали повторять значения.
+    """
+
+    UNIQUE_FIELDS = {User: ("email", "phone_number"), Card: ("card_number",)}
+
+    def __init__(self):
+        self.entities: dict[type[Message], dict[str, Message]] = {User: {}, Account: {}, Card: {}, Operation: {}}
+        self.unique: dict[tuple[type[Message], str], set[str]] = {}
+
+        self._lock = threading.Lock()
+
+    def create(self, entity_type: type[Message], request: Message, context: grpc.ServicerContext) -> Message:
+        """
+        Создаёт сущность из полей Create-запроса с новым ID.
+
+        :param entity_type: Тип сущности (User, Account, Card или Operation).
+        :param request: Create-запрос; его поля совпадают с полями сущности.
+        :param context: Контекст вызова — через него возвращается ALREADY_EXISTS.
+        :return: Созданная сущность.
+        """
+        entity = entity_type(id=str(uuid.uuid4()))
+        for field in request.DESCRIPTOR.fields:
+            setattr(entity, field.name, getattr(request, field.name))
+
+        with self._lock:
+            for field in self.UNIQUE_FIELDS.get(entity_type, ()):
+                values = self.unique.setdefault((entity_type, field), set())
+                value = getattr(entity, field)
+                if value in values:
+                    context.abort(
+                        grpc.StatusCode.ALREADY_EXISTS,
+                        f"{entity_type.__name__} {field} {value} already exists"
+                    )
+                values.add(value)
+
+            self.entities[entity_type][entity.id] = entity
+
+        return entity
+
+    def get_counts(self) -> dict[str, int]:
+        """
+        :return: Количество созданных сущностей каждого типа по имени типа.
+        """
+        return {entity_type.__name__: len(entities) for entity_type, entities in self.entities.items()}
+
+
+class FakeUsersService(UsersServiceServicer):
+    def __init__(self, storage: FakeServicesStorage):
+        self.storage = storage
+
+    def CreateUser(self, request, context):
+        return CreateUserResponse(user=self.storage.create(User, request, context))
+
+
+class FakeAccountsService(AccountsServiceServicer):
+    def __init__(self, storage: FakeServicesStorage):
+        self.storage = storage
+
+    def CreateAccount(self, request, context):
+        return CreateAccountResponse(account=self.storage.create(Account, request, context))
+
+
+class FakeCardsService(CardsServiceServicer):
+    def __init__(self, storage: FakeServicesStorage):
+        self.storage = storage
+
+    def CreateCard(self, request, context):
+        return CreateCardResponse(card=self.storage.create(Card, request, context))
+
+    def GetCards(self, request, context):
+        cards = [card for card in self.storage.entities[Card].values() if card.account_id == request.account_id]
+        return GetCardsResponse(cards=cards)
+
+
+class FakeOperationsService(OperationsServiceServicer):
+    def __init__(self, storage: FakeServicesStorage):
+        self.storage = storage
+
+    def CreateOperation(self, request, context):
+        return CreateOperationResponse(operation=self.storage.create(Operation, request, context))
+
+
+def serve_fake_services(workers: int) -> None:
+    """
+    Поднимает фейковые сервисы на свободном локальном порту и обслуживает их, пока открыт stdin.
+
+    Адрес сервера пишется первой строкой в stdout, а после остановки туда же пишется JSON
+    с количеством созданных сущностей.
+
+    :param workers: Количество потоков gRPC-сервера.
+    """
+    storage = FakeServicesStorage()
+    server = grpc.server(ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fake-services"))
+
+    add_UsersServiceServicer_to_server(FakeUsersService(storage), server)
+    add_AccountsServiceServicer_to_server(FakeAccountsService(storage), server)
+    add_CardsServiceServicer_to_server(FakeCardsService(storage), server)
+    add_OperationsServiceServicer_to_server(FakeOperationsService(storage), server)
+
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    print(f"localhost:{port}", flush=True)
+
+    # Чтение stdin блокирует поток, а сервер под init_gevent опрашивается в хабе gevent,
+    # поэтому ждём в нативном потоке из пула gevent
+    gevent.get_hub().threadpool.apply(sys.stdin.read)
+    server.stop(grace=None)
+    print(json.dumps(storage.get_counts()), flush=True)
+
+
+class FakeServices:
+    """
+    Внутренние сервисы users, accounts, cards и operations в памяти, без развёрнутого стенда.
+
+    Реализуют только вызовы, которые делает SeedsServicesBuilder, и нужны, чтобы проверить сидинг
+    через внутренние сервисы (граф сущностей, параллелизм, уникальность фейковых данных):
+
+        with FakeServices(workers=arguments.server_workers) as services:
+            result = services.build_seeds_builder(workers=4).build(plan)
+        services.counts  # {"User": ..., "Account": ..., "Card": ..., "Operation": ...}
+
+    Сервер запускается в отдельном процессе (--serve): клиенты gRPC проекта работают под gevent
+    (init_gevent), и сервер в одном процессе с потоками сидинга зависает.
+    """
+
+    def __init__(self, workers: int = 16):
+        """
+        :param workers: Количество потоков gRPC-сервера.
+        """
+        self.workers = workers
+        self.address: str | None = None
+        self.counts: dict[str, int] = {}
+        self.process: subprocess.Popen | None = None
+
+    def __enter__(self) -> "FakeServices":
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "seeds.fake_services", "--serve", "--server-workers", str(self.workers)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True
+        )
+        self.address = self.process.stdout.readline().strip()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        output, _ = self.process.communicate()
+        self.counts = json.loads(output)
+
+    def build_seeds_builder(self, workers: int = 1, entity_workers: int = 1) -> SeedsServicesBuilder:
+        """
+        Создаёт сидер, клиенты внутренних сервисов которого подключены к фейковым сервисам.
+
+        :param workers: Количество пользователей, создаваемых параллельно.
+        :param entity_workers: Количество дочерних сущностей, создаваемых параллельно.
+        :return: Сидер через внутренние сервисы.
+        """
+        channel = insecure_channel(self.address)
+        return SeedsServicesBuilder(
+            users_service_client=UsersServiceGRPCClient(channel),
+            cards_service_client=CardsServiceGRPCClient(channel),
+            accounts_service_client=AccountsServiceGRPCClient(channel),
+            operations_service_client=OperationsServiceGRPCClient(channel),
+            users_gateway_client=build_users_gateway_grpc_client(),
+            cards_gateway_client=build_cards_gateway_grpc_client(),
+            accounts_gateway_client=build_accounts_gateway_grpc_client(),
+            operations_gateway_client=build_operations_gateway_grpc_client(),
+            workers=workers,
+            entity_workers=entity_workers
+        )
+
+
+if __name__ == '__main__':
+    """
+    Точка входа для проверки сидинга через внутренние сервисы на фейковых сервисах, например:
+    python -m seeds.fake_services --users 2000 --workers 8
+
+    Сидит по небольшому плану и сверяет количество созданных сущностей с результатом сидинга.
+    С --serve только поднимает фейковые сервисы (так их запускает FakeServices).
+    """
+    parser = argparse.ArgumentParser(description="Seed through the internal services against in-process fakes")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--entity-workers", type=int, default=4)
+    parser.add_argument("--server-workers", type=int, default=16)
+    parser.add_argument("--serve", action="store_true", help="only run the fake services")
+    arguments = parser.parse_args()
+
+    if arguments.serve:
+        serve_fake_services(arguments.server_workers)
+        sys.exit()
+
+    card_accounts_plan = SeedAccountsPlan(
+        count=1,
+        physical_cards=SeedCardsPlan(count=1),
+        top_up_operations=SeedOperationsPlan(count=2),
+        purchase_operations=SeedOperationsPlan(count=2)
+    )
+    seeds_plan = SeedsPlan(users=SeedUsersPlan(
+        count=arguments.users,
+        savings_accounts=SeedAccountsPlan(count=1),
+        debit_card_accounts=card_accounts_plan,
+        credit_card_accounts=card_accounts_plan
+    ))
+
+    with FakeServices(workers=arguments.server_workers) as services:
+        result = services.build_seeds_builder(
+            workers=arguments.workers,
+            entity_workers=arguments.entity_workers
+        ).build(seeds_plan)
+
+    accounts = [
+        account
+        for user in result.users
+        for account in user.savings_accounts + user.debit_card_accounts + user.credit_card_accounts
+    ]
+    expected = {
+        User: len(result.users),
+        Account: len(accounts),
+        # Первая карта карточного счёта создаётся вместе со счётом и не входит в physical_cards
+        Card: sum(len(account.physical_cards) + bool(account.card_id) for account in accounts),
+        Operation: sum(len(account.top_up_operations) + len(account.purchase_operations) for account in accounts),
+    }
+    for entity_type, count in expected.items():
+        created = services.counts[entity_type.__name__]
+        logger.info(f"{entity_type.__name__}: {created} created, {count} in result")
+        assert created == count, f"{entity_type.__name__} count mismatch"
@@ -0,0 +1,391 @@
+import threading
+from typing import Callable, Iterable
+
+import grpc
+
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient
+from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient
+from clients.grpc.gateway.client import GATEWAY_GRPC_ADDRESS, build_gateway_grpc_client
+from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient
+from seeds.builder import SeedsBuilder
+from seeds.progress import SeedsProgress
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan
+from seeds.schema.result import (
+    SeedsResult,
+    SeedUserResult,
+    SeedCardResult,
+    SeedAccountResult,
+    SeedOperationResult
+)
+from seeds.throttle import SeedsThrottle, SeedsThrottleConfig
+
+
+class SeedsInFlight:
+    """
+    Ограничитель количества одновременно выполняющихся gRPC-вызовов.
+
+    Вызов занимает слот при отправке и освобождает его в колбэке завершения,
+    поэтому отправляющий поток блокируется, только когда в полёте уже max_in_flight вызовов.
+    Если задан throttle, вызов дополнительно ждёт его адаптивного лимита и окна по RPS,
+    а задержка и исход вызова передаются ему из колбэка завершения.
+
+    Attributes:
+        max_in_flight: Максимальное количество вызовов в полёте.
+        throttle: Адаптивный ограничитель вызовов (см. SeedsThrottle). None — без ограничения.
+    """
+
+    def __init__(self, max_in_flight: int = 100, throttle: SeedsThrottle | None = None):
+        self.max_in_flight = max(max_in_flight, 1)
+        self.throttle = throttle
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+
+    def _done(self, future: grpc.Future, started_at: float | None) -> None:
+        self._slots.release()
+        if self.throttle is not None:
+            self.throttle.release(started_at, error=future.exception() is not None)
+
+    def submit(self, call: Callable[..., grpc.Future], **kwargs) -> grpc.Future:
+        """
+        Отправляет вызов, дождавшись свободного слота.
+
+        Args:
+            call: Метод клиента, полученного через GRPCClient.as_futures()
+            **kwargs: Аргументы метода
+
+        Returns:
+            grpc.Future: Future с ответом сервиса
+        """
+        self._slots.acquire()
+        started_at = self.throttle.acquire() if self.throttle is not None else None
+        try:
+            future = call(**kwargs)
+        except Exception:
+            self._slots.release()
+            if self.throttle is not None:
+                self.throttle.release(started_at, error=True)
+            raise
+
+        future.add_done_callback(lambda done: self._done(done, started_at))
+        return future
+
+    def submit_many(self, call: Callable[..., grpc.Future], count: int, **kwargs) -> list[grpc.Future]:
+        """
+        Отправляет count одинаковых вызовов.
+
+        Args:
+            call: Метод клиента, полученного через GRPCClient.as_futures()
+            count: Количество вызовов
+            **kwargs: Аргументы метода
+
+        Returns:
+            list[grpc.Future]: Future для каждого вызова в порядке отправки
+        """
+        return [self.submit(call, **kwargs) for _ in range(count)]
+
+
+class SeedsPipelineBuilder(SeedsBuilder):
+    """
+    Сидер, который отправляет вызовы gRPC gateway конвейером, без ожидания каждого ответа и без потоков.
+
+    Пользователи обрабатываются пачками по batch_size, а каждая пачка — по уровням графа сущностей:
+    1. создаются все недостающие пользователи пачки;
+    2. открываются все недостающие счета этих пользователей;
+    3. выпускаются карты и выполняются операции на всех карточных счетах.
+
+    Внутри уровня все вызовы независимы, поэтому уходят через .future() на общий канал gateway один за другим,
+    а SeedsInFlight ограничивает, сколько из них выполняется одновременно. Ответы собираются обратно
+    в SeedAccountResult/SeedUserResult в том же виде, что и у SeedsBuilder.
+
+    После каждой пачки пользователи передаются в on_user, поэтому чекпоинты дампа работают
+    с гранулярностью в одну пачку.
+
+    Attributes:
+        in_flight: Ограничитель количества вызовов в полёте.
+        batch_size: Количество пользователей, которые проходят уровни графа вместе.
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: UsersGatewayGRPCClient,
+            cards_gateway_client: CardsGatewayGRPCClient,
+            accounts_gateway_client: AccountsGatewayGRPCClient,
+            operations_gateway_client: OperationsGatewayGRPCClient,
+            max_in_flight: int = 100,
+            batch_size: int = 1000,
+            gateway: str = "",
+            throttle: SeedsThrottle | None = None
+    ):
+        super().__init__(
+            users_gateway_client=users_gateway_client,
+            cards_gateway_client=cards_gateway_client,
+            accounts_gateway_client=accounts_gateway_client,
+            operations_gateway_client=operations_gateway_client,
+            gateway=gateway,
+            throttle=throttle
+        )
+        self.users_futures_client = users_gateway_client.as_futures()
+        self.cards_futures_client = cards_gateway_client.as_futures()
+        self.accounts_futures_client = accounts_gateway_client.as_futures()
+        self.operations_futures_client = operations_gateway_client.as_futures()
+        self.in_flight = SeedsInFlight(max_in_flight=max_in_flight, throttle=throttle)
+        self.batch_size = max(batch_size, 1)
+
+    @staticmethod
+    def gather_accounts(futures: Iterable[grpc.Future], card: bool = False) -> list[SeedAccountResult]:
+        """
+        Собирает ответы на открытие счетов в SeedAccountResult.
+
+        Args:
+            futures: Future с ответами Open*Account
+            card: True для карточных счетов — тогда сохраняется ID первой карты
+
+        Returns:
+            list[SeedAccountResult]: Открытые счета в порядке отправки
+        """
+        accounts = []
+        for future in futures:
+            account = future.result().account
+            accounts.append(
+                SeedAccountResult(account_id=account.id, card_id=account.cards[0].id if card else None)
+            )
+
+        return accounts
+
+    def submit_card_account_children(
+            self,
+            plan: SeedUsersPlan,
+            field: str,
+            user_id: str,
+            account: SeedAccountResult
+    ) -> tuple[SeedAccountResult, dict[str, list[grpc.Future]]]:
+        """
+        Отправляет вызовы для недостающих карт и операций карточного счёта.
+
+        Args:
+            plan: План генерации пользователя
+            field: Поле SeedUserResult со счётом (debit_card_accounts или credit_card_accounts)
+            user_id: Идентификатор пользователя
+            account: Открытый карточный счёт
+
+        Returns:
+            tuple[SeedAccountResult, dict[str, list[grpc.Future]]]: Счёт с ID первой карты
+                и Future по названию поля SeedAccountResult
+        """
+        missing = self.get_card_account_missing(plan=getattr(plan, field), account=account)
+        if all(count <= 0 for count in missing.values()):
+            return account, {}
+
+        account_id = account.account_id
+        card_id = account.card_id or self.get_account_card_id(user_id=user_id, account_id=account_id)
+
+        cards, operations = self.cards_futures_client, self.operations_futures_client
+        return account.model_copy(update={"card_id": card_id}), {
+            "physical_cards": self.in_flight.submit_many(
+                cards.issue_physical_card, missing["physical_cards"], user_id=user_id, account_id=account_id
+            ),
+            "virtual_cards": self.in_flight.submit_many(
+                cards.issue_virtual_card, missing["virtual_cards"], user_id=user_id, account_id=account_id
+            ),
+            "top_up_operations": self.in_flight.submit_many(
+                operations.make_top_up_operation, missing["top_up_operations"], card_id=card_id, account_id=account_id
+            ),
+            "purchase_operations": self.in_flight.submit_many(
+                operations.make_purchase_operation,
+                missing["purchase_operations"],
+                card_id=card_id,
+                account_id=account_id
+            ),
+            "transfer_operations": self.in_flight.submit_many(
+                operations.make_transfer_operation,
+                missing["transfer_operations"],
+                card_id=card_id,
+                account_id=account_id
+            ),
+            "cash_withdrawal_operations": self.in_flight.submit_many(
+                operations.make_cash_withdrawal_operation,
+                missing["cash_withdrawal_operations"],
+                card_id=card_id,
+                account_id=account_id
+            ),
+        }
+
+    @staticmethod
+    def gather_card_account_children(
+            account: SeedAccountResult,
+            futures: dict[str, list[grpc.Future]]
+    ) -> SeedAccountResult:
+        """
+        Дописывает в карточный счёт карты и операции из ответов сервиса.
+
+        Args:
+            account: Карточный счёт
+            futures: Future, полученные из submit_card_account_children
+
+        Returns:
+            SeedAccountResult: Счёт с картами и операциями в объёме плана
+        """
+        if not futures:
+            return account
+
+        update = {}
+        for field, field_futures in futures.items():
+            if field.endswith("_cards"):
+                created = [SeedCardResult(card_id=future.result().card.id) for future in field_futures]
+            else:
+                created = [SeedOperationResult(operation_id=future.result().operation.id) for future in field_futures]
+            update[field] = getattr(account, field) + created
+
+        return account.model_copy(update=update)
+
+    def extend_users(self, plan: SeedUsersPlan, users: list[SeedUserResult | None]) -> list[SeedUserResult]:
+        """
+        Дополняет пачку пользователей до плана, проходя граф сущностей по уровням.
+
+        Args:
+            plan: План генерации пользователя
+            users: Уже созданные пользователи или None на месте тех, кого нужно создать
+
+        Returns:
+            list[SeedUserResult]: Пользователи в объёме плана в том же порядке
+        """
+        # Уровень 1: пользователи
+        created = [
+            self.in_flight.submit(self.users_futures_client.create_user) if user is None else None
+            for user in users
+        ]
+        users = [
+            SeedUserResult(user_id=future.result().user.id) if user is None else user
+            for user, future in zip(users, created)
+        ]
+
+        # Уровень 2: счета
+        accounts_futures = []
+        for user in users:
+            accounts = self.accounts_futures_client
+            missing = self.get_user_missing(plan=plan, user=user)
+            accounts_futures.append({
+                "savings_accounts": self.in_flight.submit_many(
+                    accounts.open_savings_account,
+                    missing["savings_accounts"],
+                    user_id=user.user_id
+                ),
+                "deposit_accounts": self.in_flight.submit_many(
+                    accounts.open_deposit_account,
+                    missing["deposit_accounts"],
+                    user_id=user.user_id
+                ),
+                "debit_card_accounts": self.in_flight.submit_many(
+                    accounts.open_debit_card_account,
+                    missing["debit_card_accounts"],
+                    user_id=user.user_id
+                ),
+                "credit_card_accounts": self.in_flight.submit_many(
+                    accounts.open_credit_card_account,
+                    missing["credit_card_accounts"],
+                    user_id=user.user_id
+                ),
+            })
+
+        users = [
+            user.model_copy(update={
+                field: getattr(user, field) + self.gather_accounts(field_futures, card=field.endswith("_card_accounts"))
+                for field, field_futures in futures.items()
+            })
+            for user, futures in zip(users, accounts_futures)
+        ]
+
+        # Уровень 3: карты и операции карточных счетов
+        children_futures = [
+            {
+                field: [
+                    self.submit_card_account_children(plan=plan, field=field, user_id=user.user_id, account=account)
+                    for account in getattr(user, field)
+                ]
+                for field in ("debit_card_accounts", "credit_card_accounts")
+            }
+            for user in users
+        ]
+
+        return [
+            user.model_copy(update={
+                field: [
+                    self.gather_card_account_children(account, account_futures)
+                    for account, account_futures in field_futures
+                ]
+                for field, field_futures in futures.items()
+            })
+            for user, futures in zip(users, children_futures)
+        ]
+
+    def extend(
+            self,
+            plan: SeedsPlan,
+            result: SeedsResult,
+            on_user: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
+        """
+        Инкрементально дополняет результат сидинга до плана (см. SeedsBuilder.extend),
+        отправляя вызовы конвейером по уровням графа сущностей.
+
+        Args:
+            plan: Полный план генерации данных
+            result: Ранее полученный результат сидинга
+            on_user: Колбэк, вызываемый для каждого созданного или изменённого пользователя
+                после обработки его пачки
+
+        Returns:
+            SeedsResult: Результат, покрывающий план
+        """
+        existing_users = result.users[:plan.users.count]
+        missing_users = max(plan.users.count - len(result.users), 0)
+        targets = existing_users + [None] * missing_users
+        progress = SeedsProgress(total=len(targets))
+
+        users = []
+        for start in range(0, len(targets), self.batch_size):
+            batch = targets[start:start + self.batch_size]
+
+            for user, extended_user in zip(batch, self.extend_users(plan=plan.users, users=batch)):
+                if on_user is not None and extended_user != user:
+                    on_user(extended_user)
+
+                progress.advance()
+                users.append(extended_user)
+
+        progress.finish()
+        if self.throttle is not None:
+            self.throttle.log_summary()
+
+        return SeedsResult(users=users + result.users[plan.users.count:])
+
+
+def build_pipeline_grpc_seeds_builder(
+        max_in_flight: int = 100,
+        batch_size: int = 1000,
+        throttle: SeedsThrottleConfig | None = None
+) -> SeedsPipelineBuilder:
+    """
+    Фабрика для создания конвейерного сидера поверх gRPC gateway.
+    Все клиенты работают через один общий канал, по которому HTTP/2 мультиплексирует вызовы.
+
+    Args:
+        max_in_flight: Максимальное количество вызовов gateway в полёте
+        batch_size: Количество пользователей, которые проходят уровни графа вместе
+        throttle: Настройки адаптивного ограничения нагрузки (None — без ограничения)
+
+    Returns:
+        SeedsPipelineBuilder: Инициализированный сидер с gRPC-клиентами на общем канале
+    """
+    channel = build_gateway_grpc_client()
+
+    return SeedsPipelineBuilder(
+        users_gateway_client=UsersGatewayGRPCClient(channel=channel),
+        cards_gateway_client=CardsGatewayGRPCClient(channel=channel),
+        accounts_gateway_client=AccountsGatewayGRPCClient(channel=channel),
+        operations_gateway_client=OperationsGatewayGRPCClient(channel=channel),
+        max_in_flight=max_in_flight,
+        batch_size=batch_size,
+        gateway=f"grpc://{GATEWAY_GRPC_ADDRESS}",
+        throttle=SeedsThrottle(throttle) if throttle else None
+    )
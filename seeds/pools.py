@@ -0,0 +1,69 @@
+from functools import reduce
+from typing import TYPE_CHECKING
+
+from seeds.schema.plan import SeedsPlan
+from tools.logger import get_logger
+
+if TYPE_CHECKING:
+    from seeds.scenario import SeedsScenario
+
+logger = get_logger("SEEDS_POOLS")
+
+
+class SeedsPoolRegistry:
+    """
+    Реестр общих пулов сидинговых данных.
+
+    Сценарий попадает в пул, объявив свойство SeedsScenario.pool. Все сценарии одного пула сидятся
+    одним общим дампом по объединённому плану (см. SeedsPlan.merge), а каждый сценарий получает
+    представление над пулом, ограниченное его собственным количеством пользователей.
+    Так несколько сценариев с одинаковой формой данных не сидят одни и те же сущности по нескольку раз.
+
+    Сценарии регистрируются автоматически при объявлении класса (SeedsScenario.__init_subclass__),
+    поэтому пакет seeds.scenarios импортирует все сценарии — иначе объединённый план пула зависел бы
+    от того, какой из сценариев запущен.
+    """
+
+    def __init__(self):
+        self.scenarios: dict[str, type["SeedsScenario"]] = {}
+
+    def register(self, scenario_class: type["SeedsScenario"]) -> None:
+        """
+        Регистрирует класс сценария сидинга. Классы без пула в объединении не участвуют.
+
+        :param scenario_class: Класс сценария сидинга.
+        """
+        # Модуль сценария, запущенный как __main__, импортируется дважды — ключ по имени класса
+        # не даёт ему попасть в пул второй раз
+        self.scenarios[scenario_class.__qualname__] = scenario_class
+
+    def get_scenarios(self, pool: str) -> list["SeedsScenario"]:
+        """
+        Возвращает сценарии, объявившие данный пул.
+
+        :param pool: Название пула.
+        :return: Экземпляры сценариев пула.
+        """
+        scenarios = (scenario_class() for scenario_class in self.scenarios.values())
+        return [scenario for scenario in scenarios if scenario.pool == pool]
+
+    def get_plan(self, pool: str) -> SeedsPlan:
+        """
+        Возвращает объединённый план пула.
+
+        :param pool: Название пула.
+        :return: План, покрывающий планы всех сценариев пула.
+        """
+        scenarios = self.get_scenarios(pool)
+        if not scenarios:
+            raise LookupError(f"Seeds pool '{pool}' has no registered scenarios")
+
+        plan = reduce(SeedsPlan.merge, (scenario.plan for scenario in scenarios))
+        logger.debug(
+            f"Seeds pool '{pool}' is shared by {', '.join(scenario.scenario for scenario in scenarios)}: "
+            f"{plan.users.count} users"
+        )
+        return plan
+
+
+seeds_pool_registry = SeedsPoolRegistry()
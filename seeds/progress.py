@@ -0,0 +1,67 @@
+import threading
+import time
+
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_PROGRESS")
+
+
+class SeedsProgress:
+    """
+    Счётчик прогресса сидинга.
+
+    Потокобезопасно считает созданных пользователей и периодически пишет в лог
+    сколько пользователей уже создано и с какой скоростью (пользователей в секунду).
+
+    Attributes:
+        total: Общее количество пользователей, которое нужно создать
+        every: Как часто (в пользователях) писать прогресс в лог
+    """
+
+    def __init__(self, total: int, every: int = 50):
+        self.total = total
+        self.every = max(every, 1)
+        self.done = 0
+        self.started_at = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Returns:
+            float: Время в секундах, прошедшее с начала сидинга
+        """
+        return time.perf_counter() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """
+        Returns:
+            float: Средняя скорость создания пользователей (пользователей в секунду)
+        """
+        elapsed = self.elapsed
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    def advance(self, count: int = 1) -> None:
+        """
+        Отмечает, что создано ещё count пользователей, и при необходимости пишет прогресс в лог.
+
+        Args:
+            count: Количество только что созданных пользователей
+        """
+        with self._lock:
+            self.done += count
+            done = self.done
+
+        if done % self.every == 0 or done == self.total:
+            logger.info(
+                f"Seeded {done}/{self.total} users in {self.elapsed:.1f}s ({self.throughput:.1f} users/s)"
+            )
+
+    def finish(self) -> None:
+        """
+        Пишет в лог итоговую статистику сидинга.
+        """
+        logger.info(
+            f"Seeding finished: {self.done} users in {self.elapsed:.1f}s ({self.throughput:.1f} users/s)"
+        )
@@ -0,0 +1,263 @@
+import bisect
+import random
+from array import array
+from enum import StrEnum
+from typing import Sequence
+
+from pydantic import BaseModel
+
+from seeds.schema.result import SeedUserResult, SeedAccountResult, SeedCardResult
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_QUERY")
+
+
+class SeedAccountType(StrEnum):
+    """
+    Тип счёта — значение совпадает с названием поля SeedUserResult.
+    """
+    DEPOSIT = "deposit_accounts"
+    SAVINGS = "savings_accounts"
+    DEBIT_CARD = "debit_card_accounts"
+    CREDIT_CARD = "credit_card_accounts"
+
+
+class SeedCardType(StrEnum):
+    """
+    Тип карты — значение совпадает с названием поля SeedAccountResult.
+    """
+    PHYSICAL = "physical_cards"
+    VIRTUAL = "virtual_cards"
+
+
+class SeedOperationType(StrEnum):
+    """
+    Тип операции — значение совпадает с названием поля SeedAccountResult.
+    """
+    TOP_UP = "top_up_operations"
+    PURCHASE = "purchase_operations"
+    TRANSFER = "transfer_operations"
+    CASH_WITHDRAWAL = "cash_withdrawal_operations"
+
+
+ACCOUNT_TYPES = tuple(SeedAccountType)
+CARD_TYPES = tuple(SeedCardType)
+OPERATION_TYPES = tuple(SeedOperationType)
+
+
+class SeedsQueryError(LookupError):
+    """
+    В сидинговых данных нет ни одной сущности, подходящей под условие запроса.
+    """
+
+
+class SeedAccountMatch(BaseModel):
+    """
+    Счёт, найденный запросом, вместе с его владельцем.
+
+    Attributes:
+        user (SeedUserResult): Владелец счёта.
+        account (SeedAccountResult): Найденный счёт.
+    """
+    user: SeedUserResult
+    account: SeedAccountResult
+
+
+class SeedCardMatch(SeedAccountMatch):
+    """
+    Карта, найденная запросом, вместе со счётом и владельцем.
+
+    Attributes:
+        card (SeedCardResult): Найденная карта.
+    """
+    card: SeedCardResult
+
+
+class SeedsQuery:
+    """
+    Запросы к сидинговым данным по условиям — «любая виртуальная карта»,
+    «дебетовый счёт, на котором не меньше 3 операций» и т.п.
+
+    Индексы строятся один раз при создании за один проход по пулу. В индексах хранятся только
+    порядковые номера сущностей в компактных массивах, а SeedUserResult достаётся из пула уже
+    для найденной сущности, поэтому запрос работает и поверх SeedsStore без загрузки всего дампа в память.
+
+    Индексы:
+    - счета по типу (и по типу операций), отсортированные по количеству операций — счета
+      с количеством операций не меньше N образуют хвост массива и находятся бинарным поиском;
+    - карты по типу карты и по типу счёта.
+
+    Выбор подходящей сущности — случайный индекс в готовом диапазоне, без перебора пула.
+    """
+
+    def __init__(self, users: Sequence[SeedUserResult], seed: int | None = None):
+        """
+        :param users: Пул пользователей — SeedsResult.users или SeedsStore.
+        :param seed: Зерно генератора случайных чисел.
+        """
+        self.users = users
+        self.rng = random.Random(seed)
+
+        # Плоские ссылки на счета: пользователь, тип счёта и позиция счёта в списке этого типа
+        self.account_users = array("I")
+        self.account_types = array("B")
+        self.account_positions = array("I")
+
+        # Плоские ссылки на карты: счёт (номер в account_*), тип карты и позиция карты в списке этого типа
+        self.card_accounts = array("I")
+        self.card_types = array("B")
+        self.card_positions = array("I")
+
+        # (тип счёта, тип операции | None) -> (количества операций по возрастанию, номера счетов)
+        self.accounts_index: dict[tuple[SeedAccountType, SeedOperationType | None], tuple[array, array]] = {}
+        # (тип карты, тип счёта | None) -> номера карт
+        self.cards_index: dict[tuple[SeedCardType, SeedAccountType | None], array] = {}
+
+        self._build()
+
+        logger.info(
+            f"Seeds query indexed {len(self.users)} users, {len(self.account_users)} accounts "
+            f"and {len(self.card_accounts)} cards"
+        )
+
+    def _build(self) -> None:
+        accounts: dict[tuple[SeedAccountType, SeedOperationType | None], list[tuple[int, int]]] = {}
+
+        for user_index, user in enumerate(self.users):
+            for account_type_index, account_type in enumerate(ACCOUNT_TYPES):
+                for account_position, account in enumerate(getattr(user, account_type)):
+                    account_index = len(self.account_users)
+                    self.account_users.append(user_index)
+                    self.account_types.append(account_type_index)
+                    self.account_positions.append(account_position)
+
+                    counts = {
+                        operation_type: len(getattr(account, operation_type))
+                        for operation_type in OPERATION_TYPES
+                    }
+                    accounts.setdefault((account_type, None), []).append((account.operations_count, account_index))
+                    for operation_type, count in counts.items():
+                        if count > 0:
+                            accounts.setdefault((account_type, operation_type), []).append((count, account_index))
+
+                    for card_type_index, card_type in enumerate(CARD_TYPES):
+                        for card_position, _ in enumerate(getattr(account, card_type)):
+                            card_index = len(self.card_accounts)
+                            self.card_accounts.append(account_index)
+                            self.card_types.append(card_type_index)
+                            self.card_positions.append(card_position)
+
+                            self.cards_index.setdefault((card_type, None), array("I")).append(card_index)
+                            self.cards_index.setdefault((card_type, account_type), array("I")).append(card_index)
+
+        for key, items in accounts.items():
+            items.sort()
+            self.accounts_index[key] = (array("I", (c for c, _ in items)), array("I", (a for _, a in items)))
+
+    def _get_accounts_range(
+            self,
+            account_type: SeedAccountType,
+            min_operations: int,
+            operation_type: SeedOperationType | None
+    ) -> tuple[array, int]:
+        counts, accounts = self.accounts_index.get((account_type, operation_type), (array("I"), array("I")))
+        return accounts, bisect.bisect_left(counts, min_operations)
+
+    def _get_account(self, account_index: int) -> SeedAccountMatch:
+        user = self.users[self.account_users[account_index]]
+        account_type = ACCOUNT_TYPES[self.account_types[account_index]]
+        return SeedAccountMatch(
+            user=user,
+            account=getattr(user, account_type)[self.account_positions[account_index]]
+        )
+
+    def count_accounts(
+            self,
+            account_type: SeedAccountType,
+            min_operations: int = 0,
+            operation_type: SeedOperationType | None = None
+    ) -> int:
+        """
+        Возвращает количество счетов, подходящих под условие.
+
+        Args:
+            account_type: Тип счёта.
+            min_operations: Минимальное количество операций на счёте.
+            operation_type: Тип операций, которые считаются в min_operations (None — все операции).
+
+        Returns:
+            int: Количество подходящих счетов.
+        """
+        accounts, start = self._get_accounts_range(account_type, min_operations, operation_type)
+        return len(accounts) - start
+
+    def get_random_account(
+            self,
+            account_type: SeedAccountType,
+            min_operations: int = 0,
+            operation_type: SeedOperationType | None = None
+    ) -> SeedAccountMatch:
+        """
+        Возвращает случайный счёт, подходящий под условие, вместе с его владельцем.
+
+        Args:
+            account_type: Тип счёта.
+            min_operations: Минимальное количество операций на счёте.
+            operation_type: Тип операций, которые считаются в min_operations (None — все операции).
+
+        Returns:
+            SeedAccountMatch: Найденный счёт и его владелец.
+
+        Raises:
+            SeedsQueryError: Если подходящих счетов нет.
+        """
+        accounts, start = self._get_accounts_range(account_type, min_operations, operation_type)
+        if start >= len(accounts):
+            raise SeedsQueryError(
+                f"No {account_type} with at least {min_operations} {operation_type or 'operations'} in seeds"
+            )
+
+        return self._get_account(accounts[self.rng.randrange(start, len(accounts))])
+
+    def count_cards(self, card_type: SeedCardType, account_type: SeedAccountType | None = None) -> int:
+        """
+        Возвращает количество карт, подходящих под условие.
+
+        Args:
+            card_type: Тип карты.
+            account_type: Тип счёта, к которому привязана карта (None — любой).
+
+        Returns:
+            int: Количество подходящих карт.
+        """
+        return len(self.cards_index.get((card_type, account_type), ()))
+
+    def get_random_card(
+            self,
+            card_type: SeedCardType,
+            account_type: SeedAccountType | None = None
+    ) -> SeedCardMatch:
+        """
+        Возвращает случайную карту, подходящую под условие, вместе со счётом и владельцем.
+
+        Args:
+            card_type: Тип карты.
+            account_type: Тип счёта, к которому привязана карта (None — любой).
+
+        Returns:
+            SeedCardMatch: Найденная карта, её счёт и владелец.
+
+        Raises:
+            SeedsQueryError: Если подходящих карт нет.
+        """
+        cards = self.cards_index.get((card_type, account_type))
+        if not cards:
+            raise SeedsQueryError(f"No {card_type} on {account_type or 'any accounts'} in seeds")
+
+        card_index = cards[self.rng.randrange(len(cards))]
+        match = self._get_account(self.card_accounts[card_index])
+        return SeedCardMatch(
+            user=match.user,
+            account=match.account,
+            card=getattr(match.account, CARD_TYPES[self.card_types[card_index]])[self.card_positions[card_index]]
+        )
@@ -1,9 +1,29 @@
+import os
 from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from functools import cached_property
 
-from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from seeds.backend import SeedsBackend, build_seeds_builder
+from seeds.builder import SeedsBuilder
+from seeds.distributions import SeedsDistribution
+from seeds.dumps import (
+    SeedsDumpWriter,
+    iter_seeds_users,
+    get_seeds_dump_path,
+    save_seeds_result,
+    load_seeds_result,
+    save_seeds_manifest,
+    load_seeds_manifest
+)
+from seeds.pools import seeds_pool_registry
+from seeds.schema.manifest import SeedsManifest
 from seeds.schema.plan import SeedsPlan
 from seeds.schema.result import SeedsResult
+from seeds.store import SeedsStore, get_seeds_store_path, save_seeds_store
+from seeds.throttle import SeedsThrottleConfig
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_SCENARIO")
 
 
 class SeedsScenario(ABC):
@@ -12,12 +32,97 @@ class SeedsScenario(ABC):
     Этот класс инкапсулирует общую логику генерации, сохранения и загрузки данных для тестов.
     """
 
-    def __init__(self):
+    def __init_subclass__(cls, register: bool = True, **kwargs):
+        """
+        Регистрирует сценарий в реестре пулов (см. SeedsPoolRegistry).
+
+        :param register: False — для служебных сценариев, которые создаются поверх другого сценария.
+        """
+        super().__init_subclass__(**kwargs)
+        if register:
+            seeds_pool_registry.register(cls)
+
+    @cached_property
+    def builder(self) -> SeedsBuilder:
+        """
+        Билдер для генерации сидинговых данных способом backend.
+        Создаётся при первом обращении, поэтому экземпляр сценария можно дёшево создать ради его плана.
+        """
+        return build_seeds_builder(
+            backend=self.backend,
+            workers=self.workers,
+            entity_workers=self.entity_workers,
+            max_in_flight=self.max_in_flight,
+            throttle=self.throttle
+        )
+
+    @property
+    def backend(self) -> SeedsBackend:
+        """
+        Способ создания сидинговых данных. По умолчанию — через gRPC gateway.
+        SeedsBackend.SERVICES создаёт те же данные напрямую через внутренние сервисы, что заметно
+        дешевле для больших датасетов, а SeedsBackend.GRPC_PIPELINE загружает gateway из одного
+        потока конвейером вызовов. Может быть переопределено в дочерних классах.
+        """
+        return SeedsBackend.GRPC
+
+    @property
+    def workers(self) -> int:
+        """
+        Количество пользователей, которые создаются параллельно при сидинге.
+        Может быть переопределено в дочерних классах.
+        """
+        return 10
+
+    @property
+    def entity_workers(self) -> int:
+        """
+        Количество дочерних сущностей (карт, операций), которые создаются параллельно
+        после открытия родительского счёта. Может быть переопределено в дочерних классах.
+        """
+        return 10
+
+    @property
+    def max_in_flight(self) -> int:
+        """
+        Максимальное количество вызовов gateway в полёте для SeedsBackend.GRPC_PIPELINE.
+        Может быть переопределено в дочерних классах.
+        """
+        return 100
+
+    @property
+    def throttle(self) -> SeedsThrottleConfig | None:
+        """
+        Настройки адаптивного ограничения нагрузки при сидинге: AIMD по задержке и ошибкам
+        и опциональный потолок RPS (см. SeedsThrottle). None — сидинг без ограничения.
+        Может быть переопределено в дочерних классах, например, для свежего окружения.
+        """
+        return None
+
+    @property
+    def ttl(self) -> timedelta | None:
         """
-        Инициализация класса SeedsScenario.
-        Создаёт экземпляр билдера для генерации сидинговых данных через gRPC.
+        Срок, в течение которого сохранённый дамп считается актуальным и переиспользуется без пересидинга.
+        None — дамп не устаревает. Может быть переопределено в дочерних классах.
         """
-        self.builder = build_grpc_seeds_builder()
+        return timedelta(hours=24)
+
+    @property
+    def incremental(self) -> bool:
+        """
+        Если True, то при изменении плана существующий дамп не пересоздаётся с нуля,
+        а дополняется недостающими сущностями (см. SeedsBuilder.extend).
+        Может быть переопределено в дочерних классах.
+        """
+        return True
+
+    @property
+    def distribution(self) -> SeedsDistribution:
+        """
+        Распределение, по которому get_random_user выбирает сидинговых пользователей при нагрузке.
+        По умолчанию равномерное. Может быть переопределено в дочерних классах.
+        """
+        return SeedsDistribution()
 
     @property
     @abstractmethod
@@ -37,23 +142,237 @@ class SeedsScenario(ABC):
         """
         ...
 
+    @property
+    def pool(self) -> str | None:
+        """
+        Название общего пула сидинговых данных. Сценарии с одним пулом сидятся одним дампом
+        по объединённому плану (см. SeedsPoolRegistry), а каждый из них видит только первые
+        plan.users.count пользователей пула. None — у сценария собственный дамп.
+        Может быть переопределено в дочерних классах.
+        """
+        return None
+
+    @property
+    def dump(self) -> str:
+        """
+        Название дампа, в котором лежат данные сценария: собственный дамп или дамп пула.
+        """
+        return self.scenario if self.pool is None else f"{self.pool}_pool"
+
+    @property
+    def dump_plan(self) -> SeedsPlan:
+        """
+        План, по которому строится дамп: план сценария или объединённый план его пула.
+        """
+        return self.plan if self.pool is None else seeds_pool_registry.get_plan(self.pool)
+
     def save(self, result: SeedsResult) -> None:
         """
         Сохраняет результат сидинга в файл.
         :param result: Объект SeedsResult, содержащий сгенерированные данные.
         """
-        save_seeds_result(result=result, scenario=self.scenario)
+        save_seeds_result(result=result, scenario=self.dump)
 
     def load(self) -> SeedsResult:
         """
         Загружает результаты сидинга из файла.
+        Для сценария пула возвращаются только первые plan.users.count пользователей пула.
         :return: Объект SeedsResult, содержащий данные, загруженные из файла.
         """
-        return load_seeds_result(scenario=self.scenario)
+        result = load_seeds_result(scenario=self.dump)
+        if self.pool is not None:
+            result.users = result.users[:self.plan.users.count]
+
+        result.use_distribution(self.get_distribution())
+        return result
+
+    def get_distribution(self) -> SeedsDistribution:
+        """
+        Возвращает распределение выбора пользователей с зерном, общим для всех воркеров Locust.
+        Если в distribution зерно не задано, оно выводится из отпечатка плана: все процессы,
+        загружающие один и тот же дамп, назначают одинаковые ранги и обращаются к одним «горячим» пользователям.
+        :return: Распределение с заданным зерном.
+        """
+        distribution = self.distribution
+        if distribution.seed is not None:
+            return distribution
+
+        return distribution.model_copy(update={"seed": int(self.plan.get_hash()[:16], 16)})
+
+    def load_store(self) -> SeedsStore:
+        """
+        Загружает результаты сидинга в компактное хранилище, отображённое в память (см. SeedsStore).
+
+        Бинарный файл собирается из дампа потоково и пересобирается, только если дамп новее него,
+        поэтому все процессы Locust на хосте открывают один и тот же файл и разделяют его страницы.
+        Для сценария пула хранилище ограничено первыми plan.users.count пользователями пула.
+        :return: Объект SeedsStore с тем же API выдачи пользователей, что и SeedsResult,
+                 и распределением выбора из distribution.
+        """
+        path = get_seeds_store_path(self.dump)
+        dump_path = get_seeds_dump_path(self.dump)
+
+        if not os.path.exists(path) or (
+                os.path.exists(dump_path) and os.path.getmtime(dump_path) > os.path.getmtime(path)
+        ):
+            save_seeds_store(iter_seeds_users(self.dump), scenario=self.dump)
+
+        store = SeedsStore(path, limit=None if self.pool is None else self.plan.users.count)
+        store.use_distribution(self.get_distribution())
+        return store
+
+    def is_actual(self, manifest: SeedsManifest | None) -> bool:
+        """
+        Проверяет, можно ли переиспользовать существующий дамп.
+
+        Дамп актуален, если он создан по тому же плану, через тот же gateway и ещё не истёк его TTL.
+        :param manifest: Манифест существующего дампа или None, если дампа нет.
+        :return: True, если пересидинг не требуется.
+        """
+        if manifest is None or not manifest.completed:
+            return False
+
+        if manifest.plan_hash != self.dump_plan.get_hash() or manifest.gateway != self.builder.gateway:
+            return False
+
+        return self.ttl is None or datetime.now() - manifest.created_at < self.ttl
+
+    def is_extendable(self, manifest: SeedsManifest | None) -> bool:
+        """
+        Проверяет, можно ли дополнить существующий дамп до нового плана вместо полного пересидинга.
+
+        Дамп можно дополнить, если он создан через тот же gateway, ещё не истёк его TTL и:
+        - либо включён инкрементальный режим (план при этом может отличаться),
+        - либо это журнал прерванного сидинга по тому же плану.
+        :param manifest: Манифест существующего дампа или None, если дампа нет.
+        :return: True, если достаточно досоздать недостающие сущности.
+        """
+        if manifest is None or manifest.gateway != self.builder.gateway:
+            return False
+
+        resumable = not manifest.completed and manifest.plan_hash == self.dump_plan.get_hash()
+        if not (self.incremental or resumable):
+            return False
+
+        return self.ttl is None or datetime.now() - manifest.created_at < self.ttl
 
     def build(self) -> None:
         """
-        Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат вместе с манифестом.
+        Если уже есть актуальный дамп (см. is_actual), сидинг пропускается.
+        Если план изменился, но дамп можно дополнить (см. is_extendable), создаются только недостающие сущности.
+
+        Каждый пользователь дописывается в журнал дампа сразу после создания, а манифест помечается
+        как незавершённый. Если процесс упадёт, следующий запуск продолжит сидинг с последнего чекпоинта.
         """
-        result = self.builder.build(self.plan)
+        manifest = load_seeds_manifest(scenario=self.dump)
+        if self.is_actual(manifest):
+            logger.info(f"Reusing actual seeds dump '{self.dump}' for scenario '{self.scenario}'")
+            return
+
+        extendable = self.is_extendable(manifest)
+        created_at = manifest.created_at if extendable else datetime.now()
+        save_seeds_manifest(
+            manifest=SeedsManifest(
+                plan_hash=self.dump_plan.get_hash(),
+                gateway=self.builder.gateway,
+                created_at=created_at,
+                completed=False
+            ),
+            scenario=self.dump
+        )
+
+        if extendable:
+            logger.info(
+                f"Extending seeds dump '{self.dump}' for scenario '{self.scenario}' from the last checkpoint"
+            )
+            result = load_seeds_result(scenario=self.dump)
+        else:
+            result = SeedsResult()
+
+        with SeedsDumpWriter(scenario=self.dump, truncate=not extendable) as writer:
+            result = self.builder.extend(self.dump_plan, result, on_user=writer.write)
+
         self.save(result)
+        save_seeds_manifest(
+            manifest=SeedsManifest(
+                plan_hash=self.dump_plan.get_hash(),
+                gateway=self.builder.gateway,
+                created_at=created_at
+            ),
+            scenario=self.dump
+        )
+
+
+class SeedsShardScenario(SeedsScenario, register=False):
+    """
+    Часть сценария сидинга, которую строит один воркер при распределённом сидинге.
+
+    Берёт у исходного сценария все настройки и билдер, но строит только свою долю пользователей
+    (см. SeedsPlan.get_shard) и хранит её в отдельном дампе, поэтому воркеры на одном хосте
+    не мешают друг другу, а повторный запуск с тем же количеством воркеров переиспользует их дампы.
+    Если исходный сценарий входит в пул, делится дамп пула: часть пула общая для всех его сценариев.
+    """
+
+    def __init__(self, scenario: SeedsScenario, index: int, count: int):
+        """
+        :param scenario: Исходный сценарий сидинга.
+        :param index: Номер части (индекс воркера).
+        :param count: Общее количество частей (воркеров).
+        """
+        self.base = scenario
+        self.index = index
+        self.count = count
+        self.builder = scenario.builder
+
+    @property
+    def backend(self) -> SeedsBackend:
+        return self.base.backend
+
+    @property
+    def workers(self) -> int:
+        return self.base.workers
+
+    @property
+    def entity_workers(self) -> int:
+        return self.base.entity_workers
+
+    @property
+    def max_in_flight(self) -> int:
+        return self.base.max_in_flight
+
+    @property
+    def throttle(self) -> SeedsThrottleConfig | None:
+        return self.base.throttle
+
+    @property
+    def ttl(self) -> timedelta | None:
+        return self.base.ttl
+
+    @property
+    def incremental(self) -> bool:
+        return self.base.incremental
+
+    @property
+    def distribution(self) -> SeedsDistribution:
+        return self.base.distribution
+
+    @property
+    def pool(self) -> str | None:
+        return self.base.pool
+
+    @property
+    def dump(self) -> str:
+        return f"{self.base.dump}_shard_{self.index}_of_{self.count}"
+
+    @property
+    def dump_plan(self) -> SeedsPlan:
+        return self.base.dump_plan.get_shard(index=self.index, count=self.count)
+
+    @property
+    def plan(self) -> SeedsPlan:
+        return self.base.plan.get_shard(index=self.index, count=self.count)
+
+    @property
+    def scenario(self) -> str:
+        return f"{self.base.scenario}_shard_{self.index}_of_{self.count}"
@@ -0,0 +1,6 @@
+# Все сценарии сидинга импортируются вместе с пакетом, чтобы реестр пулов (SeedsPoolRegistry)
+# знал каждый сценарий пула, какой бы из них ни был запущен
+from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
+from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
+from seeds.scenarios.existing_user_issue_virtual_card import ExistingUserIssueVirtualCardSeedsScenario
+from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
@@ -1,14 +1,25 @@
+from seeds.distributions import SeedsDistribution, SeedsDistributionKind
 from seeds.scenario import SeedsScenario
-from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedOperationsPlan
+from seeds.schema.plan import (
+    SeedsPlan,
+    SeedUsersPlan,
+    SeedAccountsPlan,
+    SeedOperationsPlan,
+    SeedCountDistribution,
+    SeedCountKind
+)
 
 
 class ExistingUserGetOperationsSeedsScenario(SeedsScenario):
     """
     Сценарий сидинга для получения информации об операциях.
-    Создаёт 300 пользователей, каждому из которых открывается кредитный счёт с набором операций:
-    - 5 операций покупки
-    - 1 операция пополнения
+    Создаёт 300 пользователей, каждому из которых открывается кредитный счёт с историей операций разной длины:
+    - покупки — логнормально, в среднем около 7, длинный хвост до 500
+    - пополнения — от 1 до 3
     - 1 операция снятия наличных
+
+    Разная длина истории показывает, как get_operations и get_operations_summary масштабируются
+    с её размером (фактический размер сохраняется в SeedAccountResult.operations_count).
     """
 
     @property
@@ -21,13 +32,26 @@ class ExistingUserGetOperationsSeedsScenario(SeedsScenario):
                 count=300,
                 credit_card_accounts=SeedAccountsPlan(
                     count=1,
-                    purchase_operations=SeedOperationsPlan(count=5),
-                    top_up_operations=SeedOperationsPlan(count=1),
+                    purchase_operations=SeedOperationsPlan(
+                        count=SeedCountDistribution(
+                            kind=SeedCountKind.LOG_NORMAL, mu=1.5, sigma=1.0, min_count=1, max_count=500
+                        )
+                    ),
+                    top_up_operations=SeedOperationsPlan(
+                        count=SeedCountDistribution(kind=SeedCountKind.UNIFORM, min_count=1, max_count=3)
+                    ),
                     cash_withdrawal_operations=SeedOperationsPlan(count=1)
                 )
             ),
         )
 
+    @property
+    def distribution(self) -> SeedsDistribution:
+        """
+        Операции чаще всего смотрят самые активные пользователи, поэтому обращения распределены по Ципфу.
+        """
+        return SeedsDistribution(kind=SeedsDistributionKind.ZIPF, exponent=1.0)
+
     @property
     def scenario(self) -> str:
         """
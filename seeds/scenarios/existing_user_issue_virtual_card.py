@@ -23,6 +23,13 @@ class ExistingUserIssueVirtualCardSeedsScenario(SeedsScenario):
             ),
         )
 
+    @property
+    def pool(self) -> str:
+        """
+        Общий пул с другими сценариями существующих пользователей с картами.
+        """
+        return "existing_user_cards"
+
     @property
     def scenario(self) -> str:
         """
@@ -34,7 +41,7 @@ class ExistingUserIssueVirtualCardSeedsScenario(SeedsScenario):
 if __name__ == '__main__':
     """
     Точка входа для запуска сидинга.
-    Выполняет генерацию данных и сохранение в dumps/existing_user_issue_virtual_card_seeds.json.
+    Выполняет генерацию данных и сохранение в общий дамп пула dumps/existing_user_cards_pool_seeds.jsonl.
     """
     seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
     seeds_scenario.build()
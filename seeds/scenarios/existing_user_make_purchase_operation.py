@@ -25,6 +25,13 @@ class ExistingUserMakePurchaseOperationSeedsScenario(SeedsScenario):
             ),
         )
 
+    @property
+    def pool(self) -> str:
+        """
+        Общий пул с другими сценариями существующих пользователей с картами.
+        """
+        return "existing_user_cards"
+
     @property
     def scenario(self) -> str:
         """
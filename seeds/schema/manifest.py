@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field, computed_field
+
+
+class SeedsManifest(BaseModel):
+    """
+    Манифест дампа сидинга — описывает, из чего и когда был получен дамп.
+
+    По манифесту сценарий решает, можно ли переиспользовать уже существующий дамп
+    вместо повторного сидинга.
+
+    Attributes:
+        plan_hash (str): Отпечаток плана сидинга (SeedsPlan.get_hash()).
+        gateway (str): Адрес gateway, через который создавались данные (например, "grpc://localhost:9003").
+        created_at (datetime): Время создания дампа. При дополнении дампа не меняется,
+            потому что старые данные от этого не становятся свежее.
+        completed (bool): Завершён ли сидинг. False означает, что дамп — это журнал
+            прерванного сидинга, который можно продолжить.
+    """
+    plan_hash: str
+    gateway: str
+    created_at: datetime
+    completed: bool = True
+
+
+class SeedsShardManifest(SeedsManifest):
+    """
+    Манифест части дампа, построенной одним воркером при распределённом сидинге.
+
+    Attributes:
+        index (int): Номер части (совпадает с индексом воркера Locust).
+        count (int): Общее количество частей.
+        users (int): Количество пользователей в части.
+    """
+    index: int
+    count: int
+    users: int
+
+
+class SeedsDistributedManifest(BaseModel):
+    """
+    Объединённый манифест распределённого сидинга, который собирает мастер Locust.
+
+    Attributes:
+        scenario (str): Название сценария сидинга.
+        plan_hash (str): Отпечаток полного плана сидинга.
+        shards (list[SeedsShardManifest]): Манифесты частей, построенных воркерами, по возрастанию index.
+    """
+    scenario: str
+    plan_hash: str
+    shards: list[SeedsShardManifest] = Field(default_factory=list)
+
+    @computed_field
+    @property
+    def users(self) -> int:
+        """
+        Общее количество пользователей во всех частях.
+        """
+        return sum(shard.users for shard in self.shards)
+
+    @property
+    def completed(self) -> bool:
+        """
+        True, если все части построены и каждая из них завершена.
+        """
+        return bool(self.shards) and len(self.shards) == self.shards[0].count and all(
+            shard.completed for shard in self.shards
+        )
@@ -1,32 +1,199 @@
-from pydantic import BaseModel, Field
+import hashlib
+import random
+from enum import StrEnum
+from typing import Self
 
+from pydantic import BaseModel, Field, model_validator
 
-class SeedCardsPlan(BaseModel):
+
+class SeedCountKind(StrEnum):
+    """
+    Вид распределения количества сущностей.
+
+    FIXED — у каждой сущности ровно value дочерних сущностей.
+    UNIFORM — равномерно от min_count до max_count включительно.
+    LOG_NORMAL — логнормальное с параметрами mu и sigma (типичная форма истории операций: большинство
+        счетов с короткой историей и длинный хвост счетов с длинной).
+    POWER_LAW — степенное (Парето) с показателем alpha, начиная с max(min_count, 1); max_count ограничивает хвост.
+    """
+    FIXED = "FIXED"
+    UNIFORM = "UNIFORM"
+    LOG_NORMAL = "LOG_NORMAL"
+    POWER_LAW = "POWER_LAW"
+
+
+class SeedCountDistribution(BaseModel):
+    """
+    Распределение количества дочерних сущностей (счетов пользователя, карт или операций счёта).
+
+    Количество выбирается для каждой родительской сущности отдельно, но детерминированно по её ключу
+    (см. sample), поэтому повторный или инкрементальный сидинг по тому же плану получает те же размеры.
+
+    Attributes:
+        kind (SeedCountKind): Вид распределения.
+        value (int): Количество для FIXED.
+        min_count (int): Нижняя граница количества для всех видов.
+        max_count (int | None): Верхняя граница количества (для UNIFORM обязательна).
+        mu (float): Параметр mu для LOG_NORMAL (среднее логарифма).
+        sigma (float): Параметр sigma для LOG_NORMAL (стандартное отклонение логарифма).
+        alpha (float): Показатель степени для POWER_LAW (больше 1).
+    """
+    kind: SeedCountKind = SeedCountKind.FIXED
+    value: int = 0
+    min_count: int = 0
+    max_count: int | None = None
+    mu: float = 1.0
+    sigma: float = 1.0
+    alpha: float = 2.0
+
+    @model_validator(mode="after")
+    def validate_parameters(self) -> Self:
+        if self.kind == SeedCountKind.UNIFORM and self.max_count is None:
+            raise ValueError("UNIFORM seed count distribution requires max_count")
+        if self.kind == SeedCountKind.POWER_LAW and self.alpha <= 1:
+            raise ValueError("POWER_LAW seed count distribution requires alpha > 1")
+        if self.max_count is not None and self.max_count < self.min_count:
+            raise ValueError("max_count must not be less than min_count")
+
+        return self
+
+    def sample(self, key: str) -> int:
+        """
+        Выбирает количество для одной родительской сущности.
+
+        Args:
+            key: Ключ родительской сущности (например, f"{account_id}:purchase_operations").
+                Генератор инициализируется ключом, поэтому для одного ключа результат всегда один и тот же.
+
+        Returns:
+            int: Количество дочерних сущностей в пределах [min_count, max_count].
+        """
+        generator = random.Random(key)
+
+        match self.kind:
+            case SeedCountKind.UNIFORM:
+                count = generator.randint(self.min_count, self.max_count)
+            case SeedCountKind.LOG_NORMAL:
+                count = round(generator.lognormvariate(self.mu, self.sigma))
+            case SeedCountKind.POWER_LAW:
+                count = int(max(self.min_count, 1) * (1 - generator.random()) ** (-1 / (self.alpha - 1)))
+            case _:
+                count = self.value
+
+        count = max(count, self.min_count)
+        return count if self.max_count is None else min(count, self.max_count)
+
+
+def merge_plan_counts(
+        left: int | SeedCountDistribution,
+        right: int | SeedCountDistribution
+) -> int | SeedCountDistribution:
+    """
+    Объединяет два количества плана.
+
+    Фиксированные количества объединяются максимумом. Фиксированное количество и распределение — распределением,
+    у которого нижняя граница поднята до фиксированного количества. Из двух разных распределений берётся то,
+    у которого больше верхняя граница, с наибольшей из нижних границ: точного «максимума» распределений нет,
+    поэтому такое объединение покрывает оба плана только приближённо.
+
+    Args:
+        left: Первое количество.
+        right: Второе количество.
+
+    Returns:
+        int | SeedCountDistribution: Объединённое количество.
+    """
+    if isinstance(left, int) and isinstance(right, int):
+        return max(left, right)
+    if left == right:
+        return left
+
+    if isinstance(left, int):
+        left, right = right, left
+    if isinstance(right, int):
+        min_count = max(left.min_count, right)
+        max_count = None if left.max_count is None else max(left.max_count, min_count)
+        return left.model_copy(update={"min_count": min_count, "max_count": max_count})
+
+    if right.max_count is None or (left.max_count is not None and right.max_count > left.max_count):
+        left, right = right, left
+    return left.model_copy(update={"min_count": max(left.min_count, right.min_count)})
+
+
+def merge_plan_models(left: BaseModel, right: BaseModel) -> BaseModel:
+    """
+    Объединяет две модели плана одного типа: для каждого количества берётся максимум, вложенные планы
+    объединяются рекурсивно. Результат покрывает оба плана — у каждого пользователя есть все сущности,
+    которые нужны любому из них.
+
+    Args:
+        left: Первая модель плана.
+        right: Вторая модель плана того же типа.
+
+    Returns:
+        BaseModel: Объединённая модель.
+    """
+    update = {}
+    for name in type(left).model_fields:
+        left_value, right_value = getattr(left, name), getattr(right, name)
+        if name == "count":
+            update[name] = merge_plan_counts(left_value, right_value)
+        elif isinstance(left_value, BaseModel):
+            update[name] = merge_plan_models(left_value, right_value)
+        else:
+            update[name] = max(left_value, right_value)
+
+    return left.model_copy(update=update)
+
+
+class SeedCountPlan(BaseModel):
+    """
+    Базовый план сущностей, количество которых может быть фиксированным или распределением.
+
+    Attributes:
+        count (int | SeedCountDistribution): Количество сущностей на одного родителя
+            или распределение, из которого оно выбирается для каждого родителя.
+    """
+    count: int | SeedCountDistribution = 0
+
+    def get_count(self, key: str) -> int:
+        """
+        Возвращает количество сущностей для конкретного родителя.
+
+        Args:
+            key: Ключ родителя и поля (см. SeedCountDistribution.sample).
+
+        Returns:
+            int: Количество сущностей.
+        """
+        return self.count if isinstance(self.count, int) else self.count.sample(key)
+
+
+class SeedCardsPlan(SeedCountPlan):
     """
     План генерации карт на счёте.
 
     Attributes:
-        count (int): Количество карт (виртуальных или физических), которые нужно создать.
+        count (int | SeedCountDistribution): Количество карт (виртуальных или физических), которые нужно создать.
     """
-    count: int = 0
 
 
-class SeedOperationsPlan(BaseModel):
+class SeedOperationsPlan(SeedCountPlan):
     """
     План генерации операций на счёте.
 
     Attributes:
-        count (int): Количество операций (например, пополнений или покупок), которые нужно сгенерировать.
+        count (int | SeedCountDistribution): Количество операций (например, пополнений или покупок),
+            которые нужно сгенерировать.
     """
-    count: int = 0
 
 
-class SeedAccountsPlan(BaseModel):
+class SeedAccountsPlan(SeedCountPlan):
     """
     План генерации счетов одного типа (например, депозитных или кредитных).
 
     Attributes:
-        count (int): Количество счетов данного типа.
+        count (int | SeedCountDistribution): Количество счетов данного типа у одного пользователя.
         physical_cards (SeedCardsPlan): План по созданию физических карт на счётах.
         virtual_cards (SeedCardsPlan): План по созданию виртуальных карт на счётах.
         top_up_operations (SeedOperationsPlan): План по созданию операций пополнения.
@@ -34,7 +201,6 @@ class SeedAccountsPlan(BaseModel):
         transfer_operations (SeedOperationsPlan): План по созданию операций перевода.
         cash_withdrawal_operations (SeedOperationsPlan): План по созданию операций снятия наличных.
     """
-    count: int = 0
     physical_cards: SeedCardsPlan = Field(default_factory=SeedCardsPlan)
     virtual_cards: SeedCardsPlan = Field(default_factory=SeedCardsPlan)
     top_up_operations: SeedOperationsPlan = Field(default_factory=SeedOperationsPlan)
@@ -69,3 +235,51 @@ class SeedsPlan(BaseModel):
         users (SeedUsersPlan): План по созданию пользователей и всей связанной структуры.
     """
     users: SeedUsersPlan = Field(default_factory=SeedUsersPlan)
+
+    def get_hash(self) -> str:
+        """
+        Возвращает отпечаток плана — sha256 от его JSON-представления.
+
+        Два плана с одинаковой структурой и количествами сущностей всегда дают одинаковый отпечаток,
+        поэтому его можно использовать как ключ кэша сидинговых данных.
+
+        Returns:
+            str: Шестнадцатеричная строка sha256.
+        """
+        return hashlib.sha256(self.model_dump_json().encode("utf-8")).hexdigest()
+
+    def get_shard(self, index: int, count: int) -> "SeedsPlan":
+        """
+        Возвращает часть плана для одного из count процессов распределённого сидинга.
+
+        Пользователи делятся между частями поровну (первые users.count % count частей получают
+        на одного пользователя больше), структура счетов, карт и операций каждого пользователя не меняется.
+
+        Args:
+            index: Номер части (от 0 до count - 1).
+            count: Общее количество частей.
+
+        Returns:
+            SeedsPlan: План части.
+        """
+        users, remainder = divmod(self.users.count, count)
+        return self.model_copy(
+            update={"users": self.users.model_copy(update={"count": users + int(index < remainder)})},
+            deep=True
+        )
+
+    def merge(self, other: "SeedsPlan") -> "SeedsPlan":
+        """
+        Объединяет план с другим планом для общего пула сидинговых данных (см. SeedsPoolRegistry).
+
+        Для пользователей, счетов каждого типа, карт и операций берётся наибольшее из количеств
+        (для распределений — см. merge_plan_counts), поэтому первые N пользователей объединённого плана
+        подходят любому сценарию, которому нужно N пользователей.
+
+        Args:
+            other: План другого сценария пула.
+
+        Returns:
+            SeedsPlan: Объединённый план.
+        """
+        return merge_plan_models(self, other)
@@ -1,6 +1,8 @@
 import random
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, computed_field
+
+from seeds.distributions import SeedsDistribution, SeedUsersSampler
 
 
 class SeedCardResult(BaseModel):
@@ -29,14 +31,22 @@ class SeedAccountResult(BaseModel):
 
     Attributes:
         account_id (str): Уникальный идентификатор счёта.
+        card_id (str | None): Идентификатор первой карты, выпущенной вместе с карточным счётом.
+            Для некарточных счетов и дампов старого формата — None.
         physical_cards (list[SeedCardResult]): Список физических карт, привязанных к счёту.
         virtual_cards (list[SeedCardResult]): Список виртуальных карт, привязанных к счёту.
         top_up_operations (list[SeedOperationResult]): Список операций пополнения.
         purchase_operations (list[SeedOperationResult]): Список операций покупки.
         transfer_operations (list[SeedOperationResult]): Список операций перевода.
         cash_withdrawal_operations (list[SeedOperationResult]): Список операций снятия наличных.
+        cards_count (int): Фактическое количество карт на счёте.
+        operations_count (int): Фактическое количество операций на счёте (размер истории).
+
+    Фактические размеры сохраняются в дамп вместе со счётом: при плане с распределениями
+    (см. SeedCountDistribution) по ним можно сегментировать результаты нагрузки.
     """
     account_id: str
+    card_id: str | None = None
     physical_cards: list[SeedCardResult] = Field(default_factory=list)
     virtual_cards: list[SeedCardResult] = Field(default_factory=list)
     top_up_operations: list[SeedOperationResult] = Field(default_factory=list)
@@ -44,6 +54,27 @@ class SeedAccountResult(BaseModel):
     transfer_operations: list[SeedOperationResult] = Field(default_factory=list)
     cash_withdrawal_operations: list[SeedOperationResult] = Field(default_factory=list)
 
+    @computed_field
+    @property
+    def cards_count(self) -> int:
+        """
+        Фактическое количество карт на счёте.
+        """
+        return len(self.physical_cards) + len(self.virtual_cards)
+
+    @computed_field
+    @property
+    def operations_count(self) -> int:
+        """
+        Фактическое количество операций на счёте.
+        """
+        return (
+                len(self.top_up_operations)
+                + len(self.purchase_operations)
+                + len(self.transfer_operations)
+                + len(self.cash_withdrawal_operations)
+        )
+
 
 class SeedUserResult(BaseModel):
     """
@@ -55,6 +86,7 @@ class SeedUserResult(BaseModel):
         savings_accounts (list[SeedAccountResult]): Список сберегательных счетов.
         debit_card_accounts (list[SeedAccountResult]): Список дебетовых счетов.
         credit_card_accounts (list[SeedAccountResult]): Список кредитных счетов.
+        accounts_count (int): Фактическое количество счетов пользователя.
     """
     user_id: str
     deposit_accounts: list[SeedAccountResult] = Field(default_factory=list)
@@ -62,6 +94,19 @@ class SeedUserResult(BaseModel):
     debit_card_accounts: list[SeedAccountResult] = Field(default_factory=list)
     credit_card_accounts: list[SeedAccountResult] = Field(default_factory=list)
 
+    @computed_field
+    @property
+    def accounts_count(self) -> int:
+        """
+        Фактическое количество счетов пользователя.
+        """
+        return (
+                len(self.deposit_accounts)
+                + len(self.savings_accounts)
+                + len(self.debit_card_accounts)
+                + len(self.credit_card_accounts)
+        )
+
 
 class SeedsResult(BaseModel):
     """
@@ -73,25 +118,46 @@ class SeedsResult(BaseModel):
 
     users: list[SeedUserResult] = Field(default_factory=list)
 
+    _cursor: int = PrivateAttr(default=0)
+    _sampler: SeedUsersSampler | None = PrivateAttr(default=None)
+
+    def use_distribution(self, distribution: SeedsDistribution) -> None:
+        """
+        Задаёт распределение, по которому get_random_user выбирает пользователей.
+        Таблица выборки строится один раз, после чего каждый выбор выполняется за O(1).
+
+        Args:
+            distribution: Распределение обращений к пользователям.
+        """
+        self._sampler = SeedUsersSampler(self.users, distribution)
+
     def get_next_user(self) -> SeedUserResult:
         """
-        Возвращает и удаляет первого пользователя из списка.
+        Возвращает следующего пользователя из списка.
 
         Используется в случае, когда на каждый виртуальный юзер нужен новый тестовый пользователь.
         Удобно при строго последовательной раздаче пользователей в тестовых сценариях.
+        Пользователь не удаляется из списка, а выбирается по курсору, поэтому вызов работает за O(1).
+        Для политик исчерпания и раздачи между воркерами используйте SeedUsersDispenser.
 
         Returns:
             SeedUserResult: Следующий пользователь из списка.
         """
-        return self.users.pop(0)
+        user = self.users[self._cursor]
+        self._cursor += 1
+        return user
 
     def get_random_user(self) -> SeedUserResult:
         """
         Возвращает случайного пользователя из списка без удаления.
 
         Используется в ситуациях, когда порядок не имеет значения, и пользователь выбирается случайно.
+        По умолчанию выбор равномерный, другое распределение задаётся через use_distribution.
 
         Returns:
             SeedUserResult: Случайный пользователь.
         """
+        if self._sampler is not None:
+            return self._sampler.sample()
+
         return random.choice(self.users)
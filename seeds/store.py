@@ -0,0 +1,237 @@
+import mmap
+import os
+import random
+import struct
+import uuid
+from array import array
+from typing import Iterable, Iterator
+
+from seeds.distributions import SeedsDistribution, SeedUsersSampler
+from seeds.schema.result import SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+
+MAGIC = b"SEEDS001"
+HEADER = struct.Struct("<8sQQQQ")
+
+ACCOUNT_TYPES = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
+CARD_TYPES = ("physical_cards", "virtual_cards")
+OPERATION_TYPES = ("top_up_operations", "purchase_operations", "transfer_operations", "cash_withdrawal_operations")
+
+EMPTY_ID = bytes(16)
+
+
+def get_seeds_store_path(scenario: str) -> str:
+    """
+    Возвращает путь к бинарному хранилищу сидинговых данных сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь к файлу хранилища.
+    """
+    return f"./dumps/{scenario}_seeds.bin"
+
+
+def save_seeds_store(users: Iterable[SeedUserResult], scenario: str) -> str:
+    """
+    Сохраняет сидинговые данные в компактном бинарном формате для SeedsStore.
+
+    Граф сущностей раскладывается в плоские массивы (CSR-представление):
+    у пользователя есть диапазон счетов, у счёта — диапазоны карт и операций.
+    Идентификаторы хранятся как 16 байт UUID, типы сущностей — как 1 байт.
+
+    Порядок секций после заголовка:
+    - смещения счетов пользователей, карт счетов и операций счетов (uint32)
+    - ID пользователей, ID счетов, ID первых карт счетов, ID карт, ID операций (по 16 байт)
+    - типы счетов, карт и операций (uint8)
+
+    :param users: Пользователи сидинга (например, iter_seeds_users(scenario) — без загрузки всего дампа в память).
+    :param scenario: Название сценария нагрузки.
+    :return: Путь к сохранённому файлу.
+    """
+    user_ids, account_ids, account_card_ids, card_ids, operation_ids = (
+        bytearray(), bytearray(), bytearray(), bytearray(), bytearray()
+    )
+    account_types, card_types, operation_types = array("B"), array("B"), array("B")
+    user_accounts, account_cards, account_operations = array("I", [0]), array("I", [0]), array("I", [0])
+
+    for user in users:
+        user_ids += uuid.UUID(user.user_id).bytes
+
+        for account_type, account_field in enumerate(ACCOUNT_TYPES):
+            for account in getattr(user, account_field):
+                account_ids += uuid.UUID(account.account_id).bytes
+                account_card_ids += uuid.UUID(account.card_id).bytes if account.card_id else EMPTY_ID
+                account_types.append(account_type)
+
+                for card_type, card_field in enumerate(CARD_TYPES):
+                    for card in getattr(account, card_field):
+                        card_ids += uuid.UUID(card.card_id).bytes
+                        card_types.append(card_type)
+
+                for operation_type, operation_field in enumerate(OPERATION_TYPES):
+                    for operation in getattr(account, operation_field):
+                        operation_ids += uuid.UUID(operation.operation_id).bytes
+                        operation_types.append(operation_type)
+
+                account_cards.append(len(card_types))
+                account_operations.append(len(operation_types))
+
+        user_accounts.append(len(account_types))
+
+    if not os.path.exists("dumps"):
+        os.mkdir("dumps")
+
+    path = get_seeds_store_path(scenario)
+    with open(f"{path}.{os.getpid()}.tmp", "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(user_ids) // 16, len(account_types), len(card_types), len(operation_types)))
+        for section in (
+                user_accounts, account_cards, account_operations,
+                user_ids, account_ids, account_card_ids, card_ids, operation_ids,
+                account_types, card_types, operation_types
+        ):
+            file.write(section)
+
+    # Несколько процессов Locust на одном хосте могут собирать хранилище одновременно:
+    # os.replace атомарен, поэтому читатели всегда видят целый файл
+    os.replace(f"{path}.{os.getpid()}.tmp", path)
+    return path
+
+
+class SeedsStore:
+    """
+    Компактное хранилище сидинговых данных, отображённое в память (mmap) только для чтения.
+
+    Вместо дерева pydantic-моделей данные лежат в плоских массивах (см. save_seeds_store),
+    поэтому на миллион пользователей уходят десятки мегабайт, а не гигабайты.
+    Файл отображается в память с ACCESS_READ: все процессы Locust на хосте разделяют одни и те же
+    страницы page cache, и каждый воркер не держит собственную копию данных.
+
+    SeedUserResult собирается лениво — только для запрошенного пользователя,
+    поэтому сценарии работают с хранилищем через привычный API get_random_user/get_next_user.
+    """
+
+    def __init__(self, path: str, limit: int | None = None):
+        """
+        :param path: Путь к файлу, сохранённому через save_seeds_store.
+        :param limit: Сколько первых пользователей файла видно через хранилище (None — все).
+                      Так сценарий получает представление над общим пулом без копии данных.
+        """
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, users, accounts, cards, operations = HEADER.unpack_from(self.mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"File {path} is not a seeds store")
+
+        view = memoryview(self.mmap)
+        offset = HEADER.size
+
+        def take(size: int, fmt: str | None = None) -> memoryview:
+            nonlocal offset
+            section = view[offset:offset + size]
+            offset += size
+            return section.cast(fmt) if fmt else section
+
+        self.user_accounts = take((users + 1) * 4, "I")
+        self.account_cards = take((accounts + 1) * 4, "I")
+        self.account_operations = take((accounts + 1) * 4, "I")
+        self.user_ids = take(users * 16)
+        self.account_ids = take(accounts * 16)
+        self.account_card_ids = take(accounts * 16)
+        self.card_ids = take(cards * 16)
+        self.operation_ids = take(operations * 16)
+        self.account_types = take(accounts)
+        self.card_types = take(cards)
+        self.operation_types = take(operations)
+
+        self.limit = users if limit is None else min(limit, users)
+        self.cursor = 0
+        self.sampler: SeedUsersSampler | None = None
+
+    @staticmethod
+    def _get_id(ids: memoryview, index: int) -> str:
+        return str(uuid.UUID(bytes=bytes(ids[index * 16:(index + 1) * 16])))
+
+    def _get_account(self, index: int) -> tuple[str, SeedAccountResult]:
+        card_id = bytes(self.account_card_ids[index * 16:(index + 1) * 16])
+        account = SeedAccountResult(
+            account_id=self._get_id(self.account_ids, index),
+            card_id=str(uuid.UUID(bytes=card_id)) if card_id != EMPTY_ID else None
+        )
+
+        for card in range(self.account_cards[index], self.account_cards[index + 1]):
+            getattr(account, CARD_TYPES[self.card_types[card]]).append(
+                SeedCardResult(card_id=self._get_id(self.card_ids, card))
+            )
+
+        for operation in range(self.account_operations[index], self.account_operations[index + 1]):
+            getattr(account, OPERATION_TYPES[self.operation_types[operation]]).append(
+                SeedOperationResult(operation_id=self._get_id(self.operation_ids, operation))
+            )
+
+        return ACCOUNT_TYPES[self.account_types[index]], account
+
+    def __len__(self) -> int:
+        return self.limit
+
+    def __getitem__(self, index: int) -> SeedUserResult:
+        """
+        Собирает SeedUserResult пользователя по его порядковому номеру.
+
+        :param index: Порядковый номер пользователя в хранилище.
+        :return: Пользователь со всеми счетами, картами и операциями.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("seeds store index out of range")
+
+        user = SeedUserResult(user_id=self._get_id(self.user_ids, index))
+        for account_index in range(self.user_accounts[index], self.user_accounts[index + 1]):
+            account_field, account = self._get_account(account_index)
+            getattr(user, account_field).append(account)
+
+        return user
+
+    def __iter__(self) -> Iterator[SeedUserResult]:
+        return (self[index] for index in range(len(self)))
+
+    def get_next_user(self) -> SeedUserResult:
+        """
+        Возвращает следующего пользователя по порядку (без удаления — хранилище только для чтения).
+
+        Returns:
+            SeedUserResult: Следующий пользователь.
+        """
+        user = self[self.cursor]
+        self.cursor += 1
+        return user
+
+    def use_distribution(self, distribution: SeedsDistribution) -> None:
+        """
+        Задаёт распределение, по которому get_random_user выбирает пользователей.
+
+        Args:
+            distribution: Распределение обращений к пользователям.
+        """
+        self.sampler = SeedUsersSampler(self, distribution)
+
+    def get_random_user(self) -> SeedUserResult:
+        """
+        Возвращает случайного пользователя.
+        По умолчанию выбор равномерный, другое распределение задаётся через use_distribution.
+
+        Returns:
+            SeedUserResult: Случайный пользователь.
+        """
+        if self.sampler is not None:
+            return self.sampler.sample()
+
+        return self[random.randrange(len(self))]
+
+    def close(self) -> None:
+        """
+        Освобождает отображение файла в память.
+        """
+        for name, value in list(vars(self).items()):
+            if isinstance(value, memoryview):
+                value.release()
+        self.mmap.close()
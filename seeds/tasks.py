@@ -0,0 +1,93 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar, Iterable
+
+T = TypeVar("T")
+
+
+class SeedsTasks:
+    """
+    Исполнитель «листовых» шагов сидинга — выпуска карт, операций и простых счетов.
+
+    Сидинг пользователя — это граф зависимостей: пользователь → счёт → карты/операции.
+    Как только родительская сущность создана, все её дочерние сущности независимы друг от друга,
+    поэтому они отправляются сюда и выполняются параллельно.
+
+    Листовые задачи никогда не ждут других задач, поэтому общий пул не может заблокироваться,
+    даже если его одновременно используют несколько воркеров SeedsBuilder.
+
+    Пул потоков живёт внутри блока with (SeedsBuilder.extend открывает его на время сидинга)
+    и останавливается при выходе из блока. Вне блока задачи выполняются сразу в вызывающем потоке.
+
+    Attributes:
+        workers: Размер пула. При workers=1 задачи выполняются сразу в вызывающем потоке.
+    """
+
+    def __init__(self, workers: int = 1):
+        self.workers = max(workers, 1)
+        self.executor: ThreadPoolExecutor | None = None
+
+    def __enter__(self) -> "SeedsTasks":
+        if self.workers > 1 and self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="seeds-tasks")
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def submit(self, func: Callable[..., T], *args, **kwargs) -> Future:
+        """
+        Запускает шаг сидинга.
+
+        Args:
+            func: Функция, создающая сущность
+            *args: Позиционные аргументы функции
+            **kwargs: Именованные аргументы функции
+
+        Returns:
+            Future: Future с результатом шага
+        """
+        if self.executor is not None:
+            return self.executor.submit(func, *args, **kwargs)
+
+        future = Future()
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as error:
+            future.set_exception(error)
+
+        return future
+
+    def submit_many(self, func: Callable[..., T], count: int, **kwargs) -> list[Future]:
+        """
+        Запускает count одинаковых шагов сидинга (например, 5 операций покупки).
+
+        Args:
+            func: Функция, создающая сущность
+            count: Количество сущностей
+            **kwargs: Именованные аргументы функции
+
+        Returns:
+            list[Future]: Future для каждого шага в порядке запуска
+        """
+        return [self.submit(func, **kwargs) for _ in range(count)]
+
+    @staticmethod
+    def gather(futures: Iterable[Future]) -> list:
+        """
+        Дожидается завершения шагов и возвращает их результаты в порядке запуска.
+
+        Args:
+            futures: Future, полученные из submit/submit_many
+
+        Returns:
+            list: Результаты шагов
+        """
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> None:
+        """
+        Останавливает пул потоков, если он был создан.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
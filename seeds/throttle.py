@@ -0,0 +1,227 @@
+import random
+import threading
+import time
+from typing import Callable, TypeVar
+
+import grpc
+import httpx
+from pydantic import BaseModel
+
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_THROTTLE")
+
+T = TypeVar("T")
+
+
+class SeedsThrottleConfig(BaseModel):
+    """
+    Настройки адаптивного ограничения нагрузки сидинга.
+
+    Количество одновременных вызовов регулируется по схеме AIMD (additive increase, multiplicative decrease):
+    пока вызовы успешны и укладываются в target_latency, лимит растёт на 1 за каждые «лимит» вызовов;
+    как только задержка превышает target_latency или вызов падает, лимит умножается на decrease_factor.
+
+    Attributes:
+        initial_concurrency (int): Лимит одновременных вызовов на старте.
+        min_concurrency (int): Нижняя граница лимита.
+        max_concurrency (int): Верхняя граница лимита.
+        target_latency (float): Задержка вызова в секундах, выше которой система считается перегруженной.
+        decrease_factor (float): Множитель лимита при перегрузке.
+        max_rps (float | None): Жёсткий потолок вызовов в секунду (None — без потолка).
+        retries (int): Сколько раз повторять упавший вызов, прежде чем пробросить ошибку.
+                       Повторяются только вызовы, которые безопасно повторить (см. is_seeds_call_retryable).
+        retry_backoff (float): Базовая пауза перед повтором в секундах; удваивается с каждой попыткой.
+        max_retry_backoff (float): Верхняя граница паузы перед повтором в секундах.
+    """
+    initial_concurrency: int = 4
+    min_concurrency: int = 1
+    max_concurrency: int = 100
+    target_latency: float = 0.5
+    decrease_factor: float = 0.5
+    max_rps: float | None = None
+    retries: int = 3
+    retry_backoff: float = 0.1
+    max_retry_backoff: float = 5.0
+
+
+def is_seeds_call_retryable(error: Exception, idempotent: bool) -> bool:
+    """
+    Определяет, можно ли повторить упавший вызов сидинга, не создав сущность дважды.
+
+    Чтение (idempotent) повторяется при любой ошибке. Create- и Make-вызовы не идемпотентны:
+    после таймаута, обрыва соединения или UNAVAILABLE сервис мог уже создать сущность, и повтор
+    создал бы дубликат. Поэтому они повторяются только при ошибках, которые гарантированно возникают
+    до того, как сервис начал обрабатывать вызов:
+    - gRPC RESOURCE_EXHAUSTED — отказ в приёме вызова при перегрузке (admission control);
+    - HTTP ConnectError, ConnectTimeout и PoolTimeout — запрос не был отправлен.
+
+    :param error: Ошибка вызова.
+    :param idempotent: True, если вызов только читает данные.
+    :return: True, если вызов можно повторить.
+    """
+    if idempotent:
+        return True
+
+    if isinstance(error, grpc.RpcError) and isinstance(error, grpc.Call):
+        return error.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+    return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+class SeedsRateLimiter:
+    """
+    Жёсткий потолок частоты вызовов: вызовы равномерно распределяются с интервалом 1 / max_rps.
+    """
+
+    def __init__(self, max_rps: float):
+        """
+        :param max_rps: Максимальное количество вызовов в секунду.
+        """
+        self.interval = 1 / max_rps
+        self.next_at = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Дожидается момента, когда очередной вызов не превысит max_rps.
+        """
+        with self._lock:
+            now = time.perf_counter()
+            wait = self.next_at - now
+            self.next_at = max(self.next_at, now) + self.interval
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+class SeedsThrottle:
+    """
+    Адаптивный ограничитель вызовов сидинга: AIMD-лимит одновременных вызовов и опциональный потолок RPS.
+
+    Позволяет сидингу идти настолько быстро, насколько безопасно выдерживает система:
+    на свежем окружении лимит растёт, а как только gateway начинает отвечать медленнее target_latency
+    или с ошибками, лимит быстро снижается, не давая сидингу «положить» стенд до начала теста.
+
+    Используется двумя способами:
+    - call(func, ...) — для блокирующих вызовов (SeedsBuilder);
+    - acquire()/release(...) — для неблокирующих вызовов, завершение которых известно из колбэка
+      (SeedsPipelineBuilder).
+    """
+
+    def __init__(self, config: SeedsThrottleConfig):
+        """
+        :param config: Настройки ограничения.
+        """
+        self.config = config
+        self.limit = float(min(max(config.initial_concurrency, config.min_concurrency), config.max_concurrency))
+        self.in_flight = 0
+        self.rate = SeedsRateLimiter(config.max_rps) if config.max_rps else None
+
+        self.calls = 0
+        self.errors = 0
+        self.latency = 0.0
+        self.started_at = time.perf_counter()
+        self.decreased_at = 0.0
+
+        self._condition = threading.Condition()
+
+    def acquire(self) -> float:
+        """
+        Дожидается свободного слота (и окна по RPS) для очередного вызова.
+
+        :return: Момент начала вызова по time.perf_counter() — передаётся в release.
+        """
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+
+        if self.rate is not None:
+            self.rate.acquire()
+
+        return time.perf_counter()
+
+    def release(self, started_at: float, error: bool = False) -> None:
+        """
+        Освобождает слот и подстраивает лимит по результату вызова.
+
+        :param started_at: Значение, которое вернул acquire.
+        :param error: True, если вызов завершился ошибкой.
+        """
+        now = time.perf_counter()
+        latency = now - started_at
+
+        with self._condition:
+            self.in_flight -= 1
+            self.calls += 1
+            self.errors += int(error)
+            self.latency = latency if self.calls == 1 else 0.9 * self.latency + 0.1 * latency
+
+            if error or latency > self.config.target_latency:
+                # Снижаем лимит не чаще одного раза за время одного вызова: вызовы, начатые
+                # до предыдущего снижения, ещё отражают старую нагрузку
+                if started_at >= self.decreased_at:
+                    self.limit = max(self.limit * self.config.decrease_factor, self.config.min_concurrency)
+                    self.decreased_at = now
+            else:
+                self.limit = min(self.limit + 1 / self.limit, self.config.max_concurrency)
+
+            self._condition.notify_all()
+
+    def get_retry_delay(self, attempt: int) -> float:
+        """
+        Возвращает паузу перед повтором: экспоненциальная отсрочка со случайным разбросом (full jitter),
+        чтобы потоки сидинга, упавшие одновременно, не повторяли вызовы тоже одновременно.
+
+        :param attempt: Номер упавшей попытки, начиная с 0.
+        :return: Пауза в секундах, от 0 до min(retry_backoff * 2^attempt, max_retry_backoff).
+        """
+        return random.uniform(0, min(self.config.retry_backoff * 2 ** attempt, self.config.max_retry_backoff))
+
+    def call(self, func: Callable[..., T], *args, idempotent: bool = False, **kwargs) -> T:
+        """
+        Выполняет блокирующий вызов в рамках лимита, повторяя его до config.retries раз,
+        если ошибка допускает повтор (см. is_seeds_call_retryable). Любая ошибка снижает лимит,
+        а перед повтором выдерживается пауза (см. get_retry_delay), чтобы не добивать перегруженный сервис.
+
+        :param func: Вызов клиента (например, users_gateway_client.create_user).
+        :param idempotent: True для вызовов, которые только читают данные и повторяются при любой ошибке.
+        :return: Результат вызова.
+        """
+        for attempt in range(self.config.retries + 1):
+            started_at = self.acquire()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as error:
+                self.release(started_at, error=True)
+                if attempt == self.config.retries or not is_seeds_call_retryable(error, idempotent):
+                    raise
+
+                delay = self.get_retry_delay(attempt)
+                logger.warning(
+                    f"Seeding call {getattr(func, '__name__', func)} failed, retrying in {delay:.2f}s: {error!r}"
+                )
+                time.sleep(delay)
+                continue
+
+            self.release(started_at)
+            return result
+
+    @property
+    def rps(self) -> float:
+        """
+        :return: Средняя частота вызовов с момента создания ограничителя.
+        """
+        elapsed = time.perf_counter() - self.started_at
+        return self.calls / elapsed if elapsed > 0 else 0.0
+
+    def log_summary(self) -> None:
+        """
+        Пишет в лог, на каком уровне нагрузки установился сидинг.
+        """
+        logger.info(
+            f"Seeding throttle settled at {int(self.limit)} concurrent calls, {self.rps:.1f} calls/s "
+            f"(latency {self.latency * 1000:.0f}ms, {self.errors}/{self.calls} errors"
+            f"{f', ceiling {self.config.max_rps} rps' if self.config.max_rps else ''})"
+        )
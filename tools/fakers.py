@@ -1,20 +1,109 @@
-import time
+import random
+import uuid
+from typing import Any, Callable, Sequence, TypeVar
 
 from faker import Faker
 from faker.providers.python import TEnum
 from google.protobuf.internal.enum_type_wrapper import EnumTypeWrapper
 
+T = TypeVar("T")
+
+CATEGORIES = [
+    "gas",
+    "taxi",
+    "tolls",
+    "water",
+    "beauty",
+    "mobile",
+    "travel",
+    "parking",
+    "catalog",
+    "internet",
+    "satellite",
+    "education",
+    "government",
+    "healthcare",
+    "restaurants",
+    "electricity",
+    "supermarkets",
+]
+
 
 class Fake:
     """
     Класс для генерации случайных тестовых данных с использованием библиотеки Faker.
+
+    Faker медленный (десятки микросекунд на имя или email), а в нагрузочном тесте он вызывается
+    на каждый запрос и отнимает CPU генератора нагрузки. Поэтому у класса есть режим пулов (pool_size):
+    - имена, телефоны, реквизиты карт и т.п. генерируются Faker пачкой по pool_size значений
+      при первом обращении (или заранее — см. warm_up) и дальше выдаются случайным выбором за O(1);
+    - значения enum и категории выбираются из закэшированного списка;
+    - суммы генерируются через random без Faker.
+    Значения в пуле повторяются, поэтому поля, которые сервисы проверяют на уникальность (email,
+    телефон, номер карты), в пул не попадают: email уникален за счёт UUID, а телефон и номер карты
+    всегда генерируются Faker заново — иначе сидинг и создание пользователей на больших объёмах
+    получали бы отказы из-за повторов.
     """
 
-    def __init__(self, faker: Faker):
+    def __init__(self, faker: Faker, pool_size: int | None = None):
         """
         :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param pool_size: Размер пула каждого вида значений. None — каждое значение генерируется Faker заново.
         """
         self.faker = faker
+        self.pool_size = pool_size
+        self.pools: dict[str, list[Any]] = {}
+        self.choices: dict[Any, Sequence[Any]] = {}
+
+    def pooled(self, name: str, generate: Callable[[], T]) -> T:
+        """
+        Возвращает значение из пула name, а без режима пулов — сразу генерирует новое.
+
+        :param name: Название пула.
+        :param generate: Генератор одного значения (например, lambda: self.faker.first_name()).
+                         Лямбда, а не self.faker.first_name: даже получение атрибута Faker дорогое.
+        :return: Случайное значение из пула.
+        """
+        if self.pool_size is None:
+            return generate()
+
+        pool = self.pools.get(name)
+        if pool is None:
+            pool = self.pools[name] = [generate() for _ in range(self.pool_size)]
+
+        return random.choice(pool)
+
+    def choice(self, key: Any, values: Callable[[], Sequence[T]]) -> T:
+        """
+        Выбирает случайное значение из закэшированного списка допустимых значений.
+
+        :param key: Ключ кэша (например, enum-класс).
+        :param values: Функция, возвращающая список допустимых значений.
+        :return: Случайное значение из списка.
+        """
+        choices = self.choices.get(key)
+        if choices is None:
+            choices = self.choices[key] = list(values())
+
+        return random.choice(choices)
+
+    def warm_up(self) -> None:
+        """
+        Заранее заполняет все пулы, чтобы генерация не попадала на первые запросы нагрузки.
+        Без режима пулов ничего не делает.
+        """
+        if self.pool_size is None:
+            return
+
+        for generate in (
+                self.email,
+                self.last_name,
+                self.first_name,
+                self.card_pin,
+                self.card_cvv,
+                self.card_expiry_date
+        ):
+            generate()
 
     def enum(self, value: type[TEnum]) -> TEnum:
         """
@@ -23,7 +112,10 @@ class Fake:
         :param value: Enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
-        return self.faker.enum(value)
+        if self.pool_size is None:
+            return self.faker.enum(value)
+
+        return self.choice(value, lambda: list(value))
 
     def proto_enum(self, value: EnumTypeWrapper) -> int:
         """
@@ -32,16 +124,20 @@ class Fake:
         :param value: Proto enum-класс для генерации значения.
         :return: Случайное значение из перечисления.
         """
-        return self.faker.random_element(value.values())
+        if self.pool_size is None:
+            return self.faker.random_element(value.values())
+
+        return self.choice(value, value.values)
 
     def email(self) -> str:
         """
-        Генерирует случайный email.
+        Генерирует уникальный email.
 
-        Если не указан, будет использован случайный домен.
+        Уникальность обеспечивает префикс из UUID4 (122 случайных бита): в отличие от отметки времени,
+        он не совпадает у процессов и хостов, создающих пользователей одновременно.
         :return: Случайный email.
         """
-        return f"{time.time()}.{self.faker.email()}"
+        return f"{uuid.uuid4().hex}.{self.pooled('email', lambda: self.faker.email())}"
 
     def category(self) -> str:
         """
@@ -52,25 +148,10 @@ class Fake:
 
         :return: Случайная категория (например, 'gas', 'taxi', 'supermarkets' и т.д.).
         """
-        return self.faker.random_element([
-            "gas",
-            "taxi",
-            "tolls",
-            "water",
-            "beauty",
-            "mobile",
-            "travel",
-            "parking",
-            "catalog",
-            "internet",
-            "satellite",
-            "education",
-            "government",
-            "healthcare",
-            "restaurants",
-            "electricity",
-            "supermarkets",
-        ])
+        if self.pool_size is None:
+            return self.faker.random_element(CATEGORIES)
+
+        return random.choice(CATEGORIES)
 
     def last_name(self) -> str:
         """
@@ -78,7 +159,7 @@ class Fake:
 
         :return: Случайная фамилия.
         """
-        return self.faker.last_name()
+        return self.pooled("last_name", lambda: self.faker.last_name())
 
     def first_name(self) -> str:
         """
@@ -86,7 +167,7 @@ class Fake:
 
         :return: Случайное имя.
         """
-        return self.faker.first_name()
+        return self.pooled("first_name", lambda: self.faker.first_name())
 
     def middle_name(self) -> str:
         """
@@ -94,16 +175,48 @@ class Fake:
 
         :return: Случайное отчество.
         """
-        return self.faker.first_name()
+        return self.pooled("first_name", lambda: self.faker.first_name())
 
     def phone_number(self) -> str:
         """
-        Генерирует случайный номер телефона.
+        Генерирует случайный номер телефона. Не берётся из пула: сервисы проверяют телефон на уникальность.
 
         :return: Случайный номер телефона.
         """
         return self.faker.phone_number()
 
+    def card_number(self) -> str:
+        """
+        Генерирует случайный номер банковской карты. Не берётся из пула: номер карты уникален.
+
+        :return: Номер карты из цифр (без пробелов).
+        """
+        return self.faker.credit_card_number()
+
+    def card_pin(self) -> str:
+        """
+        Генерирует случайный PIN-код карты.
+
+        :return: Четыре цифры.
+        """
+        return self.pooled("card_pin", lambda: self.faker.numerify("####"))
+
+    def card_cvv(self) -> str:
+        """
+        Генерирует случайный CVV-код карты.
+
+        :return: Три цифры.
+        """
+        return self.pooled("card_cvv", lambda: self.faker.numerify("###"))
+
+    def card_expiry_date(self) -> str:
+        """
+        Генерирует дату окончания действия карты в будущем.
+
+        :return: Дата в формате YYYY-MM-DD.
+        """
+        return self.pooled("card_expiry_date", lambda: self.faker.future_date(end_date="+5y").isoformat())
+
     def float(self, start: int = 1, end: int = 100) -> float:
         """
         Генерирует случайное число с плавающей запятой в указанном диапазоне.
@@ -112,7 +225,10 @@ class Fake:
         :param end: Конец диапазона (включительно).
         :return: Случайное число с плавающей запятой.
         """
-        return self.faker.pyfloat(min_value=start, max_value=end, right_digits=2)
+        if self.pool_size is None:
+            return self.faker.pyfloat(min_value=start, max_value=end, right_digits=2)
+
+        return round(random.uniform(start, end), 2)
 
     def amount(self) -> float:
         """
@@ -123,4 +239,4 @@ class Fake:
         return self.float(1, 1000)
 
 
-fake = Fake(faker=Faker())
+fake = Fake(faker=Faker(), pool_size=1_000)
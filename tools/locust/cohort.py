@@ -0,0 +1,58 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+# Метка когорты текущего запроса. ContextVar, а не атрибут клиента: один клиент обслуживает запросы
+# разных когорт, а у каждого гринлета (виртуального пользователя) свой контекст
+locust_cohort: ContextVar[str | None] = ContextVar("locust_cohort", default=None)
+
+SIZE_COHORT_BOUNDS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+@contextmanager
+def use_locust_cohort(cohort: str | None) -> Iterator[None]:
+    """
+    Помечает все запросы внутри блока меткой когорты.
+
+    HTTP event hook и gRPC-интерцептор добавляют метку к имени запроса в статистике Locust
+    (см. get_locust_request_name), поэтому каждая когорта получает отдельную строку статистики.
+
+    :param cohort: Метка когорты (например, get_size_cohort("ops", 120)) или None — без когорты.
+    """
+    token = locust_cohort.set(cohort)
+    try:
+        yield
+    finally:
+        locust_cohort.reset(token)
+
+
+def get_locust_request_name(name: str) -> str:
+    """
+    Возвращает имя запроса для статистики Locust с учётом текущей когорты.
+
+    :param name: Имя запроса без когорты (например, "GET /api/v1/operations").
+    :return: Имя запроса с меткой когорты в квадратных скобках или исходное имя, если когорта не задана.
+    """
+    cohort = locust_cohort.get()
+    return name if cohort is None else f"{name} [{cohort}]"
+
+
+def get_size_cohort(label: str, size: int) -> str:
+    """
+    Возвращает метку когорты по размеру данных сущности (например, количеству операций на счёте).
+
+    Размеры группируются в корзины шкалы 1-2-5 (0, 1, 2-4, 5-9, 10-19, ..., 1000+), поэтому строки
+    статистики по когортам складываются в кривую «задержка от объёма данных» с равным шагом по порядку величины.
+
+    :param label: Название измеряемого размера (например, "ops").
+    :param size: Фактический размер.
+    :return: Метка когорты, например "ops 10-19".
+    """
+    if size <= 0:
+        return f"{label} 0"
+
+    for lower, upper in zip(SIZE_COHORT_BOUNDS, SIZE_COHORT_BOUNDS[1:]):
+        if size < upper:
+            return f"{label} {lower}" if upper - lower == 1 else f"{label} {lower}-{upper - 1}"
+
+    return f"{label} {SIZE_COHORT_BOUNDS[-1]}+"
@@ -0,0 +1,106 @@
+import argparse
+import time
+
+import gevent
+from locust import events
+from locust.env import Environment
+from locust.util.load_locustfile import load_locustfile
+
+from clients.grpc.gateway.client import setup_gateway_locust_grpc_pool
+from clients.grpc.pool import GRPCChannelPoolConfig, GRPCChannelPoolStrategy
+from tools.logger import get_logger
+
+logger = get_logger("GRPC_CHANNEL_SWEEP")
+
+
+def run_grpc_channel_sweep(
+        locustfile: str,
+        channels: list[int],
+        users: int,
+        spawn_rate: float,
+        duration: float,
+        strategy: GRPCChannelPoolStrategy = GRPCChannelPoolStrategy.ROUND_ROBIN
+) -> list[dict[str, float]]:
+    """
+    Прогоняет gRPC-сценарий Locust несколько раз с разным количеством каналов в пуле
+    и измеряет пропускную способность каждого прогона.
+
+    Все прогоны выполняются в одном процессе на одном окружении: перед каждым прогоном пул каналов
+    пересоздаётся (см. setup_gateway_locust_grpc_pool), пользователи запускаются заново, а статистика
+    сбрасывается после того, как все пользователи запущены, чтобы разгон не попадал в замер.
+
+    :param locustfile: Путь к файлу сценария (например, scenarios/grpc/gateway/new_user_get_accounts/scenario.py).
+    :param channels: Количества каналов для прогонов.
+    :param users: Количество виртуальных пользователей.
+    :param spawn_rate: Скорость запуска пользователей в секунду.
+    :param duration: Длительность замера одного прогона в секундах.
+    :param strategy: Стратегия назначения каналов (size пула — количество каналов прогона).
+    :return: Результаты прогонов: channels, rps, failures, p50 и p95 (мс).
+    """
+    user_classes, _ = load_locustfile(locustfile)
+
+    environment = Environment(user_classes=list(user_classes.values()), events=events, locustfile=locustfile)
+    runner = environment.create_local_runner()
+    environment.events.init.fire(environment=environment, runner=runner, web_ui=None)
+
+    results = []
+    for size in channels:
+        setup_gateway_locust_grpc_pool(environment, GRPCChannelPoolConfig(strategy=strategy, size=size))
+
+        runner.start(users, spawn_rate=spawn_rate)
+        gevent.sleep(users / spawn_rate + 1)
+
+        environment.stats.reset_all()
+        started_at = time.perf_counter()
+        gevent.sleep(duration)
+        elapsed = time.perf_counter() - started_at
+
+        total = environment.stats.total
+        results.append({
+            "channels": size,
+            "rps": total.num_requests / elapsed,
+            "failures": total.num_failures,
+            "p50": total.get_response_time_percentile(0.5) or 0,
+            "p95": total.get_response_time_percentile(0.95) or 0,
+        })
+        logger.info(
+            f"{size} channels: {results[-1]['rps']:.1f} rps, p50 {results[-1]['p50']:.0f}ms, "
+            f"p95 {results[-1]['p95']:.0f}ms, {total.num_failures} failures"
+        )
+
+        runner.stop()
+
+    runner.quit()
+    return results
+
+
+if __name__ == '__main__':
+    """
+    Точка входа для замера пропускной способности в зависимости от количества gRPC-каналов, например:
+    python -m tools.locust.grpc_channel_sweep scenarios/grpc/gateway/new_user_get_accounts/scenario.py \\
+        --channels 1,2,4,8,16 --users 200 --duration 30
+    """
+    parser = argparse.ArgumentParser(description="Throughput versus gRPC channel pool size")
+    parser.add_argument("locustfile")
+    parser.add_argument("--channels", default="1,2,4,8,16")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--spawn-rate", type=float, default=50)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--strategy", type=GRPCChannelPoolStrategy, default=GRPCChannelPoolStrategy.ROUND_ROBIN)
+    arguments = parser.parse_args()
+
+    sweep = run_grpc_channel_sweep(
+        locustfile=arguments.locustfile,
+        channels=[int(size) for size in arguments.channels.split(",")],
+        users=arguments.users,
+        spawn_rate=arguments.spawn_rate,
+        duration=arguments.duration,
+        strategy=arguments.strategy
+    )
+
+    print(f"{'channels':>8} {'rps':>10} {'p50, ms':>8} {'p95, ms':>8} {'failures':>8}")
+    for result in sweep:
+        print(
+            f"{result['channels']:>8} {result['rps']:>10.1f} {result['p50']:>8.0f} "
+            f"{result['p95']:>8.0f} {result['failures']:>8}"
+        )
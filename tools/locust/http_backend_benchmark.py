@@ -0,0 +1,152 @@
+import argparse
+import subprocess
+import sys
+import time
+
+import gevent
+from gevent.pywsgi import WSGIServer
+from httpx import Client, Limits
+from locust import events
+from locust.env import Environment
+
+from clients.http.event_hooks.locust_event_hook import locust_request_event_hook, locust_response_event_hook
+from clients.http.transports import HTTPClientBackend, build_http_transport
+from tools.logger import get_logger
+
+logger = get_logger("HTTP_BACKEND_BENCHMARK")
+
+
+def serve_stand_in(port: int, response_size: int) -> None:
+    """
+    Запускает локальную заглушку http-gateway: на любой запрос отвечает 200 и JSON заданного размера.
+
+    :param port: Порт заглушки.
+    :param response_size: Размер тела ответа в байтах.
+    """
+    body = b'{"data":"' + b"x" * max(response_size - 11, 0) + b'"}'
+    headers = [("Content-Type", "application/json"), ("Content-Length", str(len(body)))]
+
+    def application(environ, start_response):
+        start_response("200 OK", headers)
+        return [body]
+
+    WSGIServer(("127.0.0.1", port), application, log=None).serve_forever()
+
+
+def run_http_backend_benchmark(
+        url: str,
+        backend: HTTPClientBackend,
+        concurrency: int,
+        duration: float
+) -> dict[str, float]:
+    """
+    Нагружает адрес клиентом с заданным транспортом и измеряет, сколько запросов в секунду
+    выдаёт одно ядро генератора нагрузки.
+
+    Клиент собирается так же, как для Locust (те же event hooks, метрики уходят в environment.events.request),
+    поэтому в замер входит вся стоимость запроса в сценарии, кроме самих задач. Запросы в секунду на ядро —
+    количество запросов, делённое на процессорное время процесса: так результат не зависит от того,
+    упирается ли прогон в заглушку или в сеть.
+
+    :param url: Адрес, на который отправляются GET-запросы.
+    :param backend: Транспорт httpx.Client.
+    :param concurrency: Количество одновременно работающих гринлетов (и соединений).
+    :param duration: Длительность замера в секундах.
+    :return: Результат: rps, rps_per_core, cpu (доля занятого ядра) и failures.
+    """
+    environment = Environment(events=events)
+    client = Client(
+        timeout=100,
+        transport=build_http_transport(backend, Limits(max_connections=concurrency)),
+        event_hooks={
+            "request": [locust_request_event_hook],
+            "response": [locust_response_event_hook(environment)]
+        }
+    )
+
+    requests = 0
+    failures = 0
+
+    def on_request(exception=None, **kwargs):
+        nonlocal requests, failures
+        requests += 1
+        failures += exception is not None
+
+    def worker(deadline: float):
+        while time.perf_counter() < deadline:
+            try:
+                client.get(url)
+            except Exception:
+                pass
+
+    environment.events.request.add_listener(on_request)
+
+    # Прогрев: соединения открываются до начала замера
+    gevent.joinall([gevent.spawn(worker, time.perf_counter() + 1) for _ in range(concurrency)])
+    requests = failures = 0
+
+    started_at, cpu_started_at = time.perf_counter(), time.process_time()
+    gevent.joinall([gevent.spawn(worker, started_at + duration) for _ in range(concurrency)])
+    elapsed, cpu = time.perf_counter() - started_at, time.process_time() - cpu_started_at
+
+    environment.events.request.remove_listener(on_request)
+    client.close()
+
+    return {
+        "rps": requests / elapsed,
+        "rps_per_core": requests / cpu if cpu else 0,
+        "cpu": cpu / elapsed,
+        "failures": failures,
+    }
+
+
+if __name__ == '__main__':
+    """
+    Точка входа для сравнения транспортов HTTP-клиента, например:
+    python -m tools.locust.http_backend_benchmark --concurrency 50 --duration 10
+
+    Без --url сначала запускается локальная заглушка в отдельном процессе (--serve), чтобы она
+    не делила ядро с генератором нагрузки.
+    """
+    parser = argparse.ArgumentParser(description="Requests per second per core for each HTTP client backend")
+    parser.add_argument("--url")
+    parser.add_argument("--backends", default=",".join(HTTPClientBackend))
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--response-size", type=int, default=1024)
+    parser.add_argument("--serve", action="store_true", help="only run the stand-in server")
+    arguments = parser.parse_args()
+
+    if arguments.serve:
+        serve_stand_in(arguments.port, arguments.response_size)
+        sys.exit()
+
+    server = None
+    if arguments.url is None:
+        server = subprocess.Popen([
+            sys.executable, "-m", "tools.locust.http_backend_benchmark", "--serve",
+            "--port", str(arguments.port), "--response-size", str(arguments.response_size)
+        ])
+        gevent.sleep(1)
+
+    try:
+        results = {}
+        for name in arguments.backends.split(","):
+            results[name] = run_http_backend_benchmark(
+                url=arguments.url or f"http://127.0.0.1:{arguments.port}/api/v1/users/benchmark",
+                backend=HTTPClientBackend(name),
+                concurrency=arguments.concurrency,
+                duration=arguments.duration
+            )
+            logger.info(f"{name}: {results[name]['rps']:.0f} rps, {results[name]['rps_per_core']:.0f} rps per core")
+    finally:
+        if server is not None:
+            server.terminate()
+
+    print(f"{'backend':>8} {'rps':>8} {'rps/core':>9} {'cpu':>5} {'failures':>8}")
+    for name, result in results.items():
+        print(
+            f"{name:>8} {result['rps']:>8.0f} {result['rps_per_core']:>9.0f} "
+            f"{result['cpu']:>5.0%} {result['failures']:>8}"
+        )
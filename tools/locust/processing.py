@@ -0,0 +1,145 @@
+import time
+from enum import StrEnum
+
+from locust import events
+from locust.env import Environment
+from pydantic import BaseModel
+
+from tools.locust.saturation import get_locust_saturation_monitor
+from tools.logger import get_logger
+
+logger = get_logger("CLIENT_PROCESSING")
+
+# Тип запроса, под которым этапы обработки попадают в статистику Locust
+CLIENT_PROCESSING_REQUEST_TYPE = "CLIENT_PROCESSING"
+
+
+class ClientProcessingStage(StrEnum):
+    """
+    Этап обработки запроса на стороне клиента — процессорное время генератора нагрузки, а не сервиса.
+
+    SERIALIZE — сериализация запроса: Pydantic-модели в JSON или protobuf-сообщения (SerializeToString).
+    DESERIALIZE — декодирование тела ответа в текст или разбор protobuf-ответа (FromString).
+    VALIDATE — разбор JSON и валидация ответа схемой (pydantic выполняет их за один проход); только для HTTP.
+    """
+    SERIALIZE = "serialize"
+    DESERIALIZE = "deserialize"
+    VALIDATE = "validate"
+
+
+class ClientProcessingUsage(BaseModel):
+    """
+    Обработка на стороне клиента с предыдущего снятия.
+
+    Attributes:
+        serialize_ms (float): Среднее время сериализации, мс.
+        deserialize_ms (float): Среднее время декодирования ответа, мс.
+        validate_ms (float): Среднее время разбора и валидации ответа, мс.
+        cpu_share (float): Доля одного ядра, занятая обработкой (близко к 1 — генератор упирается в процессор).
+    """
+    serialize_ms: float = 0.0
+    deserialize_ms: float = 0.0
+    validate_ms: float = 0.0
+    cpu_share: float = 0.0
+
+
+class ClientProcessing:
+    """
+    Время, которое клиенты тратят на обработку запросов до отправки и после получения ответа.
+
+    Время отклика в статистике Locust заканчивается на получении ответа, а сериализация запроса,
+    декодирование и валидация ответа выполняются на том же ядре, что и остальные пользователи.
+    Если их не видно, упёршийся в процессор генератор выглядит как медленный сервис. Этапы, как и фазы
+    HTTP-запросов, отправляются в `environment.events.request` отдельными строками статистики Locust:
+    тип — CLIENT_PROCESSING, имя — «<запрос> [<этап>]». Поэтому они видны в веб-интерфейсе, CSV
+    и HTML-отчёте и агрегируются мастером; строки этапов входят в итоговую строку Aggregated.
+
+    Запись включается, когда процесс Locust создаёт клиентов через gateway-билдеры (см. attach),
+    поэтому клиенты вне нагрузочных тестов (например, в сидинге) ничего не записывают.
+    """
+
+    def __init__(self):
+        self.environment: Environment | None = None
+
+        self._totals: dict[ClientProcessingStage, tuple[float, int]] = {}
+        self._sampled_totals: dict[ClientProcessingStage, tuple[float, int]] = {}
+        self._sampled_ns = time.perf_counter_ns()
+
+    def record(self, stage: ClientProcessingStage, name: str, started_ns: int) -> None:
+        """
+        Отправляет время этапа в `environment.events.request`.
+
+        :param stage: Этап обработки.
+        :param name: Имя запроса так же, как в основной статистике Locust.
+        :param started_ns: Момент начала этапа (time.perf_counter_ns()).
+        """
+        if self.environment is None:
+            return
+
+        duration_ms = (time.perf_counter_ns() - started_ns) / 1_000_000
+        total, count = self._totals.get(stage, (0.0, 0))
+        self._totals[stage] = (total + duration_ms, count + 1)
+
+        self.environment.events.request.fire(
+            name=f"{name} [{stage}]",
+            context={},
+            response=None,
+            exception=None,
+            request_type=CLIENT_PROCESSING_REQUEST_TYPE,
+            response_time=duration_ms,
+            response_length=0,
+        )
+
+    def reset(self) -> None:
+        self._totals.clear()
+        self._sampled_totals.clear()
+        self._sampled_ns = time.perf_counter_ns()
+
+    def get_usage(self) -> ClientProcessingUsage:
+        """
+        :return: Среднее время этапов и доля ядра, занятая обработкой, с предыдущего вызова.
+        """
+        totals = dict(self._totals)
+        sampled_ns = time.perf_counter_ns()
+        elapsed_ms = (sampled_ns - self._sampled_ns) / 1_000_000
+        self._sampled_ns = sampled_ns
+
+        usage, busy_ms = {}, 0.0
+        for stage, (total, count) in totals.items():
+            previous_total, previous_count = self._sampled_totals.get(stage, (0.0, 0))
+            if count > previous_count:
+                busy_ms += total - previous_total
+                usage[f"{stage}_ms"] = round((total - previous_total) / (count - previous_count), 3)
+
+        self._sampled_totals = totals
+        return ClientProcessingUsage(**usage, cpu_share=round(busy_ms / elapsed_ms, 3) if elapsed_ms else 0.0)
+
+    def log_summary(self, peak: ClientProcessingUsage, samples: int) -> None:
+        """
+        Пишет в лог пиковую долю ядра, занятую обработкой (статистика этапов — в таблицах Locust).
+
+        :param peak: Пиковые значения за тест.
+        :param samples: Сколько раз снималась обработка.
+        """
+        if not self._totals:
+            return
+
+        logger.info(f"Client-side processing peaked at {peak.cpu_share:.1%} of one core over {samples} samples")
+
+    def attach(self, environment: Environment) -> None:
+        """
+        Включает запись и подключает обработку к монитору насыщения процесса Locust: средние времена этапов
+        и доля ядра пишутся в лог и отдаются в /saturation, пока идёт тест.
+
+        :param environment: Окружение Locust.
+        """
+        self.environment = environment
+        get_locust_saturation_monitor(environment).register("Client processing", self)
+
+
+client_processing = ClientProcessing()
+
+
+@events.test_start.add_listener
+def reset_client_processing(**kwargs):
+    client_processing.reset()
@@ -0,0 +1,274 @@
+from typing import Callable, Protocol
+
+import gevent
+from flask import jsonify
+from locust import events
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+from pydantic import BaseModel
+
+from tools.logger import get_logger
+
+logger = get_logger("LOCUST_SATURATION")
+
+SATURATION_MESSAGE = "saturation_usage"
+
+
+class LocustSaturationSource(Protocol):
+    """
+    Источник метрик насыщения: пул клиентов или каналов, загрузку которого снимает LocustSaturationMonitor.
+    """
+
+    def get_usage(self) -> BaseModel:
+        """
+        :return: Текущая загрузка (числовые поля: очереди, соединения, время ожидания и т.д.).
+        """
+        ...
+
+    def log_summary(self, peak: BaseModel, samples: int) -> None:
+        """
+        Пишет в лог итоги теста.
+
+        :param peak: Пиковые значения каждого поля загрузки за тест.
+        :param samples: Сколько раз снималась загрузка.
+        """
+        ...
+
+
+class LocustSaturationMonitor:
+    """
+    Живые метрики насыщения генератора нагрузки: локальные очереди запросов, время ожидания соединения,
+    активные и простаивающие соединения клиентов, через которые сценарий ходит в сервис.
+
+    По ним при росте задержки видно, медленный ли сервис или запросы стоят в очереди в самом генераторе.
+    Пока идёт тест, монитор снимает загрузку всех источников с наименьшим из периодов, запрошенных
+    зарегистрированными источниками (см. get_interval), каждые report_interval секунд пишет её в лог
+    (рядом с таблицей статистики Locust) и отдаёт последний снимок в веб-интерфейсе
+    Locust по адресу /saturation. По окончании теста каждый источник пишет в лог пиковые значения.
+    На воркере распределённого запуска каждый снимок ещё и отправляется мастеру (см. on_sample
+    и LocustSaturationAggregator).
+    """
+
+    def __init__(
+            self,
+            interval: float = 1.0,
+            report_interval: float = 10.0,
+            on_sample: Callable[[dict[str, dict]], None] | None = None
+    ):
+        """
+        :param interval: Период снятия загрузки в секундах для источников, не запросивших свой.
+        :param report_interval: Период записи загрузки в лог в секундах.
+        :param on_sample: Функция, получающая отчёт (см. get_report) после каждого снятия.
+        """
+        self.interval = interval
+        self.report_interval = report_interval
+        self.on_sample = on_sample
+        self.sources: dict[str, LocustSaturationSource] = {}
+        self.intervals: dict[str, float] = {}
+
+        self.samples = 0
+        self.usage: dict[str, BaseModel] = {}
+        self.peak: dict[str, BaseModel] = {}
+        self.greenlet: gevent.Greenlet | None = None
+
+    def register(self, name: str, source: LocustSaturationSource, interval: float | None = None) -> None:
+        """
+        Добавляет источник. Источник с тем же именем (например, пересозданный пул) заменяется.
+
+        :param name: Имя источника в логе и в /saturation.
+        :param source: Источник метрик.
+        :param interval: Нужный источнику период снятия в секундах (None — период монитора).
+        """
+        self.sources[name] = source
+        self.intervals[name] = self.interval if interval is None else interval
+        self.usage.pop(name, None)
+        self.peak.pop(name, None)
+
+    def get_interval(self) -> float:
+        """
+        :return: Текущий период снятия: наименьший из периодов зарегистрированных источников.
+        """
+        return min(self.intervals.values(), default=self.interval)
+
+    def sample(self) -> None:
+        """
+        Снимает загрузку всех источников и обновляет пиковые значения.
+        """
+        self.samples += 1
+        for name, source in list(self.sources.items()):
+            usage = source.get_usage()
+            peak = self.peak.get(name, usage)
+            self.usage[name] = usage
+            self.peak[name] = usage.model_copy(update={
+                field: max(getattr(peak, field), getattr(usage, field))
+                for field in type(usage).model_fields
+            })
+
+    def log_usage(self) -> None:
+        """
+        Пишет в лог последний снимок загрузки каждого источника.
+        """
+        for name, usage in self.usage.items():
+            logger.info(f"{name}: {usage}")
+
+    def log_summary(self) -> None:
+        """
+        Передаёт источникам пиковые значения за тест для записи в лог.
+        """
+        for name, source in self.sources.items():
+            if name in self.peak:
+                source.log_summary(self.peak[name], self.samples)
+
+    def get_report(self) -> dict[str, dict]:
+        """
+        :return: Последний снимок и пиковые значения каждого источника (для /saturation).
+        """
+        return {
+            name: {"current": usage.model_dump(), "peak": self.peak[name].model_dump()}
+            for name, usage in self.usage.items()
+        }
+
+    def _sample_forever(self) -> None:
+        while True:
+            interval = self.get_interval()
+            self.sample()
+            if self.on_sample is not None:
+                self.on_sample(self.get_report())
+            if self.samples % max(round(self.report_interval / interval), 1) == 0:
+                self.log_usage()
+            gevent.sleep(interval)
+
+    def start(self) -> None:
+        """
+        Начинает снимать загрузку, сбросив снимки и пиковые значения.
+        """
+        self.stop()
+        self.samples = 0
+        self.usage.clear()
+        self.peak.clear()
+        self.greenlet = gevent.spawn(self._sample_forever)
+
+    def stop(self) -> None:
+        """
+        Прекращает снимать загрузку.
+        """
+        if self.greenlet is not None:
+            self.greenlet.kill()
+            self.greenlet = None
+
+
+class LocustSaturationAggregator:
+    """
+    Метрики насыщения всех воркеров распределённого запуска на мастере.
+
+    Пулы клиентов есть только у воркеров, поэтому монитор воркера отправляет каждый снимок мастеру
+    сообщением SATURATION_MESSAGE, а мастер хранит последний снимок каждого воркера. Сводка по воркерам
+    складывает счётчики (целые поля: соединения, очереди, вызовы в полёте) и берёт худшее значение
+    средних величин (дробные поля: время ожидания, доля ядра).
+    """
+
+    def __init__(self):
+        self.workers: dict[str, dict[str, dict]] = {}
+
+    def on_message(self, msg, **kwargs) -> None:
+        """
+        Обработчик сообщения SATURATION_MESSAGE: сохраняет отчёт воркера.
+        """
+        self.workers[msg.node_id] = msg.data
+
+    def reset(self) -> None:
+        self.workers.clear()
+
+    def get_total(self, kind: str) -> dict[str, dict]:
+        """
+        :param kind: current — последние снимки, peak — пиковые значения.
+        :return: Сводка каждого источника по всем воркерам.
+        """
+        total: dict[str, dict] = {}
+        for report in self.workers.values():
+            for name, usage in report.items():
+                source = total.setdefault(name, {})
+                for field, value in usage[kind].items():
+                    if isinstance(value, int):
+                        source[field] = source.get(field, 0) + value
+                    else:
+                        source[field] = max(source.get(field, value), value)
+
+        return total
+
+    def get_report(self) -> dict[str, dict]:
+        """
+        :return: Сводка по воркерам и отчёт каждого воркера (для /saturation на мастере).
+        """
+        peak = self.get_total("peak")
+        return {
+            "total": {
+                name: {"current": current, "peak": peak[name]}
+                for name, current in self.get_total("current").items()
+            },
+            "workers": self.workers
+        }
+
+    def log_summary(self) -> None:
+        """
+        Пишет в лог сводку пиковых значений по всем воркерам.
+        """
+        for name, peak in self.get_total("peak").items():
+            logger.info(f"{name} peak usage across {len(self.workers)} workers: {peak}")
+
+
+def get_locust_saturation_monitor(environment: Environment) -> LocustSaturationMonitor:
+    """
+    Возвращает монитор насыщения процесса Locust (environment.saturation_monitor), создавая его при первом обращении.
+
+    Пулы клиентов обычно создаются, когда первые виртуальные пользователи уже запускаются
+    (test_start к этому моменту уже сработал), поэтому монитор начинает работу сразу,
+    а на следующих запусках теста — по test_start. По test_stop монитор останавливается и пишет итоги.
+    На воркере монитор отправляет снимки мастеру (см. LocustSaturationAggregator).
+
+    :param environment: Объект окружения Locust.
+    :return: Монитор насыщения.
+    """
+    monitor: LocustSaturationMonitor | None = getattr(environment, "saturation_monitor", None)
+    if monitor is None:
+        runner = environment.runner
+
+        def on_sample(report: dict[str, dict]):
+            runner.send_message(SATURATION_MESSAGE, report)
+
+        monitor = LocustSaturationMonitor(on_sample=on_sample if isinstance(runner, WorkerRunner) else None)
+        environment.saturation_monitor = monitor
+
+        def on_test_stop(**kwargs):
+            monitor.stop()
+            monitor.log_summary()
+
+        monitor.start()
+        environment.events.test_start.add_listener(lambda **kwargs: monitor.start())
+        environment.events.test_stop.add_listener(on_test_stop)
+
+    return monitor
+
+
+@events.init.add_listener
+def setup_saturation(environment: Environment, web_ui=None, **kwargs):
+    runner = environment.runner
+    if isinstance(runner, MasterRunner):
+        aggregator = LocustSaturationAggregator()
+        environment.saturation_aggregator = aggregator
+        runner.register_message(SATURATION_MESSAGE, aggregator.on_message)
+        environment.events.test_start.add_listener(lambda **kwargs: aggregator.reset())
+        environment.events.test_stop.add_listener(lambda **kwargs: aggregator.log_summary())
+
+    if web_ui is None:
+        return
+
+    @web_ui.app.route("/saturation")
+    @web_ui.auth_required_if_enabled
+    def saturation():
+        aggregator: LocustSaturationAggregator | None = getattr(environment, "saturation_aggregator", None)
+        if aggregator is not None:
+            return jsonify(aggregator.get_report())
+
+        monitor: LocustSaturationMonitor | None = getattr(environment, "saturation_monitor", None)
+        return jsonify(monitor.get_report() if monitor is not None else {})
@@ -1,4 +1,15 @@
-from locust import User, between
+from locust import User, between, events
+
+from tools.fakers import fake
+
+
+@events.init.add_listener
+def warm_up_fake(**kwargs):
+    """
+    Хук инициализации теста: заполнение пулов фейковых данных (см. Fake.warm_up) до старта нагрузки,
+    чтобы первые запросы виртуальных пользователей не тратили CPU на Faker.
+    """
+    fake.warm_up()
 
 
 class LocustBaseUser(User):
@@ -0,0 +1,23 @@
+import logging
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Возвращает логгер с единым форматом вывода для вспомогательных инструментов (сидинг, метрики и т.д.).
+
+    Хендлер добавляется только один раз, поэтому функцию можно безопасно вызывать многократно.
+
+    :param name: Имя логгера (обычно название модуля или подсистемы).
+    :return: Настроенный экземпляр logging.Logger.
+    """
+    logger = logging.getLogger(name)
+
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s | %(name)s | %(levelname)s | %(message)s"))
+
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+    return logger